@@ -0,0 +1,144 @@
+"""Measure the cost of applying the stylesheets to the widget gallery and emit the results as JSON.
+
+Run with ``python -m benchmarks.bench_apply [-n NUMBER] [--output FILE] [--palette]``. It runs on the offscreen
+platform unless ``QT_QPA_PLATFORM`` is set. With ``--palette``, the themes are applied by ``apply_palette`` with the
+Fusion style.
+
+For each theme, "apply" is the time of ``QApplication.setStyleSheet`` including the repolish of all widgets and the
+pending layout events, and "paint" is the time of the first full paint after that. "switch" is the matrix of
+{from theme: {to theme: {"apply": ms, "paint": ms}}}. The stylesheets are loaded before, so building them is not
+included.
+"""
+
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import logging  # noqa: E402
+import statistics  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+from datetime import datetime, timezone  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Optional, Tuple  # noqa: E402
+
+from benchmarks.bench_pipeline import _commit  # noqa: E402
+from qtvscodestyle import __version__  # noqa: E402
+from qtvscodestyle.base import Theme, load_stylesheet  # noqa: E402
+from qtvscodestyle.examples.widget_gallery.__main__ import WidgetGallery  # noqa: E402
+from qtvscodestyle.palette import apply_palette, load_palette, load_palette_stylesheet  # noqa: E402
+from qtvscodestyle.qtpy import __version__ as qt_version  # noqa: E402
+from qtvscodestyle.qtpy.QtGui import QPalette  # noqa: E402
+from qtvscodestyle.qtpy.QtWidgets import QApplication, QWidget  # noqa: E402
+
+_Style = Tuple[str, Optional[QPalette]]  # (stylesheet, palette)
+
+
+def _apply_and_paint(app: QApplication, win: WidgetGallery, style: _Style) -> tuple[float, float]:
+    """Return the time in milliseconds to apply the style and to paint the window after that."""
+    stylesheet, palette = style
+    start = time.perf_counter()
+    if palette is not None and stylesheet:
+        apply_palette(palette)
+    else:
+        if palette is not None:
+            app.setPalette(palette)
+        app.setStyleSheet(stylesheet)
+    app.processEvents()
+    applied = time.perf_counter()
+    win.grab()
+    return (applied - start) * 1000, (time.perf_counter() - applied) * 1000
+
+
+def _median(samples: list[tuple[float, float]]) -> dict[str, float]:
+    return {
+        "apply": statistics.median(apply for apply, _ in samples),
+        "paint": statistics.median(paint for _, paint in samples),
+    }
+
+
+def _load_styles(palette: bool) -> dict[str, _Style]:
+    if palette:
+        return {theme.name: (load_palette_stylesheet(), load_palette(theme)) for theme in Theme}
+    return {theme.name: (load_stylesheet(theme), None) for theme in Theme}
+
+
+def run(number: int = 3, palette: bool = False) -> dict:
+    app = QApplication.instance() or QApplication([])
+    app.setCursorFlashTime(0)
+    if palette:
+        app.setStyle("Fusion")
+    default_style = ("", QPalette(app.palette()))
+    win = WidgetGallery()
+    win.resize(1200, 800)
+    win.show()
+    app.processEvents()
+    styles = _load_styles(palette)
+
+    themes: dict[str, dict[str, float]] = {}
+    for name, style in styles.items():
+        samples = []
+        for _ in range(number):
+            _apply_and_paint(app, win, default_style)
+            samples.append(_apply_and_paint(app, win, style))
+        themes[name] = _median(samples)
+
+    switch: dict[str, dict[str, dict[str, float]]] = {}
+    for from_name, from_style in styles.items():
+        switch[from_name] = {}
+        for to_name, to_style in styles.items():
+            if from_name == to_name:
+                continue
+            samples = []
+            for _ in range(number):
+                _apply_and_paint(app, win, from_style)
+                samples.append(_apply_and_paint(app, win, to_style))
+            switch[from_name][to_name] = _median(samples)
+    win.close()
+
+    return {
+        "meta": {
+            "version": __version__,
+            "commit": _commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "qt_version": qt_version,
+            "platform": app.platformName(),
+            "widgets": len(win.findChildren(QWidget)),
+            "mode": "palette" if palette else "stylesheet",
+        },
+        "themes": themes,
+        "switch": switch,
+    }
+
+
+def print_matrix(report: dict) -> None:
+    """Print the matrix of the switch times (apply + paint) in milliseconds. Rows are from, columns are to."""
+    names = list(report["themes"])
+    print("from \\ to".ljust(22) + "".join(f"{index:>8}" for index in range(len(names))))
+    for index, from_name in enumerate(names):
+        cells = []
+        for to_name in names:
+            times = report["switch"][from_name].get(to_name)
+            cells.append(f"{'-':>8}" if times is None else f"{times['apply'] + times['paint']:>8.1f}")
+        print(f"{f'{index} {from_name}':<22}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark applying the stylesheets to the widget gallery.")
+    parser.add_argument("-n", "--number", type=int, default=3)
+    parser.add_argument("--output", help="Write the results to the file and print the switch matrix.")
+    parser.add_argument("--palette", action="store_true", help="Apply the themes in the palette mode.")
+    args = parser.parse_args()
+
+    logging.getLogger("qtvscodestyle").setLevel(logging.ERROR)
+    report = run(args.number, args.palette)
+    if args.output is None:
+        print(json.dumps(report, indent=2))
+    else:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print_matrix(report)
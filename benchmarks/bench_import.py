@@ -0,0 +1,168 @@
+"""Measure the import time of qtvscodestyle with ``-X importtime`` and check that importing it has no side effects.
+
+Run with ``python -m benchmarks.bench_import [-n NUMBER] [--output FILE] [--check]``. Each statement runs NUMBER
+times in a new interpreter whose home directory is an empty temporary directory. The result of each statement is the
+median of the self import time of the qtvscodestyle modules it imports, and the side effects of the first run:
+whether Qt is imported, whether the slow standard modules (typing and distutils) are imported, whether the default
+color registry is built and whether files are created in the home directory. The package is compiled first, so that
+stale bytecode is not measured.
+
+The self time excludes the standard modules, whose import time depends on what the interpreter has already imported,
+e.g. by sitecustomize. Importing the slow ones is checked as a side effect instead. The budgets are fractions of the
+baseline, the median wall-clock time of ``python -c pass``, so that they hold on slower machines. With ``--check``, it
+exits with 1 if a statement has a side effect or exceeds its budget, so that it can gate regressions in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import compileall
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.bench_pipeline import _commit
+from qtvscodestyle import __version__
+
+# {name: (statement, budget as a fraction of the baseline, whether the slow standard modules may be imported)}.
+# The budgets are 3 to 5 times the results on a laptop, whose baseline is about 25 ms.
+_STATEMENTS = {
+    "package": ("import qtvscodestyle", 0.05, False),
+    "theme": ("from qtvscodestyle import Theme", 0.15, False),
+    "color": ("from qtvscodestyle.vscode.color import Color; Color.from_hex('#007acc').lighten(0.2)", 0.15, False),
+    "icons": ("from qtvscodestyle import Vsc", 0.15, False),
+    "load_stylesheet": ("from qtvscodestyle import load_stylesheet", 2.0, True),
+}
+
+_SLOW_MODULES = ("typing", "distutils")
+
+# Run by the child around the statement. They import nothing new.
+_PRELUDE = "import sys; _modules = set(sys.modules)"
+_PROBE = f"""
+import json, os
+print(json.dumps({{
+    "qt": sorted({{m.split(".")[0] for m in sys.modules}} & {{"PyQt5", "PyQt6", "PySide2", "PySide6"}}),
+    "slow_modules": sorted((set(sys.modules) - _modules) & {set(_SLOW_MODULES)!r}),
+    "color_registry": "qtvscodestyle.vscode.color_registry" in sys.modules,
+    "home_files": os.listdir(os.path.expanduser("~")),
+}}))
+"""
+
+
+def _parse_import_time(stderr: str) -> float:
+    """Return the total self import time in milliseconds of the qtvscodestyle modules."""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        # Nested imports are indented.
+        if name.strip().startswith("qtvscodestyle"):
+            total += int(self_time)
+    return total / 1000
+
+
+def _env(home: Path) -> dict[str, str]:
+    return dict(os.environ, HOME=str(home), USERPROFILE=str(home))
+
+
+def _bench_baseline(number: int) -> float:
+    """Return the median wall-clock time in milliseconds to start and exit the interpreter."""
+    times = []
+    with tempfile.TemporaryDirectory() as home:
+        for _ in range(number):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", "pass"], env=_env(Path(home)), check=True)
+            times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def _run_statement(statement: str, home: Path) -> tuple[float, dict]:
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{_PRELUDE}\n{statement}\n{_PROBE}"],
+        capture_output=True,
+        text=True,
+        env=_env(home),
+        check=True,
+    )
+    return _parse_import_time(output.stderr), json.loads(output.stdout.splitlines()[-1])
+
+
+def _bench_statement(statement: str, number: int) -> dict:
+    times = []
+    side_effects: Optional[dict] = None
+    for _ in range(number):
+        with tempfile.TemporaryDirectory() as home:
+            import_time, probe = _run_statement(statement, Path(home))
+        times.append(import_time)
+        side_effects = probe if side_effects is None else side_effects
+    return {"median": statistics.median(times), "min": min(times), "number": number, "side_effects": side_effects}
+
+
+def run(number: int = 10) -> dict:
+    compileall.compile_dir(Path(__file__).parents[1] / "qtvscodestyle", quiet=1)
+    baseline = _bench_baseline(number)
+    results = {name: _bench_statement(statement, number) for name, (statement, _, _) in _STATEMENTS.items()}
+    for result in results.values():
+        result["relative"] = result["median"] / baseline
+    return {
+        "meta": {
+            "version": __version__,
+            "commit": _commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "baseline": baseline,
+        },
+        "results": results,
+    }
+
+
+def check(report: dict) -> list[str]:
+    """Return the failures of the budgets and side effects."""
+    failures = []
+    baseline = report["meta"]["baseline"]
+    for name, result in report["results"].items():
+        _, budget, slow_modules_allowed = _STATEMENTS[name]
+        if result["relative"] > budget:
+            failures.append(
+                f"{name}: {result['median']:.1f} ms exceeds the budget of {budget * baseline:.1f} ms"
+                f" ({budget:g} x {baseline:.1f} ms of the baseline)"
+            )
+        side_effects = result["side_effects"]
+        if side_effects["qt"]:
+            failures.append(f"{name}: imports {', '.join(side_effects['qt'])}")
+        if side_effects["slow_modules"] and not slow_modules_allowed:
+            failures.append(f"{name}: imports {', '.join(side_effects['slow_modules'])}")
+        if side_effects["color_registry"]:
+            failures.append(f"{name}: builds the default color registry")
+        if side_effects["home_files"]:
+            failures.append(f"{name}: creates {', '.join(side_effects['home_files'])} in the home directory")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the import time of qtvscodestyle and print it as JSON.")
+    parser.add_argument("-n", "--number", type=int, default=10)
+    parser.add_argument("--output", help="Write the results to the file instead of stdout.")
+    parser.add_argument("--check", action="store_true", help="Exit with 1 if a budget or side effect check fails.")
+    args = parser.parse_args()
+
+    report = run(args.number)
+    if args.output is None:
+        print(json.dumps(report, indent=2))
+    else:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if args.check:
+        failures = check(report)
+        for failure in failures:
+            print(failure, file=sys.stderr)
+        sys.exit(1 if failures else 0)
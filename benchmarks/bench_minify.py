@@ -0,0 +1,71 @@
+"""Check that the minified stylesheet renders the widget gallery identically and compare Qt's apply time.
+
+Run with ``QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_minify``.
+"""
+
+from __future__ import annotations
+
+import time
+
+from qtvscodestyle.base import Theme, load_stylesheet
+from qtvscodestyle.examples.widget_gallery.__main__ import WidgetGallery
+from qtvscodestyle.qtpy.QtGui import QImage
+from qtvscodestyle.qtpy.QtWidgets import QApplication
+
+
+def _grab_pages(app: QApplication, win: WidgetGallery) -> list[QImage]:
+    images = []
+    for index in range(win._ui.stack_widget.count()):
+        win._ui.stack_widget.setCurrentIndex(index)
+        app.processEvents()
+        images.append(win.grab().toImage())
+    win._ui.stack_widget.setCurrentIndex(0)
+    return images
+
+
+def _apply_time(app: QApplication, stylesheet: str, number: int) -> float:
+    elapsed = 0.0
+    for _ in range(number):
+        app.setStyleSheet("")
+        app.processEvents()
+        start = time.perf_counter()
+        app.setStyleSheet(stylesheet)
+        app.processEvents()
+        elapsed += time.perf_counter() - start
+    return elapsed / number
+
+
+def main(number: int = 5) -> None:
+    app = QApplication.instance() or QApplication([])
+    # Blinking text cursors make the rendering differ between grabs.
+    app.setCursorFlashTime(0)
+    win = WidgetGallery()
+    win.resize(1200, 800)
+    win.show()
+
+    print(f"{'Theme':<22}{'size [B]':>10}{'minified [B]':>14}{'apply [ms]':>12}{'minified [ms]':>15}{'identical':>11}")
+    for theme in Theme:
+        stylesheet = load_stylesheet(theme)
+        minified = load_stylesheet(theme, minify=True)
+
+        # The first rendering after a theme change can differ (e.g. scroll positions), so both are applied once.
+        app.setStyleSheet(stylesheet)
+        app.setStyleSheet(minified)
+        _grab_pages(app, win)
+        app.setStyleSheet(stylesheet)
+        expected = _grab_pages(app, win)
+        app.setStyleSheet(minified)
+        identical = expected == _grab_pages(app, win)
+
+        apply_time = _apply_time(app, stylesheet, number)
+        minified_apply_time = _apply_time(app, minified, number)
+        print(
+            f"{theme.name:<22}{len(stylesheet):>10}{len(minified):>14}"
+            f"{apply_time * 1000:>12.2f}{minified_apply_time * 1000:>15.2f}{str(identical):>11}"
+        )
+        if not identical:
+            raise AssertionError(f"The minified stylesheet of {theme.name} renders differently.")
+
+
+if __name__ == "__main__":
+    main()
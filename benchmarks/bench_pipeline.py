@@ -0,0 +1,196 @@
+"""Benchmark each step of the theming pipeline and emit the results as JSON.
+
+Run with ``python -m benchmarks.bench_pipeline [-n NUMBER] [--output FILE] [--compare BASELINE]``.
+No display or QApplication is needed. Save the output of a commit and pass it to ``--compare`` on another commit to
+print the ratio of each benchmark.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from importlib import resources
+from pathlib import Path
+from typing import Callable, Optional
+
+from qtvscodestyle import __version__, base
+from qtvscodestyle.base import Theme, _create_color_registry, _loads_jsonc, _merge_colors_to_default, load_stylesheet
+from qtvscodestyle.cache import StylesheetCache
+from qtvscodestyle.resource_manager import ResourceManager
+from qtvscodestyle.stylesheet.build import _convert_svg, _get_qt_version, build_stylesheet
+from qtvscodestyle.util import load_svg_code
+from qtvscodestyle.vscode.color import Color
+
+_THEME_TYPES = ("light", "dark", "hc")
+
+
+def _measure(func: Callable[[], object], number: int, setup: Optional[Callable[[], object]] = None) -> dict:
+    """Return the statistics in milliseconds of ``number`` runs. ``setup`` runs before each run and is not timed."""
+    times = []
+    for _ in range(number):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "mean": statistics.mean(times),
+        "median": statistics.median(times),
+        "min": min(times),
+        "stdev": statistics.stdev(times) if number > 1 else 0.0,
+        "number": number,
+    }
+
+
+def _read_theme(theme: Theme) -> str:
+    return resources.read_text("qtvscodestyle.vscode.theme", theme.value["file_name"])
+
+
+def _theme_colors(theme: Theme) -> dict[str, str]:
+    return _loads_jsonc(_read_theme(theme))["colors"]
+
+
+def _bench_loads_jsonc(number: int) -> dict[str, dict]:
+    results = {}
+    for theme in Theme:
+        json_text = _read_theme(theme)
+        results[f"loads_jsonc/{theme.name}"] = _measure(lambda: _loads_jsonc(json_text), number)
+    return results
+
+
+def _bench_get_colors(number: int) -> dict[str, dict]:
+    results = {}
+    for theme_type in _THEME_TYPES:
+        theme = next(theme for theme in Theme if theme.value["type"] == theme_type)
+        color_registry = _create_color_registry(_theme_colors(theme), theme_type)
+        results[f"get_colors/{theme_type}"] = _measure(lambda: color_registry.get_colors(theme_type), number)
+    return results
+
+
+def _bench_build_stylesheet(number: int, dir_path: Path) -> dict[str, dict]:
+    results, qt_version = {}, _get_qt_version()
+    for theme in Theme:
+        theme_type = theme.value["type"]
+        colors = _merge_colors_to_default(_theme_colors(theme), theme_type)
+        results[f"build_stylesheet/{theme.name}"] = _measure(
+            lambda: build_stylesheet(colors, theme_type, dir_path, False, qt_version), number
+        )
+    return results
+
+
+def _use_fresh_caches(dir_path: Path) -> None:
+    """Start from empty caches in the process and on the disk."""
+    shutil.rmtree(dir_path, ignore_errors=True)
+    base._RESOURCES_BASE_DIR = dir_path / "resources"
+    base._CACHE_DIR = dir_path / "cache"
+    base._stylesheet_cache = StylesheetCache(base._CACHE_DIR)
+    base._resource_manager = ResourceManager(base._RESOURCES_BASE_DIR)
+    _convert_svg.cache_clear()
+    load_svg_code.cache_clear()
+
+
+def _bench_load_stylesheet(number: int, dir_path: Path) -> dict[str, dict]:
+    # The precompiled stylesheets are not used, so that the cold load builds the stylesheet.
+    base._load_precompiled = lambda *args: None
+    theme = Theme.DARK_VS
+    return {
+        "load_stylesheet/cold": _measure(lambda: load_stylesheet(theme), number, lambda: _use_fresh_caches(dir_path)),
+        "load_stylesheet/disk_cache": _measure(
+            lambda: load_stylesheet(theme),
+            number,
+            lambda: setattr(base, "_stylesheet_cache", StylesheetCache(base._CACHE_DIR)),
+        ),
+        "load_stylesheet/warm": _measure(lambda: load_stylesheet(theme), number),
+    }
+
+
+def _bench_color(number: int) -> dict[str, dict]:
+    # The cached functions are measured without the cache.
+    from_hex = Color.from_hex.__wrapped__  # type: ignore
+    color, background = Color.from_hex("#3794ff"), Color.from_hex("#1e1e1e")
+    benchmarks: dict[str, Callable[[], object]] = {
+        "from_hex": lambda: from_hex("#3794ffcc"),
+        "str": lambda: str(color),
+        "hsla": lambda: Color(color.rgba).hsla,
+        "lighten": lambda: color.lighten(0.2),
+        "darken": lambda: color.darken(0.2),
+        "transparent": lambda: color.transparent(0.5),
+        "is_darker_than": lambda: color.is_darker_than(background),
+        "get_lighter_color": lambda: Color.get_lighter_color.__wrapped__(background, color, 0.5),  # type: ignore
+    }
+    # A single call is too fast to time, so each run repeats it.
+    results = {}
+    for name, func in benchmarks.items():
+        result = _measure(lambda: [func() for _ in range(1000)], number)
+        result["unit"] = "ms per 1000 calls"
+        results[f"color/{name}"] = result
+    return results
+
+
+def _commit() -> Optional[str]:
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def run(number: int = 20) -> dict:
+    dir_path = Path(tempfile.mkdtemp())
+    try:
+        results = {
+            **_bench_loads_jsonc(number),
+            **_bench_get_colors(number),
+            **_bench_build_stylesheet(number, dir_path / "build"),
+            **_bench_load_stylesheet(number, dir_path / "load"),
+            **_bench_color(number),
+        }
+    finally:
+        shutil.rmtree(dir_path, ignore_errors=True)
+    return {
+        "meta": {
+            "version": __version__,
+            "commit": _commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "qt_version": _get_qt_version(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> None:
+    print(f"{'Benchmark':<36}{'baseline [ms]':>16}{'current [ms]':>16}{'ratio':>8}")
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        print(f"{name:<36}{old['median']:>16.4f}{result['median']:>16.4f}{result['median'] / old['median']:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the theming pipeline and print the results as JSON.")
+    parser.add_argument("-n", "--number", type=int, default=20)
+    parser.add_argument("--output", help="Write the results to the file instead of stdout.")
+    parser.add_argument("--compare", help="Print the ratio of the results to the results in the file.")
+    args = parser.parse_args()
+
+    # Warnings about the missing QApplication are irrelevant here.
+    logging.getLogger("qtvscodestyle").setLevel(logging.ERROR)
+    report = run(args.number)
+    if args.output is None:
+        print(json.dumps(report, indent=2))
+    else:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if args.compare is not None:
+        compare(json.loads(Path(args.compare).read_text()), report)
@@ -0,0 +1,170 @@
+"""Compare the paint throughput of VSCodeProxyStyle with the stylesheet and emit the results as JSON.
+
+Run with ``python -m benchmarks.bench_proxy_style [-n NUMBER] [--rows ROWS] [--output FILE]``. It runs on the
+offscreen platform unless ``QT_QPA_PLATFORM`` is set.
+
+A tree view of a large model and a tab bar are scrolled and painted NUMBER times in each mode. "stylesheet" is the full
+stylesheet with Fusion, and "proxy" is VSCodeProxyStyle with the palette of the theme. "switch" is the time to switch
+between the dark and light theme and paint the window, measured 4 times because the stylesheet takes seconds with a
+large model. The loaded stylesheets are reused, but ``set_theme`` of the style resolves the colors
+every time. The results are
+{mode: {"paint": median ms per frame, "fps": frames per second, "switch": median ms}}.
+"""
+
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import logging  # noqa: E402
+import statistics  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+from datetime import datetime, timezone  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Callable  # noqa: E402
+
+from benchmarks.bench_pipeline import _commit  # noqa: E402
+from qtvscodestyle import __version__  # noqa: E402
+from qtvscodestyle.base import Theme, load_stylesheet  # noqa: E402
+from qtvscodestyle.proxy_style import VSCodeProxyStyle  # noqa: E402
+from qtvscodestyle.qtpy import __version__ as qt_version  # noqa: E402
+from qtvscodestyle.qtpy.QtGui import QStandardItemModel  # noqa: E402
+from qtvscodestyle.qtpy.QtWidgets import (  # noqa: E402
+    QApplication,
+    QStyleFactory,
+    QTabWidget,
+    QTreeView,
+    QVBoxLayout,
+    QWidget,
+)
+
+_SWITCHES = 4
+
+
+def _tree_model(rows: int) -> QStandardItemModel:
+    """Return a model of ``rows`` top-level rows with 3 children each.
+
+    PySide6 6.12 on Python 3.11 drops a reference to None on each call of a void method from Python, and on each None
+    returned by ``data()`` of a Python model, and aborts the interpreter after a few thousand of them. So the model is
+    a C++ model, filled only with methods that return a value.
+    """
+    model = QStandardItemModel(rows, 3)
+    for row in range(rows):
+        parent = model.index(row, 0)
+        model.insertRows(0, 3, parent)
+        model.insertColumns(0, 3, parent)
+        for column in range(3):
+            model.setData(model.index(row, column), f"Item {row}-{column}")
+            for child in range(3):
+                model.setData(model.index(child, column, parent), f"Item {child}-{column}")
+    return model
+
+
+class _Window(QWidget):
+    def __init__(self, rows: int) -> None:
+        super().__init__()
+        self.tab_widget = QTabWidget()
+        self.tab_widget.setTabsClosable(True)
+        self.view = QTreeView()
+        self.view.setAlternatingRowColors(True)
+        self.view.setUniformRowHeights(True)
+        self.view.setModel(_tree_model(rows))
+        self.tab_widget.addTab(self.view, "Tree")
+        for index in range(9):
+            self.tab_widget.addTab(QWidget(), f"Tab {index}")
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.tab_widget)
+
+
+def _paint(app: QApplication, win: _Window, number: int) -> dict[str, float]:
+    view = win.view
+    model = view.model()
+    for row in range(0, model.rowCount(), max(1, model.rowCount() // 50)):
+        view.expand(model.index(row, 0))
+    view.setCurrentIndex(model.index(1, 0))
+    scroll_bar = view.verticalScrollBar()
+    samples = []
+    # The first frames of a style are slower because of the caches of the fonts and pixmaps.
+    for step in range(number + 3):
+        scroll_bar.setValue(step * scroll_bar.maximum() // (number + 3))
+        app.processEvents()
+        start = time.perf_counter()
+        win.grab()
+        if step >= 3:
+            samples.append((time.perf_counter() - start) * 1000)
+    paint = statistics.median(samples)
+    return {"paint": paint, "fps": 1000 / paint}
+
+
+def _switch(app: QApplication, win: _Window, apply: Callable[[Theme], None]) -> float:
+    samples = []
+    for step in range(_SWITCHES):
+        start = time.perf_counter()
+        apply(Theme.LIGHT_VS if step % 2 == 0 else Theme.DARK_VS)
+        app.processEvents()
+        win.grab()
+        samples.append((time.perf_counter() - start) * 1000)
+    apply(Theme.DARK_VS)
+    return statistics.median(samples)
+
+
+def run(number: int = 50, rows: int = 100000) -> dict:
+    app = QApplication.instance() or QApplication([])
+    app.setCursorFlashTime(0)
+    default_palette = app.palette()
+    stylesheets = {theme: load_stylesheet(theme) for theme in (Theme.DARK_VS, Theme.LIGHT_VS)}
+    proxy_style = VSCodeProxyStyle(Theme.DARK_VS)
+    win = _Window(rows)
+    win.resize(1200, 800)
+    win.show()
+
+    def apply_proxy(theme: Theme) -> None:
+        proxy_style.set_theme(theme)
+        app.setPalette(proxy_style.standardPalette())
+
+    modes = {}
+    app.setStyle(QStyleFactory.create("Fusion"))
+    app.setPalette(default_palette)
+    app.setStyleSheet(stylesheets[Theme.DARK_VS])
+    modes["stylesheet"] = _paint(app, win, number)
+    modes["stylesheet"]["switch"] = _switch(app, win, lambda theme: app.setStyleSheet(stylesheets[theme]))
+
+    app.setStyleSheet("")
+    app.setStyle(proxy_style)
+    apply_proxy(Theme.DARK_VS)
+    modes["proxy"] = _paint(app, win, number)
+    modes["proxy"]["switch"] = _switch(app, win, apply_proxy)
+    win.close()
+
+    return {
+        "meta": {
+            "version": __version__,
+            "commit": _commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "qt_version": qt_version,
+            "platform": app.platformName(),
+            "rows": rows,
+            "number": number,
+        },
+        "modes": modes,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the paint throughput of VSCodeProxyStyle and stylesheet.")
+    parser.add_argument("-n", "--number", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--output", help="Write the results to the file.")
+    args = parser.parse_args()
+
+    logging.getLogger("qtvscodestyle").setLevel(logging.ERROR)
+    report = json.dumps(run(args.number, args.rows), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        Path(args.output).write_text(report)
@@ -0,0 +1,94 @@
+"""Compare the svg output into a cold directory: the former one-by-one writes against the batched parallel writes.
+
+Run with ``python -m benchmarks.bench_svg_output [--dir DIR] [--latency MS]``.
+Pass a dir on a slow or network file system, or simulate the latency of each write with ``--latency``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from importlib import resources
+from pathlib import Path
+from typing import Callable
+
+from qtvscodestyle import util
+from qtvscodestyle.base import Theme, _loads_jsonc, _merge_colors_to_default
+from qtvscodestyle.stylesheet import build
+from qtvscodestyle.stylesheet.build import StylesheetRenderer, output_svg_codes
+
+
+def _collect_svg_codes() -> dict[str, str]:
+    svg_codes = {}
+    for theme in Theme:
+        theme_property = _loads_jsonc(resources.read_text("qtvscodestyle.vscode.theme", theme.value["file_name"]))
+        colors = _merge_colors_to_default(theme_property["colors"], theme.value["type"])
+        renderer = StylesheetRenderer(theme.value["type"], Path(), collect_svg=True)
+        renderer.render(colors)
+        svg_codes.update(renderer.svg_codes)
+    return svg_codes
+
+
+def _one_by_one(svg_codes: dict[str, str], dir_path: Path, latency: float) -> None:
+    """The svg output before the writes were batched."""
+    dir_path.mkdir(parents=True, exist_ok=True)
+    for file_name, svg_code in svg_codes.items():
+        path = dir_path / file_name
+        if path.exists():
+            continue
+        with path.open("w") as f:
+            f.write(svg_code)
+        time.sleep(latency)
+
+
+def _simulate_latency(latency: float) -> None:
+    def write_text_atomic(path: Path, text: str) -> None:
+        util.write_text_atomic(path, text)
+        time.sleep(latency)
+
+    if latency > 0:
+        build.write_text_atomic = write_text_atomic
+
+
+def _measure(output: Callable[[Path], object], base_dir: Path, number: int) -> tuple[float, float]:
+    """Return the average time of the output into a cold dir and into the dir that has all files."""
+    cold = warm = 0.0
+    for _ in range(number):
+        dir_path = Path(tempfile.mkdtemp(dir=base_dir))
+        try:
+            start = time.perf_counter()
+            output(dir_path)
+            cold += time.perf_counter() - start
+            start = time.perf_counter()
+            output(dir_path)
+            warm += time.perf_counter() - start
+        finally:
+            shutil.rmtree(dir_path)
+    return cold / number, warm / number
+
+
+def main(base_dir: Path, latency: float = 0.0, number: int = 10) -> None:
+    svg_codes = _collect_svg_codes()
+    _simulate_latency(latency)
+    print(f"{len(svg_codes)} svg files of all themes into '{base_dir}', {latency * 1000} ms latency per write")
+    print(f"{'Output':<26}{'cold [ms]':>12}{'warm [ms]':>12}")
+    outputs: dict[str, Callable[[Path], object]] = {
+        "one by one": lambda dir_path: _one_by_one(svg_codes, dir_path, latency),
+        "batched, 1 thread": lambda dir_path: output_svg_codes(svg_codes, dir_path, workers=1),
+        "batched, 4 threads": lambda dir_path: output_svg_codes(svg_codes, dir_path, workers=4),
+        "batched, 8 threads": lambda dir_path: output_svg_codes(svg_codes, dir_path, workers=8),
+    }
+    for name, output in outputs.items():
+        cold, warm = _measure(output, base_dir, number)
+        print(f"{name:<26}{cold * 1000:>12.2f}{warm * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the svg output into a cold directory.")
+    parser.add_argument("--dir", help="Dir to create the temporary output dirs in.", default=tempfile.gettempdir())
+    parser.add_argument("--latency", type=float, help="Latency in milliseconds added to each write.", default=0.0)
+    parser.add_argument("-n", "--number", type=int, default=10)
+    args = parser.parse_args()
+    main(Path(args.dir), args.latency / 1000, args.number)
@@ -0,0 +1,79 @@
+"""Compare the compiled stylesheet template with the former multireplace path.
+
+Run with ``python -m benchmarks.bench_template``.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import timeit
+from importlib import resources
+from pathlib import Path
+from typing import Optional
+
+from qtvscodestyle.base import Theme, _loads_jsonc, _merge_colors_to_default
+from qtvscodestyle.stylesheet.build import _convert_svg, _get_qt_version, _normalize_rotation, _parse_url
+from qtvscodestyle.stylesheet.template import _OPERATORS, _EnvPatch, _Url, load_template
+from qtvscodestyle.util import multireplace, parse_version, to_svg_color_format
+from qtvscodestyle.vscode.color import Color
+
+_DUMMY_DIR = Path("/dummy")
+
+
+def _multireplace_render(colors: dict[str, Optional[Color]], theme_type: str, qt_version: str) -> str:
+    """The text generation of build_stylesheet before the template was compiled."""
+    template = resources.read_text("qtvscodestyle.stylesheet", "template.qss")
+    replacements = {}
+    for match in re.finditer(r"\$type_patch\{[\s\S]*?\};", template):
+        match_text = match.group().rstrip(";")
+        property = json.loads(match_text.replace("$type_patch", ""))
+        value = property["value"]
+        qss_text = "\n".join(value if type(value) is list else [value])
+        replacements[match_text] = qss_text if theme_type in property["types"].replace(" ", "").split("|") else ""
+    for match in re.finditer(r"\$env_patch\{[\s\S]*?\}", template):
+        property = json.loads(match.group().replace("$env_patch", ""))
+        qualifier = next(qualifier for qualifier in _OPERATORS if qualifier in property["version"])
+        patch = _EnvPatch(qualifier, parse_version(property["version"].replace(qualifier, "")), ())
+        replacements[match.group()] = property["value"] if patch.is_enabled(parse_version(qt_version)) else ""
+    template = multireplace(template, replacements)
+
+    url_replacements = {}
+    for match in re.finditer(r"\$url\{.+\}", template):
+        url = _Url(*json.loads(match.group().replace("$url", "")).values())
+        file_name = _convert_svg(url.icon, to_svg_color_format(colors["$" + url.id]), float(url.rotate))[0]
+        url_replacements[match.group()] = f"url({(_DUMMY_DIR / file_name).as_posix()})"
+    colors_str = {id: ("" if color is None else str(color)) for id, color in colors.items()}
+    return multireplace(template, {**colors_str, **url_replacements})
+
+
+def _compiled_render(colors: dict[str, Optional[Color]], theme_type: str, qt_version: str) -> str:
+    template = load_template()
+    file_names = {
+        url: _convert_svg(url.icon, to_svg_color_format(colors["$" + url.id]), _normalize_rotation(url.rotate))[0]
+        for url in template.urls(theme_type, qt_version)
+    }
+    colors_str = {id: ("" if color is None else str(color)) for id, color in colors.items()}
+    return template.render(colors_str, _parse_url(file_names, _DUMMY_DIR), theme_type, qt_version)
+
+
+def main(number: int = 20) -> None:
+    qt_version = _get_qt_version()
+    print(f"{'Theme':<22}{'multireplace [ms]':>20}{'compiled [ms]':>16}{'speedup':>10}")
+    for theme in Theme:
+        theme_type = theme.value["type"]
+        theme_property = _loads_jsonc(resources.read_text("qtvscodestyle.vscode.theme", theme.value["file_name"]))
+        colors = _merge_colors_to_default(theme_property["colors"], theme_type)
+        colors = {f"${id}".replace(".", "_"): color for id, color in colors.items()}
+
+        expected = _multireplace_render(colors, theme_type, qt_version)
+        if _compiled_render(colors, theme_type, qt_version) != expected:
+            raise AssertionError(f"Compiled template renders a different stylesheet for {theme.name}.")
+
+        old = timeit.timeit(lambda: _multireplace_render(colors, theme_type, qt_version), number=number)
+        new = timeit.timeit(lambda: _compiled_render(colors, theme_type, qt_version), number=number)
+        print(f"{theme.name:<22}{old / number * 1000:>20.3f}{new / number * 1000:>16.3f}{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,102 @@
-from qtvscodestyle.base import Theme, list_color_id, list_themes, load_stylesheet, loads_stylesheet  # noqa: F401
-from qtvscodestyle.const import FaBrands, FaRegular, FaSolid, Vsc  # noqa: F401
-from qtvscodestyle.qtpy import QtImportError as __QtImportError
+__version__ = "0.1.2"
 
-try:
+# typing takes longer to import than the package. This module, const and vscode.color, which are imported without the
+# rest of the package, set the flag instead of importing it from typing. Type checkers treat it as True.
+TYPE_CHECKING = False
+
+# Everything is imported on first access. Importing qtvscodestyle does not import Qt, build the color registry or
+# touch the disk, and "Theme" and the color math do not import the stylesheet builder.
+_LAZY_ATTRIBUTES = {
+    "Theme": "qtvscodestyle.theme",
+    "StylesheetBuilder": "qtvscodestyle.base",
+    "build_all_stylesheets": "qtvscodestyle.base",
+    "list_color_id": "qtvscodestyle.base",
+    "list_themes": "qtvscodestyle.base",
+    "load_stylesheet": "qtvscodestyle.base",
+    "loads_stylesheet": "qtvscodestyle.base",
+    "set_resources_max_size": "qtvscodestyle.base",
+    "set_shared_dir": "qtvscodestyle.base",
+    "FaBrands": "qtvscodestyle.const",
+    "FaRegular": "qtvscodestyle.const",
+    "FaSolid": "qtvscodestyle.const",
+    "Vsc": "qtvscodestyle.const",
+    "BuildReport": "qtvscodestyle.report",
+    "set_build_report_hook": "qtvscodestyle.report",
+    "PruneStats": "qtvscodestyle.stylesheet.prune",
+    # Qt is required from here.
+    "load_stylesheet_async": "qtvscodestyle.async_loader",
+    "apply_palette": "qtvscodestyle.palette",
+    "build_palette": "qtvscodestyle.palette",
+    "load_palette": "qtvscodestyle.palette",
+    "load_palette_stylesheet": "qtvscodestyle.palette",
+    "VSCodeProxyStyle": "qtvscodestyle.proxy_style",
+    "icon": "qtvscodestyle.q_icon",
+    "theme_icon": "qtvscodestyle.q_icon",
+    "ThemeManager": "qtvscodestyle.theme_manager",
+}
+
+_qt_warning_logged = False
+
+if TYPE_CHECKING:
+    from qtvscodestyle.async_loader import load_stylesheet_async  # noqa: F401
+    from qtvscodestyle.base import (  # noqa: F401
+        StylesheetBuilder,
+        build_all_stylesheets,
+        list_color_id,
+        list_themes,
+        load_stylesheet,
+        loads_stylesheet,
+        set_resources_max_size,
+        set_shared_dir,
+    )
+    from qtvscodestyle.const import FaBrands, FaRegular, FaSolid, Vsc  # noqa: F401
+    from qtvscodestyle.palette import apply_palette, build_palette, load_palette, load_palette_stylesheet  # noqa: F401
+    from qtvscodestyle.proxy_style import VSCodeProxyStyle  # noqa: F401
     from qtvscodestyle.q_icon import icon, theme_icon  # noqa: F401
-except __QtImportError as __e:
-    from qtvscodestyle.util import create_logger as __create_logger
+    from qtvscodestyle.report import BuildReport, set_build_report_hook  # noqa: F401
+    from qtvscodestyle.stylesheet.prune import PruneStats  # noqa: F401
+    from qtvscodestyle.theme import Theme  # noqa: F401
+    from qtvscodestyle.theme_manager import ThemeManager  # noqa: F401
+
+
+def _public_names() -> list:
+    """Return the names for ``from qtvscodestyle import *``. Without Qt, the names that require it are left out."""
+    names = []
+    for name in _LAZY_ATTRIBUTES:
+        try:
+            __getattr__(name)
+        except AttributeError:
+            continue
+        names.append(name)
+    return names
+
+
+def __getattr__(name: str):
+    global _qt_warning_logged
+
+    if name == "__all__":
+        # Computed on first access, because whether Qt is available is known only after importing it.
+        globals()["__all__"] = value = _public_names()
+        return value
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        # Unlike importlib.import_module, __import__ is reported by -X importtime.
+        value = getattr(__import__(module_name, fromlist=[name]), name)
+    except ImportError as e:
+        from qtvscodestyle.qtpy.qt_compat import QtImportError
+        from qtvscodestyle.util import create_logger
+
+        if not isinstance(e, QtImportError):
+            raise
+        if not _qt_warning_logged:
+            create_logger(__name__).warning(str(e) + "\n\tSome features of qtvscodestyle is unavailable.")
+            _qt_warning_logged = True
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
+    globals()[name] = value
+    return value
+
 
-    __create_logger(__name__).warning(str(__e) + "\n\tSome features of qtvscodestyle is unavailable.")
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from qtvscodestyle import base
+from qtvscodestyle.base import Theme, _apply_colors, _load_entry, _prune_class_names, load_stylesheet
+from qtvscodestyle.qtpy.QtCore import QObject, Signal, Slot
+
+
+class _Receiver(QObject):
+    """Deliver the results of the worker thread to the main thread.
+
+    The receiver lives in the main thread, so the signal emitted from the worker thread is queued to the main thread.
+    """
+
+    finished = Signal(object, object)  # (future, (entry, pruned stylesheet) or exception)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.finished.connect(self._deliver)
+
+    @Slot(object, object)
+    def _deliver(self, future: Future, result) -> None:
+        # The future is cancelled if a newer request arrived after the result was queued.
+        if not future.set_running_or_notify_cancel():
+            return
+        if isinstance(result, Exception):
+            future.set_exception(result)
+            return
+        (stylesheet, colors), pruned = result
+        base._resource_manager.use(load_stylesheet, stylesheet)
+        _apply_colors(colors)
+        future.set_result(pruned)
+
+
+class _AsyncLoader:
+    def __init__(self) -> None:
+        # Builds run one at a time. Cancelled requests waiting in the queue finish immediately.
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="qtvscodestyle")
+        self._receiver = _Receiver()
+        self._future: Optional[Future] = None
+
+    def _run(self, future: Future, theme, custom_colors, class_names, minify, in_memory) -> None:
+        if future.cancelled():
+            return
+        try:
+            result = _load_entry(theme, custom_colors, minify, in_memory, future.cancelled, class_names)
+        except Exception as e:
+            self._receiver.finished.emit(future, e)
+            return
+        if result is not None:
+            self._receiver.finished.emit(future, result)
+
+    def load(self, theme, custom_colors, prune, minify, in_memory) -> Future:
+        if self._future is not None:
+            self._future.cancel()
+        self._future = future = Future()
+        # The widget classes are collected here in the main thread, and the stylesheet is pruned in the worker thread.
+        class_names = _prune_class_names(prune)
+        self._executor.submit(self._run, future, theme, custom_colors, class_names, minify, in_memory)
+        return future
+
+
+_loader: Optional[_AsyncLoader] = None
+
+
+def load_stylesheet_async(
+    theme: Union[Theme, str, Path, dict] = Theme.DARK_VS,
+    custom_colors: dict[str, str] = {},
+    prune: Union[bool, Iterable[str]] = False,
+    minify: bool = False,
+    in_memory: bool = False,
+) -> Future:
+    """Load the style sheet on a worker thread. The arguments are the same as load_stylesheet.
+
+    Call this in the main thread. The returned future is resolved in the main thread by the Qt event loop, so the
+    callbacks added with ``add_done_callback`` can apply the stylesheet.
+    The previous request is cancelled if it has not finished, so only the latest stylesheet is delivered.
+    A cancelled build stops at the next build step.
+    """
+    global _loader
+    if _loader is None:
+        _loader = _AsyncLoader()
+    return _loader.load(theme, custom_colors, prune, minify, in_memory)
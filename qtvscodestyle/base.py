@@ -1,54 +1,48 @@
 from __future__ import annotations
 
+import itertools
 import json
+import os
 import re
-from distutils.version import StrictVersion
-from enum import Enum
+import sys
+import threading
+import weakref
 from importlib import resources
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Optional, Union
-
-from qtvscodestyle.qtpy.qt_compat import QtImportError
-from qtvscodestyle.stylesheet.build import build_stylesheet
-from qtvscodestyle.util import create_logger, multireplace
+from typing import Callable, Iterable, Optional, Union
+
+from qtvscodestyle.cache import CacheEntry, StylesheetCache, decode_colors, encode_colors
+from qtvscodestyle.precompile import load_precompiled
+from qtvscodestyle.report import build_report, current_report, stage
+from qtvscodestyle.resource_manager import _RECORDS_DIR_NAME, ResourceManager
+from qtvscodestyle.stylesheet.build import StylesheetRenderer, _get_qt_version, build_stylesheet, output_svg_codes
+from qtvscodestyle.stylesheet.minify import minify_stylesheet
+from qtvscodestyle.stylesheet.prune import expand_class_names, get_application_class_names, prune_stylesheet
+from qtvscodestyle.stylesheet.template import template_digest
+from qtvscodestyle.theme import Theme
+from qtvscodestyle.util import create_logger, file_lock, hash_key, multireplace, parse_version
 from qtvscodestyle.vscode.color import Color
-from qtvscodestyle.vscode.color_registry import setup_default_color_registry
 from qtvscodestyle.vscode.color_registry_manager import ColorRegistry
 
-setup_default_color_registry()
-
 # Setup logger
 _logger = create_logger(__name__)
 
 # Setup project dir
-_RESOURCES_BASE_DIR = Path.home() / ".q_vscode_style" / "resources"
-_RESOURCES_BASE_DIR.mkdir(parents=True, exist_ok=True)
+# Svg files are content-addressed and shared by all stylesheets. The dir is created when svg files are written.
+_DEFAULT_DIR = Path.home() / ".q_vscode_style"
+# The dir shared by processes of all users, which is set by set_shared_dir() or this environment variable.
+_SHARED_DIR_ENV = "QTVSCODESTYLE_SHARED_DIR"
+_RESOURCES_BASE_DIR = _DEFAULT_DIR / "resources"
+_CACHE_DIR = _DEFAULT_DIR / "cache"
+_resource_manager = ResourceManager(_RESOURCES_BASE_DIR)
+_stylesheet_cache = StylesheetCache(_CACHE_DIR)
+_shared = False
+_color_registry_lock = threading.Lock()
+_color_registry_ready = False
 
 global_current_colors = {}
 
 
-# In VSCode's default theme file, theme type is not set. Extension themes is no need.
-# So the default theme type is defined here.
-class Theme(Enum):
-    LIGHT_VS = {"name": "Light (Visual Studio)", "file_name": "light_vs.json", "type": "light"}
-    QUIET_LIGHT = {"name": "Quiet Light", "file_name": "quietlight-color-theme.json", "type": "light"}
-    SOLARIZED_LIGHT = {"name": "Solarized Light", "file_name": "solarized-light-color-theme.json", "type": "light"}
-    ABYSS = {"name": "Abyss", "file_name": "abyss_color_theme.json", "type": "dark"}
-    DARK_VS = {"name": "Dark (Visual Studio)", "file_name": "dark_vs.json", "type": "dark"}
-    KIMBIE_DARK = {"name": "Kimbie Dark", "file_name": "kimbie-dark-color-theme.json", "type": "dark"}
-    MONOKAI = {"name": "Monokai", "file_name": "monokai-color-theme.json", "type": "dark"}
-    MONOKAI_DIMMED = {"name": "Monokai Dimmed", "file_name": "dimmed-monokai-color-theme.json", "type": "dark"}
-    RED = {"name": "Red", "file_name": "Red-color-theme.json", "type": "dark"}
-    SOLARIZED_DARK = {"name": "Solarized Dark", "file_name": "solarized_dark_color_theme.json", "type": "dark"}
-    TOMORROW_NIGHT_BLUE = {
-        "name": "Tomorrow Night Blue",
-        "file_name": "tomorrow-night-blue-color-theme.json",
-        "type": "dark",
-    }
-    DARK_HIGH_CONTRAST = {"name": "Dark High Contrast", "file_name": "hc_black.json", "type": "hc"}
-
-
 def _loads_jsonc(json_text: str) -> dict:
     """wrapper of json.loads() to load jsonc(json with comment) text.
     Allow comment and trailing commas(inside dictionaries or lists).
@@ -81,16 +75,38 @@ def _loads_jsonc(json_text: str) -> dict:
     return json.loads(result)
 
 
-def _merge_colors_to_default(colors: dict[str, str], type: str) -> dict[str, Optional[Color]]:
+def _setup_color_registry() -> None:
+    """Register the default colors of VS Code. They are registered on first use to keep the import light."""
+    global _color_registry_ready
+    with _color_registry_lock:
+        if not _color_registry_ready:
+            from qtvscodestyle.vscode.color_registry import setup_default_color_registry
+
+            setup_default_color_registry()
+            _color_registry_ready = True
+
+
+def _create_color_registry(colors: dict[str, str], type: str) -> ColorRegistry:
+    _setup_color_registry()
     color_registry = ColorRegistry()
     for id, color in colors.items():
         color_registry.register_color(id, color, type)
-    colors_merged = color_registry.get_colors(type)
+    return color_registry
+
+
+def _merge_colors_to_default(colors: dict[str, str], type: str) -> dict[str, Optional[Color]]:
+    colors_merged = _create_color_registry(colors, type).get_colors(type)
     return colors_merged
 
 
+def _merge_theme_colors(theme_property: dict, custom_colors: dict[str, str] = {}) -> dict[str, Optional[Color]]:
+    """Resolve the colors of the theme with the custom colors over them and the defaults for the missing ids."""
+    return _merge_colors_to_default({**theme_property["colors"], **custom_colors}, theme_property["type"])
+
+
 def _apply_application_patches(colors: dict[str, Optional[Color]]) -> None:
     from qtvscodestyle.qtpy import __version__
+    from qtvscodestyle.qtpy.qt_compat import QtImportError
 
     BASE_LOG_MESSAGE = "Failed to apply the placeholder color for various text input widgets."
 
@@ -101,7 +117,7 @@ def _apply_application_patches(colors: dict[str, Optional[Color]]) -> None:
         _logger.warning(BASE_LOG_MESSAGE)
         return
     if __version__ is not None:
-        if StrictVersion(__version__) >= StrictVersion("6.0"):
+        if parse_version(__version__) >= parse_version("6.0"):
             _logger.info("In qt6, placeholder color for various text input widgets is not applied due to a bug.")
             return
 
@@ -125,16 +141,14 @@ def _apply_application_patches(colors: dict[str, Optional[Color]]) -> None:
             + f"\n\tRequires Qt5.12 or higher to apply placeholder color. Current version is Qt{__version__}"
         )
         return
+    # Setting the palette of the application repolishes all widgets, even if it is not changed.
+    if palette.color(placeholder_color_role) == placeholder_q_color:
+        return
     palette.setColor(placeholder_color_role, placeholder_q_color)
     app.setPalette(palette)
 
 
-def _load_stylesheet(
-    theme: Union[Theme, str, Path, dict],
-    custom_colors: dict[str, str],
-    output_svg_path: Path,
-    is_designer: bool = False,
-) -> str:
+def _load_theme_property(theme: Union[Theme, str, Path, dict]) -> dict:
     if type(theme) is Theme:
         theme_file_name = theme.value["file_name"]
         json_text = resources.read_text("qtvscodestyle.vscode.theme", theme_file_name)
@@ -147,36 +161,402 @@ def _load_stylesheet(
         theme_property = theme
     else:
         raise TypeError("Invalid type input to theme argument. ")
+    return theme_property
 
-    colors = {**theme_property["colors"], **custom_colors}
-    colors = _merge_colors_to_default(colors, theme_property["type"])
-    global_current_colors.clear()
-    global_current_colors.update(colors)
 
-    try:
-        from qtvscodestyle.q_icon import global_icon_engine_map
+def _resolve_colors(theme: Union[Theme, str, Path, dict], custom_colors: dict[str, str]) -> dict[str, Optional[Color]]:
+    return _merge_theme_colors(_load_theme_property(theme), custom_colors)
 
-        for id, engines in global_icon_engine_map.items():
-            for engine in engines:
-                color = colors[id]
-                engine.change_color(Color.white() if color is None else color)
-    except QtImportError:
-        pass
+
+def _theme_source(theme: Union[Theme, str, Path, dict]) -> str:
+    """Return the text which identifies the theme. It is used for the key of the stylesheet cache."""
+    if type(theme) is Theme:
+        json_text = resources.read_text("qtvscodestyle.vscode.theme", theme.value["file_name"])
+        return theme.value["type"] + json_text
+    elif type(theme) is str or type(theme) is Path:
+        return Path(theme).read_text()
+    elif type(theme) is dict:
+        return json.dumps(theme, sort_keys=True)
+    raise TypeError("Invalid type input to theme argument. ")
+
+
+def _build(
+    theme_property: dict,
+    custom_colors: dict[str, str],
+    output_svg_path: Path,
+    is_designer: bool = False,
+    qt_version: Optional[str] = None,
+    minify: bool = False,
+) -> tuple[str, dict[str, Optional[Color]]]:
+    colors = _merge_theme_colors(theme_property, custom_colors)
+    stylesheet = build_stylesheet(colors, theme_property["type"], output_svg_path, is_designer, qt_version, minify)
+    return stylesheet, colors
+
+
+def _apply_colors(colors: dict[str, Optional[Color]]) -> None:
+    # Loading the same theme again returns the same colors from the memory cache. Then the icons are not recolored.
+    if colors != global_current_colors:
+        global_current_colors.clear()
+        global_current_colors.update(colors)
+
+        # Icons exist only if q_icon has been imported, so it is not imported here.
+        q_icon = sys.modules.get("qtvscodestyle.q_icon")
+        if q_icon is not None:
+            for id, engines in q_icon.global_icon_engine_map.items():
+                for engine in engines:
+                    color = colors[id]
+                    engine.change_color(Color.white() if color is None else color)
 
     _apply_application_patches(colors)
-    return build_stylesheet(colors, theme_property["type"], output_svg_path, is_designer)
+
+
+def set_resources_max_size(max_size: Optional[int]) -> None:
+    """Set the limit of the total size in bytes of the svg files in the resources dir.
+
+    While the size exceeds the limit, the least recently used svg files that no running process uses are removed.
+    None means no limit. The default is 4 MiB.
+    """
+    _resource_manager.max_size = max_size
+    _resource_manager.collect()
+
+
+def _create_shared_dirs(base_dir: Path) -> None:
+    # Let processes of other users write to the dirs. The sticky bit keeps them from removing each other's files.
+    for dir_path in (base_dir, base_dir / "resources", base_dir / "resources" / _RECORDS_DIR_NAME, base_dir / "cache"):
+        if dir_path.exists():
+            continue
+        dir_path.mkdir(parents=True, exist_ok=True)
+        try:
+            dir_path.chmod(0o1777)
+        except OSError:
+            pass
+
+
+def set_shared_dir(dir_path: Optional[Union[str, Path]]) -> None:
+    """Use the dir shared by all processes on the host instead of ``~/.q_vscode_style``. None restores the default.
+
+    Svg files are written to ``<dir_path>/resources`` and stylesheets are cached in ``<dir_path>/cache``.
+    Stylesheets are built under a file lock, so the first process builds each stylesheet and the other processes
+    wait for it and load it from the cache. Files are written atomically, so a partially written file is never read.
+    The environment variable ``QTVSCODESTYLE_SHARED_DIR`` sets the dir at the import.
+    Call this before loading stylesheets. The svg files already in use stay in the previous dir.
+    """
+    global _RESOURCES_BASE_DIR, _CACHE_DIR, _resource_manager, _stylesheet_cache, _shared
+    _shared = dir_path is not None
+    base_dir = _DEFAULT_DIR if dir_path is None else Path(dir_path)
+    if _shared:
+        try:
+            _create_shared_dirs(base_dir)
+        except OSError as e:
+            _logger.warning(f"Failed to create the shared dir '{base_dir}'. {e}")
+    _RESOURCES_BASE_DIR = base_dir / "resources"
+    _CACHE_DIR = base_dir / "cache"
+    _resource_manager = ResourceManager(_RESOURCES_BASE_DIR, _resource_manager.max_size)
+    _stylesheet_cache = StylesheetCache(_CACHE_DIR)
+
+
+if os.environ.get(_SHARED_DIR_ENV):
+    set_shared_dir(os.environ[_SHARED_DIR_ENV])
 
 
 def load_stylesheet_for_designer(theme: Theme, custom_colors: dict[str, str], resource_folder_path: Path) -> str:
-    return _load_stylesheet(theme, custom_colors, resource_folder_path, True)
+    stylesheet, colors = _build(_load_theme_property(theme), custom_colors, resource_folder_path, True)
+    _apply_colors(colors)
+    return stylesheet
+
+
+def _prune_class_names(prune: Union[bool, Iterable[str]]) -> Optional[set[str]]:
+    """Return the class names to prune the stylesheet for, or None not to prune. Call this in the main thread."""
+    if prune is True:
+        return get_application_class_names()
+    return expand_class_names(prune) if prune else None  # type: ignore
+
 
+def _prune(stylesheet: str, class_names: set[str]) -> str:
+    with stage("prune"):
+        stylesheet, stats = prune_stylesheet(stylesheet, class_names)
+    report = current_report()
+    if report is not None:
+        report.prune = stats
+    return stylesheet
+
+
+def _cache_key(
+    theme: Union[Theme, str, Path, dict],
+    custom_colors: dict[str, str],
+    qt_version: str,
+    minify: bool,
+    in_memory: bool = False,
+) -> str:
+    from qtvscodestyle import __version__
+
+    return hash_key(
+        __version__,
+        template_digest(),
+        _theme_source(theme),
+        json.dumps(custom_colors, sort_keys=True),
+        qt_version,
+        str(minify),
+        str(in_memory),
+    )
+
+
+def _theme_name(theme: Union[Theme, str, Path, dict]) -> str:
+    if type(theme) is Theme:
+        return theme.value["name"]
+    elif type(theme) is dict:
+        return theme.get("name", "custom theme")
+    return str(theme)
+
+
+def _cache_hit(entry: Optional[CacheEntry], cache: str) -> Optional[CacheEntry]:
+    report = current_report()
+    if report is not None and entry is not None:
+        report.cache = cache
+    return entry
+
+
+def _load_precompiled(key: str, theme: Theme, qt_version: str, minify: bool, in_memory: bool) -> Optional[CacheEntry]:
+    entry = load_precompiled(theme.name, qt_version, _RESOURCES_BASE_DIR, in_memory)
+    if entry is None:
+        return None
+    if minify:
+        entry = minify_stylesheet(entry[0]), entry[1]
+    # The precompiled bundle is faster to read than the persisted cache, so it is kept only in memory.
+    _stylesheet_cache.put(key, *entry, persist=False)
+    return entry
+
+
+def _load_entry(
+    theme: Union[Theme, str, Path, dict],
+    custom_colors: dict[str, str],
+    minify: bool,
+    in_memory: bool,
+    cancelled: Callable[[], bool] = lambda: False,
+    class_names: Optional[set[str]] = None,
+) -> Optional[tuple[CacheEntry, str]]:
+    """Load the stylesheet and colors from the caches, or build them. The colors are not applied.
+
+    Return the entry and the stylesheet pruned for ``class_names``, which is the stylesheet itself if it is None.
+    This does not use Qt except the in-memory resource, so it can run on a worker thread.
+    ``cancelled`` is checked between the build steps. If it returns True, return None.
+    """
+    with build_report(_theme_name(theme)) as report:
+        entry = _find_entry(theme, custom_colors, minify, in_memory, cancelled)
+        if entry is None:
+            return None
+        stylesheet = entry[0] if class_names is None else _prune(entry[0], class_names)
+        if report is not None:
+            report.finish(stylesheet)
+    return entry, stylesheet
+
+
+def _find_entry(
+    theme: Union[Theme, str, Path, dict],
+    custom_colors: dict[str, str],
+    minify: bool,
+    in_memory: bool,
+    cancelled: Callable[[], bool],
+) -> Optional[CacheEntry]:
+    qt_version = _get_qt_version()
+    with stage("cache"):
+        key = _cache_key(theme, custom_colors, qt_version, minify, in_memory)
+        entry = _cache_hit(_stylesheet_cache.get(key, load_persisted=False), "memory")
+    if entry is None and type(theme) is Theme and not custom_colors:
+        with stage("precompiled"):
+            entry = _cache_hit(_load_precompiled(key, theme, qt_version, minify, in_memory), "precompiled")
+    if entry is None and not in_memory:
+        with stage("cache"):
+            entry = _cache_hit(_stylesheet_cache.get(key), "disk")
+    if entry is not None:
+        return entry
+
+    if not _shared or in_memory:
+        return _build_entry(key, theme, custom_colors, qt_version, minify, in_memory, cancelled)
+    # Only one process builds the stylesheet. The others wait for it and load the stylesheet it cached.
+    with file_lock(_CACHE_DIR / f"{key}.lock", remove=True):
+        with stage("cache"):
+            entry = _cache_hit(_stylesheet_cache.get(key), "disk")
+        if entry is None:
+            entry = _build_entry(key, theme, custom_colors, qt_version, minify, in_memory, cancelled)
+    return entry
+
+
+def _build_entry(
+    key: str,
+    theme: Union[Theme, str, Path, dict],
+    custom_colors: dict[str, str],
+    qt_version: str,
+    minify: bool,
+    in_memory: bool,
+    cancelled: Callable[[], bool],
+) -> Optional[CacheEntry]:
+    with stage("parse_theme"):
+        theme_property = _load_theme_property(theme)
+    if cancelled():
+        return None
+    with stage("resolve_colors"):
+        colors = _merge_theme_colors(theme_property, custom_colors)
+    if cancelled():
+        return None
+    stylesheet = build_stylesheet(
+        colors, theme_property["type"], _RESOURCES_BASE_DIR, False, qt_version, minify, in_memory
+    )
+    with stage("cache_write"):
+        _stylesheet_cache.put(key, stylesheet, colors, persist=not in_memory)
+    return stylesheet, colors
+
+
+def load_stylesheet(
+    theme: Union[Theme, str, Path, dict] = Theme.DARK_VS,
+    custom_colors: dict[str, str] = {},
+    prune: Union[bool, Iterable[str]] = False,
+    minify: bool = False,
+    in_memory: bool = False,
+) -> str:
+    """Load the style sheet which used by vscode.
+
+    Built stylesheets are cached in memory and under ``~/.q_vscode_style/cache``, or the dir set by set_shared_dir.
+    The 64 most recently used stylesheets are kept on the disk.
+    The bundled themes without custom colors are loaded from the precompiled stylesheets if they exist.
+    See ``python -m qtvscodestyle.precompile --help``.
+
+    If ``in_memory`` is True, svg files are registered as an in-memory Qt resource and referred by ``:/`` urls,
+    and nothing is written to the disk. The stylesheet is cached only in memory.
+
+    If ``minify`` is True, comments and redundant whitespace are removed and numbers and colors are shortened.
+
+    If ``prune`` is True, rules whose selectors cannot match any widget class in the QApplication are removed.
+    A list of class names can be given instead. Widgets of other classes created later are not styled.
+    """
+    (stylesheet, colors), pruned = _load_entry(  # type: ignore
+        theme, custom_colors, minify, in_memory, class_names=_prune_class_names(prune)
+    )
+    _resource_manager.use(load_stylesheet, stylesheet)
+    _apply_colors(colors)
+    return pruned
+
+
+def _build_for_batch(
+    theme: Union[Theme, str, Path], custom_colors: dict[str, str], qt_version: str, minify: bool, resources_dir: Path
+) -> tuple[str, dict[str, Optional[list[float]]], dict[str, str]]:
+    # Run in worker processes. Svg files are returned instead of being written, so the parent writes each file once.
+    theme_property = _load_theme_property(theme)
+    colors = _merge_theme_colors(theme_property, custom_colors)
+    renderer = StylesheetRenderer(theme_property["type"], resources_dir, qt_version=qt_version, collect_svg=True)
+    stylesheet = renderer.render(colors)
+    if minify:
+        stylesheet = minify_stylesheet(stylesheet)
+    return stylesheet, encode_colors(colors), renderer.svg_codes
+
+
+def build_all_stylesheets(
+    themes: Iterable[Union[Theme, str, Path]] = tuple(Theme),
+    custom_color_sets: Optional[dict[str, dict[str, str]]] = None,
+    workers: Optional[int] = None,
+    minify: bool = False,
+) -> dict[tuple[Union[Theme, str, Path], Optional[str]], str]:
+    """Build the stylesheets of all combinations of the themes and custom color sets in worker processes.
+
+    ``custom_color_sets`` is the dict of {name: custom colors}. If it is None, the themes are built without custom
+    colors. ``workers`` is the number of processes. The default is the number of CPUs.
+
+    Returns the dict of {(theme, name of custom color set): stylesheet}. The name is None without custom color sets.
+    The stylesheets are cached as load_stylesheet does, so loading them with load_stylesheet is a cache hit.
+    Unlike load_stylesheet, the colors of icons and the application are not changed.
+    """
+    qt_version = _get_qt_version()
+    color_sets: dict[Optional[str], dict[str, str]] = {None: {}} if custom_color_sets is None else custom_color_sets
+    stylesheets, jobs = {}, {}
+    for theme in themes:
+        for name, custom_colors in color_sets.items():
+            key = _cache_key(theme, custom_colors, qt_version, minify)
+            entry = _stylesheet_cache.get(key)
+            if entry is None:
+                jobs[(theme, name)] = key
+            else:
+                stylesheets[(theme, name)] = entry[0]
+
+    args = (
+        [theme for theme, _ in jobs],
+        [color_sets[name] for _, name in jobs],
+        itertools.repeat(qt_version),
+        itertools.repeat(minify),
+        itertools.repeat(_RESOURCES_BASE_DIR),  # Workers do not inherit the dir set by set_shared_dir().
+    )
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers == 1 or len(jobs) <= 1:
+        results = list(map(_build_for_batch, *args))
+    else:
+        # A build takes only tens of milliseconds, so jobs are sent in chunks to reduce the overhead.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as executor:
+            results = list(executor.map(_build_for_batch, *args, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    # Identical svg files have the same name, so each file is written once.
+    svg_codes: dict[str, str] = {}
+    for _, _, codes in results:
+        svg_codes.update(codes)
+    output_svg_codes(svg_codes, _RESOURCES_BASE_DIR)
+    for (job, key), (stylesheet, colors, _) in zip(jobs.items(), results):
+        _stylesheet_cache.put(key, stylesheet, decode_colors(colors))
+        stylesheets[job] = stylesheet
+    return stylesheets
+
+
+class StylesheetBuilder:
+    """Build the stylesheet of a theme and rebuild it incrementally when only the custom colors change.
+
+    When the custom colors are updated, only the colors that depend on the changed color ids (directly or through
+    color transforms) are resolved again, and only the stylesheet slots and svg files that refer to them are
+    updated.
+
+    If ``in_memory`` is True, svg files are registered as an in-memory Qt resource. See ``load_stylesheet``.
+    """
 
-def load_stylesheet(theme: Union[Theme, str, Path, dict] = Theme.DARK_VS, custom_colors: dict[str, str] = {}) -> str:
-    """Load the style sheet which used by vscode."""
-    global _temp_dir  # Set to global value the temporary directory so that it is not cached.
-    _temp_dir = TemporaryDirectory(prefix="temp", dir=str(_RESOURCES_BASE_DIR))
-    temp_dir_path = Path(_temp_dir.name)
-    return _load_stylesheet(theme, custom_colors, temp_dir_path)
+    def __init__(
+        self,
+        theme: Union[Theme, str, Path, dict] = Theme.DARK_VS,
+        custom_colors: dict[str, str] = {},
+        in_memory: bool = False,
+    ):
+        theme_property = _load_theme_property(theme)
+        self._theme_colors: dict[str, str] = theme_property["colors"]
+        self._type: str = theme_property["type"]
+        self._color_inputs = {**self._theme_colors, **custom_colors}
+        self._colors = _merge_colors_to_default(self._color_inputs, self._type)
+        self._renderer = StylesheetRenderer(self._type, _RESOURCES_BASE_DIR, in_memory=in_memory)
+        self._stylesheet = self._renderer.render(self._colors)
+        _resource_manager.use(id(self), self._stylesheet)
+        # Release the svg files when the builder is deleted.
+        weakref.finalize(self, _resource_manager.use, id(self), "")
+        _apply_colors(self._colors)
+
+    @property
+    def stylesheet(self) -> str:
+        return self._stylesheet
+
+    def update_custom_colors(self, custom_colors: dict[str, str]) -> str:
+        """Replace the custom colors and return the updated stylesheet."""
+        color_inputs = {**self._theme_colors, **custom_colors}
+        changed_ids = {
+            id
+            for id in self._color_inputs.keys() | color_inputs.keys()
+            if self._color_inputs.get(id) != color_inputs.get(id)
+        }
+        self._color_inputs = color_inputs
+        if not changed_ids:
+            return self._stylesheet
+
+        color_registry = _create_color_registry(color_inputs, self._type)
+        affected_ids = color_registry.get_dependents(changed_ids, self._type)
+        colors = color_registry.get_colors(self._type, affected_ids)
+        self._colors.update(colors)
+        self._stylesheet = self._renderer.update(colors)
+        _resource_manager.use(id(self), self._stylesheet)
+        _apply_colors(self._colors)
+        return self._stylesheet
 
 
 def loads_stylesheet(theme_text: str, custom_colors: dict[str, str] = {}) -> str:
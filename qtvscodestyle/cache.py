@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from qtvscodestyle.util import create_logger, write_text_atomic
+from qtvscodestyle.vscode.color import RGBA, Color
+
+_logger = create_logger(__name__)
+
+_STYLESHEET_FILE_NAME = "stylesheet.qss"
+_COLORS_FILE_NAME = "colors.json"
+
+CacheEntry = Tuple[str, Dict[str, Optional[Color]]]  # (stylesheet, colors)
+
+# Persisted entries are about 50 KB each.
+_MAX_PERSISTED_ENTRIES = 64
+
+
+def encode_colors(colors: dict[str, Optional[Color]]) -> dict[str, Optional[list[float]]]:
+    """Convert the colors to a json serializable dict."""
+    return {id: None if color is None else list(color.rgba) for id, color in colors.items()}
+
+
+def decode_colors(colors: dict[str, Optional[list[float]]]) -> dict[str, Optional[Color]]:
+    return {id: None if rgba is None else Color(RGBA(*rgba)) for id, rgba in colors.items()}
+
+
+def _svg_paths(stylesheet: str) -> tuple[str, ...]:
+    """Return the paths of the svg files that the stylesheet refers to. In-memory resources are not files."""
+    return tuple({path: None for path in re.findall(r"url\((.+?)\)", stylesheet) if not path.startswith(":")})
+
+
+def _files_exist(paths: tuple[str, ...]) -> bool:
+    return all(os.path.exists(path) for path in paths)
+
+
+class StylesheetCache:
+    """Two-tier cache of built stylesheets.
+
+    Entries are kept in an in-process LRU and persisted under ``dir_path/<key>``.
+    A persisted entry holds the stylesheet and the resolved colors, so a hit needs neither color resolution
+    nor svg output. An entry whose svg files have been removed, e.g. evicted by ResourceManager of any process, is
+    regarded as not cached.
+    The persisted entries are removed in least recently used order while there are more than ``max_entries``, e.g.
+    one for each custom colors that a settings dialog tried. None means no limit.
+    The cache can be used from multiple threads.
+    """
+
+    def __init__(self, dir_path: Path, maxsize: int = 16, max_entries: Optional[int] = _MAX_PERSISTED_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._dir_path = dir_path
+        self._maxsize = maxsize
+        self._memory: OrderedDict[str, tuple[CacheEntry, tuple[str, ...]]] = OrderedDict()  # {key: (entry, paths)}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, load_persisted: bool = True) -> Optional[CacheEntry]:
+        """Return the cached entry. If ``load_persisted`` is False, only the in-process cache is looked up."""
+        with self._lock:
+            entry, paths = self._memory.get(key, (None, ()))
+            if entry is not None and _files_exist(paths):
+                self._memory.move_to_end(key)
+                return entry
+            self._memory.pop(key, None)
+        if not load_persisted:
+            return None
+
+        path = self._dir_path / key
+        try:
+            stylesheet = (path / _STYLESHEET_FILE_NAME).read_text(encoding="utf-8")
+            colors = decode_colors(json.loads((path / _COLORS_FILE_NAME).read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            _logger.warning(f"Ignore the broken stylesheet cache at '{path}'. {e}")
+            return None
+        paths = _svg_paths(stylesheet)
+        if not _files_exist(paths):
+            return None
+        try:
+            os.utime(path / _STYLESHEET_FILE_NAME)  # The modification time is the last use time for the eviction.
+        except OSError:  # An entry of another user in a shared dir.
+            pass
+        self._remember(key, (stylesheet, colors), paths)
+        return stylesheet, colors
+
+    def put(self, key: str, stylesheet: str, colors: dict[str, Optional[Color]], persist: bool = True) -> None:
+        self._remember(key, (stylesheet, colors), _svg_paths(stylesheet))
+        if not persist:
+            return
+        path = self._dir_path / key
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            # The stylesheet is written last. An entry without it is regarded as not cached.
+            write_text_atomic(path / _COLORS_FILE_NAME, json.dumps(encode_colors(colors)))
+            write_text_atomic(path / _STYLESHEET_FILE_NAME, stylesheet)
+        except OSError as e:
+            _logger.warning(f"Failed to save the stylesheet cache to '{path}'. {e}")
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        """Clear the in-process cache. Persisted entries are kept."""
+        with self._lock:
+            self._memory.clear()
+
+    def _evict(self) -> None:
+        """Remove the least recently used persisted entries over ``max_entries``."""
+        if self.max_entries is None:
+            return
+        entries = []
+        try:
+            with os.scandir(self._dir_path) as dir_entries:
+                for dir_entry in dir_entries:
+                    if not dir_entry.is_dir():
+                        continue
+                    try:
+                        mtime = os.stat(os.path.join(dir_entry.path, _STYLESHEET_FILE_NAME)).st_mtime
+                    except FileNotFoundError:  # Being written by another process, or broken.
+                        mtime = dir_entry.stat().st_mtime
+                    entries.append((mtime, dir_entry.path))
+        except OSError as e:
+            _logger.warning(f"Failed to clean up the stylesheet cache at '{self._dir_path}'. {e}")
+            return
+        entries.sort()
+        for _, path in entries[: max(0, len(entries) - self.max_entries)]:
+            # Readers regard an entry removed under them as not cached. Entries of other users in a shared dir fail.
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _remember(self, key: str, entry: CacheEntry, paths: tuple[str, ...]) -> None:
+        with self._lock:
+            self._memory[key] = entry, paths
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._maxsize:
+                self._memory.popitem(last=False)
@@ -1,2004 +1,2135 @@
-from enum import Enum
+"""Identifiers of the VS Code and Font Awesome icons.
 
+The icons are listed in tables of "NAME VALUE" lines instead of Enum classes, which cost hundreds of kilobytes and
+tens of milliseconds to build at import. Members are created on first access and behave like Enum members:
+``Vsc.ADD.name``, ``Vsc.ADD.value``, ``Vsc["ADD"]``, ``Vsc("add.svg")``, ``type(Vsc.ADD) is Vsc``, ``len(Vsc)`` and
+iteration in the order of the table.
+"""
 
-class Vsc(Enum):
-    ZOOM_OUT = "zoom-out.svg"
-    ZOOM_IN = "zoom-in.svg"
-    WORKSPACE_UNTRUSTED = "workspace-untrusted.svg"
-    WORKSPACE_UNKNOWN = "workspace-unknown.svg"
-    WORKSPACE_TRUSTED = "workspace-trusted.svg"
-    WORD_WRAP = "word-wrap.svg"
-    WINDOW = "window.svg"
-    WHOLE_WORD = "whole-word.svg"
-    WHITESPACE = "whitespace.svg"
-    WATCH = "watch.svg"
-    WARNING = "warning.svg"
-    WAND = "wand.svg"
-    VM = "vm.svg"
-    VM_RUNNING = "vm-running.svg"
-    VM_OUTLINE = "vm-outline.svg"
-    VM_CONNECT = "vm-connect.svg"
-    VM_ACTIVE = "vm-active.svg"
-    VERSIONS = "versions.svg"
-    VERIFIED = "verified.svg"
-    VARIABLE_GROUP = "variable-group.svg"
-    UNVERIFIED = "unverified.svg"
-    UNMUTE = "unmute.svg"
-    UNLOCK = "unlock.svg"
-    UNGROUP_BY_REF_TYPE = "ungroup-by-ref-type.svg"
-    UNFOLD = "unfold.svg"
-    TYPE_HIERARCHY = "type-hierarchy.svg"
-    TYPE_HIERARCHY_SUPER = "type-hierarchy-super.svg"
-    TYPE_HIERARCHY_SUB = "type-hierarchy-sub.svg"
-    TWITTER = "twitter.svg"
-    TRIANGLE_UP = "triangle-up.svg"
-    TRIANGLE_RIGHT = "triangle-right.svg"
-    TRIANGLE_LEFT = "triangle-left.svg"
-    TRIANGLE_DOWN = "triangle-down.svg"
-    TRASH = "trash.svg"
-    TOOLS = "tools.svg"
-    THUMBSUP = "thumbsup.svg"
-    THUMBSDOWN = "thumbsdown.svg"
-    THREE_BARS = "three-bars.svg"
-    TEXT_SIZE = "text-size.svg"
-    TERMINAL = "terminal.svg"
-    TERMINAL_UBUNTU = "terminal-ubuntu.svg"
-    TERMINAL_TMUX = "terminal-tmux.svg"
-    TERMINAL_POWERSHELL = "terminal-powershell.svg"
-    TERMINAL_LINUX = "terminal-linux.svg"
-    TERMINAL_DEBIAN = "terminal-debian.svg"
-    TERMINAL_CMD = "terminal-cmd.svg"
-    TERMINAL_BASH = "terminal-bash.svg"
-    TELESCOPE = "telescope.svg"
-    TASKLIST = "tasklist.svg"
-    TAG = "tag.svg"
-    TABLE = "table.svg"
-    SYNC = "sync.svg"
-    SYNC_IGNORED = "sync-ignored.svg"
-    SYMBOL_VARIABLE = "symbol-variable.svg"
-    SYMBOL_STRUCTURE = "symbol-structure.svg"
-    SYMBOL_STRING = "symbol-string.svg"
-    SYMBOL_SNIPPET = "symbol-snippet.svg"
-    SYMBOL_RULER = "symbol-ruler.svg"
-    SYMBOL_PROPERTY = "symbol-property.svg"
-    SYMBOL_PARAMETER = "symbol-parameter.svg"
-    SYMBOL_OPERATOR = "symbol-operator.svg"
-    SYMBOL_NUMERIC = "symbol-numeric.svg"
-    SYMBOL_NAMESPACE = "symbol-namespace.svg"
-    SYMBOL_MISC = "symbol-misc.svg"
-    SYMBOL_METHOD = "symbol-method.svg"
-    SYMBOL_KEYWORD = "symbol-keyword.svg"
-    SYMBOL_KEY = "symbol-key.svg"
-    SYMBOL_INTERFACE = "symbol-interface.svg"
-    SYMBOL_FILE = "symbol-file.svg"
-    SYMBOL_FIELD = "symbol-field.svg"
-    SYMBOL_EVENT = "symbol-event.svg"
-    SYMBOL_ENUM = "symbol-enum.svg"
-    SYMBOL_ENUM_MEMBER = "symbol-enum-member.svg"
-    SYMBOL_CONSTANT = "symbol-constant.svg"
-    SYMBOL_COLOR = "symbol-color.svg"
-    SYMBOL_CLASS = "symbol-class.svg"
-    SYMBOL_BOOLEAN = "symbol-boolean.svg"
-    SYMBOL_ARRAY = "symbol-array.svg"
-    STOP_CIRCLE = "stop-circle.svg"
-    STAR_HALF = "star-half.svg"
-    STAR_FULL = "star-full.svg"
-    STAR_EMPTY = "star-empty.svg"
-    SQUIRREL = "squirrel.svg"
-    SPLIT_VERTICAL = "split-vertical.svg"
-    SPLIT_HORIZONTAL = "split-horizontal.svg"
-    SOURCE_CONTROL = "source-control.svg"
-    SORT_PRECEDENCE = "sort-precedence.svg"
-    SMILEY = "smiley.svg"
-    SIGN_OUT = "sign-out.svg"
-    SIGN_IN = "sign-in.svg"
-    SHIELD = "shield.svg"
-    SETTINGS = "settings.svg"
-    SETTINGS_GEAR = "settings-gear.svg"
-    SERVER = "server.svg"
-    SERVER_PROCESS = "server-process.svg"
-    SERVER_ENVIRONMENT = "server-environment.svg"
-    SEARCH = "search.svg"
-    SEARCH_STOP = "search-stop.svg"
-    SCREEN_NORMAL = "screen-normal.svg"
-    SCREEN_FULL = "screen-full.svg"
-    SAVE = "save.svg"
-    SAVE_AS = "save-as.svg"
-    SAVE_ALL = "save-all.svg"
-    RUN_ERRORS = "run-errors.svg"
-    RUN_BELOW = "run-below.svg"
-    RUN_ALL = "run-all.svg"
-    RUN_ABOVE = "run-above.svg"
-    RUBY = "ruby.svg"
-    RSS = "rss.svg"
-    ROOT_FOLDER = "root-folder.svg"
-    ROOT_FOLDER_OPENED = "root-folder-opened.svg"
-    ROCKET = "rocket.svg"
-    REQUEST_CHANGES = "request-changes.svg"
-    REPORT = "report.svg"
-    REPO = "repo.svg"
-    REPO_PUSH = "repo-push.svg"
-    REPO_PULL = "repo-pull.svg"
-    REPO_FORKED = "repo-forked.svg"
-    REPO_FORCE_PUSH = "repo-force-push.svg"
-    REPO_CLONE = "repo-clone.svg"
-    REPLY = "reply.svg"
-    REPLACE = "replace.svg"
-    REPLACE_ALL = "replace-all.svg"
-    REMOVE = "remove.svg"
-    REMOTE = "remote.svg"
-    REMOTE_EXPLORER = "remote-explorer.svg"
-    REGEX = "regex.svg"
-    REFRESH = "refresh.svg"
-    REFERENCES = "references.svg"
-    REDO = "redo.svg"
-    RECORD = "record.svg"
-    RECORD_KEYS = "record-keys.svg"
-    REACTIONS = "reactions.svg"
-    RADIO_TOWER = "radio-tower.svg"
-    QUOTE = "quote.svg"
-    QUESTION = "question.svg"
-    PULSE = "pulse.svg"
-    PROJECT = "project.svg"
-    PRIMITIVE_SQUARE = "primitive-square.svg"
-    PREVIEW = "preview.svg"
-    PRESERVE_CASE = "preserve-case.svg"
-    PLUG = "plug.svg"
-    PLAY = "play.svg"
-    PLAY_CIRCLE = "play-circle.svg"
-    PINNED = "pinned.svg"
-    PINNED_DIRTY = "pinned-dirty.svg"
-    PIN = "pin.svg"
-    PIE_CHART = "pie-chart.svg"
-    PERSON = "person.svg"
-    PERSON_ADD = "person-add.svg"
-    PASS = "pass.svg"
-    PASS_FILLED = "pass-filled.svg"
-    PAINTCAN = "paintcan.svg"
-    PACKAGE = "package.svg"
-    OUTPUT = "output.svg"
-    ORGANIZATION = "organization.svg"
-    OPEN_PREVIEW = "open-preview.svg"
-    OCTOFACE = "octoface.svg"
-    NOTEBOOK = "notebook.svg"
-    NOTEBOOK_TEMPLATE = "notebook-template.svg"
-    NOTE = "note.svg"
-    NO_NEWLINE = "no-newline.svg"
-    NEW_FOLDER = "new-folder.svg"
-    NEW_FILE = "new-file.svg"
-    MUTE = "mute.svg"
-    MULTIPLE_WINDOWS = "multiple-windows.svg"
-    MOVE = "move.svg"
-    MORTAR_BOARD = "mortar-board.svg"
-    MIRROR = "mirror.svg"
-    MILESTONE = "milestone.svg"
-    MERGE = "merge.svg"
-    MENU = "menu.svg"
-    MENTION = "mention.svg"
-    MEGAPHONE = "megaphone.svg"
-    MARKDOWN = "markdown.svg"
-    MAIL = "mail.svg"
-    MAIL_READ = "mail-read.svg"
-    MAGNET = "magnet.svg"
-    LOCK = "lock.svg"
-    LOCATION = "location.svg"
-    LOADING = "loading.svg"
-    LIVE_SHARE = "live-share.svg"
-    LIST_UNORDERED = "list-unordered.svg"
-    LIST_TREE = "list-tree.svg"
-    LIST_SELECTION = "list-selection.svg"
-    LIST_ORDERED = "list-ordered.svg"
-    LIST_FLAT = "list-flat.svg"
-    LIST_FILTER = "list-filter.svg"
-    LINK = "link.svg"
-    LINK_EXTERNAL = "link-external.svg"
-    LIGHTBULB = "lightbulb.svg"
-    LIGHTBULB_AUTOFIX = "lightbulb-autofix.svg"
-    LIBRARY = "library.svg"
-    LAYERS = "layers.svg"
-    LAYERS_DOT = "layers-dot.svg"
-    LAYERS_ACTIVE = "layers-active.svg"
-    LAW = "law.svg"
-    KEY = "key.svg"
-    KEBAB_VERTICAL = "kebab-vertical.svg"
-    JSON = "json.svg"
-    JERSEY = "jersey.svg"
-    ITALIC = "italic.svg"
-    ISSUES = "issues.svg"
-    ISSUE_REOPENED = "issue-reopened.svg"
-    ISSUE_DRAFT = "issue-draft.svg"
-    INSPECT = "inspect.svg"
-    INFO = "info.svg"
-    INBOX = "inbox.svg"
-    HUBOT = "hubot.svg"
-    HORIZONTAL_RULE = "horizontal-rule.svg"
-    HOME = "home.svg"
-    HISTORY = "history.svg"
-    HEART = "heart.svg"
-    GROUP_BY_REF_TYPE = "group-by-ref-type.svg"
-    GRIPPER = "gripper.svg"
-    GRAPH = "graph.svg"
-    GRAPH_SCATTER = "graph-scatter.svg"
-    GRAPH_LINE = "graph-line.svg"
-    GRAPH_LEFT = "graph-left.svg"
-    GRABBER = "grabber.svg"
-    GO_TO_FILE = "go-to-file.svg"
-    GLOBE = "globe.svg"
-    GITHUB = "github.svg"
-    GITHUB_INVERTED = "github-inverted.svg"
-    GITHUB_ALT = "github-alt.svg"
-    GITHUB_ACTION = "github-action.svg"
-    GIT_PULL_REQUEST = "git-pull-request.svg"
-    GIT_PULL_REQUEST_DRAFT = "git-pull-request-draft.svg"
-    GIT_PULL_REQUEST_CREATE = "git-pull-request-create.svg"
-    GIT_PULL_REQUEST_CLOSED = "git-pull-request-closed.svg"
-    GIT_MERGE = "git-merge.svg"
-    GIT_COMPARE = "git-compare.svg"
-    GIT_COMMIT = "git-commit.svg"
-    GIST = "gist.svg"
-    GIST_SECRET = "gist-secret.svg"
-    GIFT = "gift.svg"
-    GEAR = "gear.svg"
-    FOLDER = "folder.svg"
-    FOLDER_OPENED = "folder-opened.svg"
-    FOLDER_LIBRARY = "folder-library.svg"
-    FOLDER_ACTIVE = "folder-active.svg"
-    FOLD = "fold.svg"
-    FOLD_UP = "fold-up.svg"
-    FOLD_DOWN = "fold-down.svg"
-    FLAME = "flame.svg"
-    FILTER = "filter.svg"
-    FILTER_FILLED = "filter-filled.svg"
-    FILES = "files.svg"
-    FILE = "file.svg"
-    FILE_ZIP = "file-zip.svg"
-    FILE_SYMLINK_FILE = "file-symlink-file.svg"
-    FILE_SYMLINK_DIRECTORY = "file-symlink-directory.svg"
-    FILE_SUBMODULE = "file-submodule.svg"
-    FILE_PDF = "file-pdf.svg"
-    FILE_MEDIA = "file-media.svg"
-    FILE_CODE = "file-code.svg"
-    FILE_BINARY = "file-binary.svg"
-    FEEDBACK = "feedback.svg"
-    EYE = "eye.svg"
-    EYE_CLOSED = "eye-closed.svg"
-    EXTENSIONS = "extensions.svg"
-    EXPORT = "export.svg"
-    EXPAND_ALL = "expand-all.svg"
-    EXCLUDE = "exclude.svg"
-    ERROR = "error.svg"
-    EMPTY_WINDOW = "empty-window.svg"
-    ELLIPSIS = "ellipsis.svg"
-    EDITOR_LAYOUT = "editor-layout.svg"
-    EDIT = "edit.svg"
-    DISCARD = "discard.svg"
-    DIFF = "diff.svg"
-    DIFF_RENAMED = "diff-renamed.svg"
-    DIFF_REMOVED = "diff-removed.svg"
-    DIFF_MODIFIED = "diff-modified.svg"
-    DIFF_IGNORED = "diff-ignored.svg"
-    DIFF_ADDED = "diff-added.svg"
-    DEVICE_MOBILE = "device-mobile.svg"
-    DEVICE_CAMERA = "device-camera.svg"
-    DEVICE_CAMERA_VIDEO = "device-camera-video.svg"
-    DESKTOP_DOWNLOAD = "desktop-download.svg"
-    DEBUG = "debug.svg"
-    DEBUG_STOP = "debug-stop.svg"
-    DEBUG_STEP_OVER = "debug-step-over.svg"
-    DEBUG_STEP_OUT = "debug-step-out.svg"
-    DEBUG_STEP_INTO = "debug-step-into.svg"
-    DEBUG_STEP_BACK = "debug-step-back.svg"
-    DEBUG_START = "debug-start.svg"
-    DEBUG_STACKFRAME = "debug-stackframe.svg"
-    DEBUG_STACKFRAME_DOT = "debug-stackframe-dot.svg"
-    DEBUG_STACKFRAME_ACTIVE = "debug-stackframe-active.svg"
-    DEBUG_REVERSE_CONTINUE = "debug-reverse-continue.svg"
-    DEBUG_RESTART = "debug-restart.svg"
-    DEBUG_RESTART_FRAME = "debug-restart-frame.svg"
-    DEBUG_RERUN = "debug-rerun.svg"
-    DEBUG_PAUSE = "debug-pause.svg"
-    DEBUG_LINE_BY_LINE = "debug-line-by-line.svg"
-    DEBUG_DISCONNECT = "debug-disconnect.svg"
-    DEBUG_COVERAGE = "debug-coverage.svg"
-    DEBUG_CONTINUE = "debug-continue.svg"
-    DEBUG_CONTINUE_SMALL = "debug-continue-small.svg"
-    DEBUG_CONSOLE = "debug-console.svg"
-    DEBUG_BREAKPOINT_UNSUPPORTED = "debug-breakpoint-unsupported.svg"
-    DEBUG_BREAKPOINT_LOG = "debug-breakpoint-log.svg"
-    DEBUG_BREAKPOINT_LOG_UNVERIFIED = "debug-breakpoint-log-unverified.svg"
-    DEBUG_BREAKPOINT_FUNCTION = "debug-breakpoint-function.svg"
-    DEBUG_BREAKPOINT_FUNCTION_UNVERIFIED = "debug-breakpoint-function-unverified.svg"
-    DEBUG_BREAKPOINT_DATA = "debug-breakpoint-data.svg"
-    DEBUG_BREAKPOINT_DATA_UNVERIFIED = "debug-breakpoint-data-unverified.svg"
-    DEBUG_BREAKPOINT_CONDITIONAL = "debug-breakpoint-conditional.svg"
-    DEBUG_BREAKPOINT_CONDITIONAL_UNVERIFIED = "debug-breakpoint-conditional-unverified.svg"
-    DEBUG_ALT = "debug-alt.svg"
-    DEBUG_ALT_SMALL = "debug-alt-small.svg"
-    DEBUG_ALL = "debug-all.svg"
-    DATABASE = "database.svg"
-    DASHBOARD = "dashboard.svg"
-    DASH = "dash.svg"
-    CREDIT_CARD = "credit-card.svg"
-    COPY = "copy.svg"
-    COMPASS = "compass.svg"
-    COMPASS_DOT = "compass-dot.svg"
-    COMPASS_ACTIVE = "compass-active.svg"
-    COMMENT = "comment.svg"
-    COMMENT_DISCUSSION = "comment-discussion.svg"
-    COMBINE = "combine.svg"
-    COLOR_MODE = "color-mode.svg"
-    COLLAPSE_ALL = "collapse-all.svg"
-    CODE = "code.svg"
-    CLOUD = "cloud.svg"
-    CLOUD_UPLOAD = "cloud-upload.svg"
-    CLOUD_DOWNLOAD = "cloud-download.svg"
-    CLOSE = "close.svg"
-    CLOSE_ALL = "close-all.svg"
-    CLIPPY = "clippy.svg"
-    CLEAR_ALL = "clear-all.svg"
-    CIRCUIT_BOARD = "circuit-board.svg"
-    CIRCLE_SLASH = "circle-slash.svg"
-    CIRCLE_OUTLINE = "circle-outline.svg"
-    CIRCLE_LARGE_OUTLINE = "circle-large-outline.svg"
-    CIRCLE_LARGE_FILLED = "circle-large-filled.svg"
-    CIRCLE_FILLED = "circle-filled.svg"
-    CHROME_RESTORE = "chrome-restore.svg"
-    CHROME_MINIMIZE = "chrome-minimize.svg"
-    CHROME_MAXIMIZE = "chrome-maximize.svg"
-    CHROME_CLOSE = "chrome-close.svg"
-    CHEVRON_UP = "chevron-up.svg"
-    CHEVRON_RIGHT = "chevron-right.svg"
-    CHEVRON_LEFT = "chevron-left.svg"
-    CHEVRON_DOWN = "chevron-down.svg"
-    CHECKLIST = "checklist.svg"
-    CHECK = "check.svg"
-    CHECK_ALL = "check-all.svg"
-    CASE_SENSITIVE = "case-sensitive.svg"
-    CALL_OUTGOING = "call-outgoing.svg"
-    CALL_INCOMING = "call-incoming.svg"
-    CALENDAR = "calendar.svg"
-    BUG = "bug.svg"
-    BROWSER = "browser.svg"
-    BROADCAST = "broadcast.svg"
-    BRIEFCASE = "briefcase.svg"
-    BRACKET_ERROR = "bracket-error.svg"
-    BRACKET_DOT = "bracket-dot.svg"
-    BOOKMARK = "bookmark.svg"
-    BOOK = "book.svg"
-    BOLD = "bold.svg"
-    BELL = "bell.svg"
-    BELL_DOT = "bell-dot.svg"
-    BEAKER = "beaker.svg"
-    BEAKER_STOP = "beaker-stop.svg"
-    AZURE = "azure.svg"
-    ARROW_UP = "arrow-up.svg"
-    ARROW_SWAP = "arrow-swap.svg"
-    ARROW_SMALL_UP = "arrow-small-up.svg"
-    ARROW_SMALL_RIGHT = "arrow-small-right.svg"
-    ARROW_SMALL_LEFT = "arrow-small-left.svg"
-    ARROW_SMALL_DOWN = "arrow-small-down.svg"
-    ARROW_RIGHT = "arrow-right.svg"
-    ARROW_LEFT = "arrow-left.svg"
-    ARROW_DOWN = "arrow-down.svg"
-    ARROW_BOTH = "arrow-both.svg"
-    ARCHIVE = "archive.svg"
-    ADD = "add.svg"
-    ACTIVATE_BREAKPOINTS = "activate-breakpoints.svg"
-    ACCOUNT = "account.svg"
+from __future__ import annotations
 
+# threading takes longer to import than this module.
+from _thread import allocate_lock
 
-class FaSolid(Enum):
-    AD = 0xF641
-    ADDRESS_BOOK = 0xF2B9
-    ADDRESS_CARD = 0xF2BB
-    ADJUST = 0xF042
-    AIR_FRESHENER = 0xF5D0
-    ALIGN_CENTER = 0xF037
-    ALIGN_JUSTIFY = 0xF039
-    ALIGN_LEFT = 0xF036
-    ALIGN_RIGHT = 0xF038
-    ALLERGIES = 0xF461
-    AMBULANCE = 0xF0F9
-    AMERICAN_SIGN_LANGUAGE_INTERPRETING = 0xF2A3
-    ANCHOR = 0xF13D
-    ANGLE_DOUBLE_DOWN = 0xF103
-    ANGLE_DOUBLE_LEFT = 0xF100
-    ANGLE_DOUBLE_RIGHT = 0xF101
-    ANGLE_DOUBLE_UP = 0xF102
-    ANGLE_DOWN = 0xF107
-    ANGLE_LEFT = 0xF104
-    ANGLE_RIGHT = 0xF105
-    ANGLE_UP = 0xF106
-    ANGRY = 0xF556
-    ANKH = 0xF644
-    APPLE_ALT = 0xF5D1
-    ARCHIVE = 0xF187
-    ARCHWAY = 0xF557
-    ARROW_ALT_CIRCLE_DOWN = 0xF358
-    ARROW_ALT_CIRCLE_LEFT = 0xF359
-    ARROW_ALT_CIRCLE_RIGHT = 0xF35A
-    ARROW_ALT_CIRCLE_UP = 0xF35B
-    ARROW_CIRCLE_DOWN = 0xF0AB
-    ARROW_CIRCLE_LEFT = 0xF0A8
-    ARROW_CIRCLE_RIGHT = 0xF0A9
-    ARROW_CIRCLE_UP = 0xF0AA
-    ARROW_DOWN = 0xF063
-    ARROW_LEFT = 0xF060
-    ARROW_RIGHT = 0xF061
-    ARROW_UP = 0xF062
-    ARROWS_ALT = 0xF0B2
-    ARROWS_ALT_H = 0xF337
-    ARROWS_ALT_V = 0xF338
-    ASSISTIVE_LISTENING_SYSTEMS = 0xF2A2
-    ASTERISK = 0xF069
-    AT = 0xF1FA
-    ATLAS = 0xF558
-    ATOM = 0xF5D2
-    AUDIO_DESCRIPTION = 0xF29E
-    AWARD = 0xF559
-    BABY = 0xF77C
-    BABY_CARRIAGE = 0xF77D
-    BACKSPACE = 0xF55A
-    BACKWARD = 0xF04A
-    BACON = 0xF7E5
-    BACTERIA = 0xE059
-    BACTERIUM = 0xE05A
-    BAHAI = 0xF666
-    BALANCE_SCALE = 0xF24E
-    BALANCE_SCALE_LEFT = 0xF515
-    BALANCE_SCALE_RIGHT = 0xF516
-    BAN = 0xF05E
-    BAND_AID = 0xF462
-    BARCODE = 0xF02A
-    BARS = 0xF0C9
-    BASEBALL_BALL = 0xF433
-    BASKETBALL_BALL = 0xF434
-    BATH = 0xF2CD
-    BATTERY_EMPTY = 0xF244
-    BATTERY_FULL = 0xF240
-    BATTERY_HALF = 0xF242
-    BATTERY_QUARTER = 0xF243
-    BATTERY_THREE_QUARTERS = 0xF241
-    BED = 0xF236
-    BEER = 0xF0FC
-    BELL = 0xF0F3
-    BELL_SLASH = 0xF1F6
-    BEZIER_CURVE = 0xF55B
-    BIBLE = 0xF647
-    BICYCLE = 0xF206
-    BIKING = 0xF84A
-    BINOCULARS = 0xF1E5
-    BIOHAZARD = 0xF780
-    BIRTHDAY_CAKE = 0xF1FD
-    BLENDER = 0xF517
-    BLENDER_PHONE = 0xF6B6
-    BLIND = 0xF29D
-    BLOG = 0xF781
-    BOLD = 0xF032
-    BOLT = 0xF0E7
-    BOMB = 0xF1E2
-    BONE = 0xF5D7
-    BONG = 0xF55C
-    BOOK = 0xF02D
-    BOOK_DEAD = 0xF6B7
-    BOOK_MEDICAL = 0xF7E6
-    BOOK_OPEN = 0xF518
-    BOOK_READER = 0xF5DA
-    BOOKMARK = 0xF02E
-    BORDER_ALL = 0xF84C
-    BORDER_NONE = 0xF850
-    BORDER_STYLE = 0xF853
-    BOWLING_BALL = 0xF436
-    BOX = 0xF466
-    BOX_OPEN = 0xF49E
-    BOX_TISSUE = 0xE05B
-    BOXES = 0xF468
-    BRAILLE = 0xF2A1
-    BRAIN = 0xF5DC
-    BREAD_SLICE = 0xF7EC
-    BRIEFCASE = 0xF0B1
-    BRIEFCASE_MEDICAL = 0xF469
-    BROADCAST_TOWER = 0xF519
-    BROOM = 0xF51A
-    BRUSH = 0xF55D
-    BUG = 0xF188
-    BUILDING = 0xF1AD
-    BULLHORN = 0xF0A1
-    BULLSEYE = 0xF140
-    BURN = 0xF46A
-    BUS = 0xF207
-    BUS_ALT = 0xF55E
-    BUSINESS_TIME = 0xF64A
-    CALCULATOR = 0xF1EC
-    CALENDAR = 0xF133
-    CALENDAR_ALT = 0xF073
-    CALENDAR_CHECK = 0xF274
-    CALENDAR_DAY = 0xF783
-    CALENDAR_MINUS = 0xF272
-    CALENDAR_PLUS = 0xF271
-    CALENDAR_TIMES = 0xF273
-    CALENDAR_WEEK = 0xF784
-    CAMERA = 0xF030
-    CAMERA_RETRO = 0xF083
-    CAMPGROUND = 0xF6BB
-    CANDY_CANE = 0xF786
-    CANNABIS = 0xF55F
-    CAPSULES = 0xF46B
-    CAR = 0xF1B9
-    CAR_ALT = 0xF5DE
-    CAR_BATTERY = 0xF5DF
-    CAR_CRASH = 0xF5E1
-    CAR_SIDE = 0xF5E4
-    CARAVAN = 0xF8FF
-    CARET_DOWN = 0xF0D7
-    CARET_LEFT = 0xF0D9
-    CARET_RIGHT = 0xF0DA
-    CARET_SQUARE_DOWN = 0xF150
-    CARET_SQUARE_LEFT = 0xF191
-    CARET_SQUARE_RIGHT = 0xF152
-    CARET_SQUARE_UP = 0xF151
-    CARET_UP = 0xF0D8
-    CARROT = 0xF787
-    CART_ARROW_DOWN = 0xF218
-    CART_PLUS = 0xF217
-    CASH_REGISTER = 0xF788
-    CAT = 0xF6BE
-    CERTIFICATE = 0xF0A3
-    CHAIR = 0xF6C0
-    CHALKBOARD = 0xF51B
-    CHALKBOARD_TEACHER = 0xF51C
-    CHARGING_STATION = 0xF5E7
-    CHART_AREA = 0xF1FE
-    CHART_BAR = 0xF080
-    CHART_LINE = 0xF201
-    CHART_PIE = 0xF200
-    CHECK = 0xF00C
-    CHECK_CIRCLE = 0xF058
-    CHECK_DOUBLE = 0xF560
-    CHECK_SQUARE = 0xF14A
-    CHEESE = 0xF7EF
-    CHESS = 0xF439
-    CHESS_BISHOP = 0xF43A
-    CHESS_BOARD = 0xF43C
-    CHESS_KING = 0xF43F
-    CHESS_KNIGHT = 0xF441
-    CHESS_PAWN = 0xF443
-    CHESS_QUEEN = 0xF445
-    CHESS_ROOK = 0xF447
-    CHEVRON_CIRCLE_DOWN = 0xF13A
-    CHEVRON_CIRCLE_LEFT = 0xF137
-    CHEVRON_CIRCLE_RIGHT = 0xF138
-    CHEVRON_CIRCLE_UP = 0xF139
-    CHEVRON_DOWN = 0xF078
-    CHEVRON_LEFT = 0xF053
-    CHEVRON_RIGHT = 0xF054
-    CHEVRON_UP = 0xF077
-    CHILD = 0xF1AE
-    CHURCH = 0xF51D
-    CIRCLE = 0xF111
-    CIRCLE_NOTCH = 0xF1CE
-    CITY = 0xF64F
-    CLINIC_MEDICAL = 0xF7F2
-    CLIPBOARD = 0xF328
-    CLIPBOARD_CHECK = 0xF46C
-    CLIPBOARD_LIST = 0xF46D
-    CLOCK = 0xF017
-    CLONE = 0xF24D
-    CLOSED_CAPTIONING = 0xF20A
-    CLOUD = 0xF0C2
-    CLOUD_DOWNLOAD_ALT = 0xF381
-    CLOUD_MEATBALL = 0xF73B
-    CLOUD_MOON = 0xF6C3
-    CLOUD_MOON_RAIN = 0xF73C
-    CLOUD_RAIN = 0xF73D
-    CLOUD_SHOWERS_HEAVY = 0xF740
-    CLOUD_SUN = 0xF6C4
-    CLOUD_SUN_RAIN = 0xF743
-    CLOUD_UPLOAD_ALT = 0xF382
-    COCKTAIL = 0xF561
-    CODE = 0xF121
-    CODE_BRANCH = 0xF126
-    COFFEE = 0xF0F4
-    COG = 0xF013
-    COGS = 0xF085
-    COINS = 0xF51E
-    COLUMNS = 0xF0DB
-    COMMENT = 0xF075
-    COMMENT_ALT = 0xF27A
-    COMMENT_DOLLAR = 0xF651
-    COMMENT_DOTS = 0xF4AD
-    COMMENT_MEDICAL = 0xF7F5
-    COMMENT_SLASH = 0xF4B3
-    COMMENTS = 0xF086
-    COMMENTS_DOLLAR = 0xF653
-    COMPACT_DISC = 0xF51F
-    COMPASS = 0xF14E
-    COMPRESS = 0xF066
-    COMPRESS_ALT = 0xF422
-    COMPRESS_ARROWS_ALT = 0xF78C
-    CONCIERGE_BELL = 0xF562
-    COOKIE = 0xF563
-    COOKIE_BITE = 0xF564
-    COPY = 0xF0C5
-    COPYRIGHT = 0xF1F9
-    COUCH = 0xF4B8
-    CREDIT_CARD = 0xF09D
-    CROP = 0xF125
-    CROP_ALT = 0xF565
-    CROSS = 0xF654
-    CROSSHAIRS = 0xF05B
-    CROW = 0xF520
-    CROWN = 0xF521
-    CRUTCH = 0xF7F7
-    CUBE = 0xF1B2
-    CUBES = 0xF1B3
-    CUT = 0xF0C4
-    DATABASE = 0xF1C0
-    DEAF = 0xF2A4
-    DEMOCRAT = 0xF747
-    DESKTOP = 0xF108
-    DHARMACHAKRA = 0xF655
-    DIAGNOSES = 0xF470
-    DICE = 0xF522
-    DICE_D20 = 0xF6CF
-    DICE_D6 = 0xF6D1
-    DICE_FIVE = 0xF523
-    DICE_FOUR = 0xF524
-    DICE_ONE = 0xF525
-    DICE_SIX = 0xF526
-    DICE_THREE = 0xF527
-    DICE_TWO = 0xF528
-    DIGITAL_TACHOGRAPH = 0xF566
-    DIRECTIONS = 0xF5EB
-    DISEASE = 0xF7FA
-    DIVIDE = 0xF529
-    DIZZY = 0xF567
-    DNA = 0xF471
-    DOG = 0xF6D3
-    DOLLAR_SIGN = 0xF155
-    DOLLY = 0xF472
-    DOLLY_FLATBED = 0xF474
-    DONATE = 0xF4B9
-    DOOR_CLOSED = 0xF52A
-    DOOR_OPEN = 0xF52B
-    DOT_CIRCLE = 0xF192
-    DOVE = 0xF4BA
-    DOWNLOAD = 0xF019
-    DRAFTING_COMPASS = 0xF568
-    DRAGON = 0xF6D5
-    DRAW_POLYGON = 0xF5EE
-    DRUM = 0xF569
-    DRUM_STEELPAN = 0xF56A
-    DRUMSTICK_BITE = 0xF6D7
-    DUMBBELL = 0xF44B
-    DUMPSTER = 0xF793
-    DUMPSTER_FIRE = 0xF794
-    DUNGEON = 0xF6D9
-    EDIT = 0xF044
-    EGG = 0xF7FB
-    EJECT = 0xF052
-    ELLIPSIS_H = 0xF141
-    ELLIPSIS_V = 0xF142
-    ENVELOPE = 0xF0E0
-    ENVELOPE_OPEN = 0xF2B6
-    ENVELOPE_OPEN_TEXT = 0xF658
-    ENVELOPE_SQUARE = 0xF199
-    EQUALS = 0xF52C
-    ERASER = 0xF12D
-    ETHERNET = 0xF796
-    EURO_SIGN = 0xF153
-    EXCHANGE_ALT = 0xF362
-    EXCLAMATION = 0xF12A
-    EXCLAMATION_CIRCLE = 0xF06A
-    EXCLAMATION_TRIANGLE = 0xF071
-    EXPAND = 0xF065
-    EXPAND_ALT = 0xF424
-    EXPAND_ARROWS_ALT = 0xF31E
-    EXTERNAL_LINK_ALT = 0xF35D
-    EXTERNAL_LINK_SQUARE_ALT = 0xF360
-    EYE = 0xF06E
-    EYE_DROPPER = 0xF1FB
-    EYE_SLASH = 0xF070
-    FAN = 0xF863
-    FAST_BACKWARD = 0xF049
-    FAST_FORWARD = 0xF050
-    FAUCET = 0xE005
-    FAX = 0xF1AC
-    FEATHER = 0xF52D
-    FEATHER_ALT = 0xF56B
-    FEMALE = 0xF182
-    FIGHTER_JET = 0xF0FB
-    FILE = 0xF15B
-    FILE_ALT = 0xF15C
-    FILE_ARCHIVE = 0xF1C6
-    FILE_AUDIO = 0xF1C7
-    FILE_CODE = 0xF1C9
-    FILE_CONTRACT = 0xF56C
-    FILE_CSV = 0xF6DD
-    FILE_DOWNLOAD = 0xF56D
-    FILE_EXCEL = 0xF1C3
-    FILE_EXPORT = 0xF56E
-    FILE_IMAGE = 0xF1C5
-    FILE_IMPORT = 0xF56F
-    FILE_INVOICE = 0xF570
-    FILE_INVOICE_DOLLAR = 0xF571
-    FILE_MEDICAL = 0xF477
-    FILE_MEDICAL_ALT = 0xF478
-    FILE_PDF = 0xF1C1
-    FILE_POWERPOINT = 0xF1C4
-    FILE_PRESCRIPTION = 0xF572
-    FILE_SIGNATURE = 0xF573
-    FILE_UPLOAD = 0xF574
-    FILE_VIDEO = 0xF1C8
-    FILE_WORD = 0xF1C2
-    FILL = 0xF575
-    FILL_DRIP = 0xF576
-    FILM = 0xF008
-    FILTER = 0xF0B0
-    FINGERPRINT = 0xF577
-    FIRE = 0xF06D
-    FIRE_ALT = 0xF7E4
-    FIRE_EXTINGUISHER = 0xF134
-    FIRST_AID = 0xF479
-    FISH = 0xF578
-    FIST_RAISED = 0xF6DE
-    FLAG = 0xF024
-    FLAG_CHECKERED = 0xF11E
-    FLAG_USA = 0xF74D
-    FLASK = 0xF0C3
-    FLUSHED = 0xF579
-    FOLDER = 0xF07B
-    FOLDER_MINUS = 0xF65D
-    FOLDER_OPEN = 0xF07C
-    FOLDER_PLUS = 0xF65E
-    FONT = 0xF031
-    FOOTBALL_BALL = 0xF44E
-    FORWARD = 0xF04E
-    FROG = 0xF52E
-    FROWN = 0xF119
-    FROWN_OPEN = 0xF57A
-    FUNNEL_DOLLAR = 0xF662
-    FUTBOL = 0xF1E3
-    GAMEPAD = 0xF11B
-    GAS_PUMP = 0xF52F
-    GAVEL = 0xF0E3
-    GEM = 0xF3A5
-    GENDERLESS = 0xF22D
-    GHOST = 0xF6E2
-    GIFT = 0xF06B
-    GIFTS = 0xF79C
-    GLASS_CHEERS = 0xF79F
-    GLASS_MARTINI = 0xF000
-    GLASS_MARTINI_ALT = 0xF57B
-    GLASS_WHISKEY = 0xF7A0
-    GLASSES = 0xF530
-    GLOBE = 0xF0AC
-    GLOBE_AFRICA = 0xF57C
-    GLOBE_AMERICAS = 0xF57D
-    GLOBE_ASIA = 0xF57E
-    GLOBE_EUROPE = 0xF7A2
-    GOLF_BALL = 0xF450
-    GOPURAM = 0xF664
-    GRADUATION_CAP = 0xF19D
-    GREATER_THAN = 0xF531
-    GREATER_THAN_EQUAL = 0xF532
-    GRIMACE = 0xF57F
-    GRIN = 0xF580
-    GRIN_ALT = 0xF581
-    GRIN_BEAM = 0xF582
-    GRIN_BEAM_SWEAT = 0xF583
-    GRIN_HEARTS = 0xF584
-    GRIN_SQUINT = 0xF585
-    GRIN_SQUINT_TEARS = 0xF586
-    GRIN_STARS = 0xF587
-    GRIN_TEARS = 0xF588
-    GRIN_TONGUE = 0xF589
-    GRIN_TONGUE_SQUINT = 0xF58A
-    GRIN_TONGUE_WINK = 0xF58B
-    GRIN_WINK = 0xF58C
-    GRIP_HORIZONTAL = 0xF58D
-    GRIP_LINES = 0xF7A4
-    GRIP_LINES_VERTICAL = 0xF7A5
-    GRIP_VERTICAL = 0xF58E
-    GUITAR = 0xF7A6
-    H_SQUARE = 0xF0FD
-    HAMBURGER = 0xF805
-    HAMMER = 0xF6E3
-    HAMSA = 0xF665
-    HAND_HOLDING = 0xF4BD
-    HAND_HOLDING_HEART = 0xF4BE
-    HAND_HOLDING_MEDICAL = 0xE05C
-    HAND_HOLDING_USD = 0xF4C0
-    HAND_HOLDING_WATER = 0xF4C1
-    HAND_LIZARD = 0xF258
-    HAND_MIDDLE_FINGER = 0xF806
-    HAND_PAPER = 0xF256
-    HAND_PEACE = 0xF25B
-    HAND_POINT_DOWN = 0xF0A7
-    HAND_POINT_LEFT = 0xF0A5
-    HAND_POINT_RIGHT = 0xF0A4
-    HAND_POINT_UP = 0xF0A6
-    HAND_POINTER = 0xF25A
-    HAND_ROCK = 0xF255
-    HAND_SCISSORS = 0xF257
-    HAND_SPARKLES = 0xE05D
-    HAND_SPOCK = 0xF259
-    HANDS = 0xF4C2
-    HANDS_HELPING = 0xF4C4
-    HANDS_WASH = 0xE05E
-    HANDSHAKE = 0xF2B5
-    HANDSHAKE_ALT_SLASH = 0xE05F
-    HANDSHAKE_SLASH = 0xE060
-    HANUKIAH = 0xF6E6
-    HARD_HAT = 0xF807
-    HASHTAG = 0xF292
-    HAT_COWBOY = 0xF8C0
-    HAT_COWBOY_SIDE = 0xF8C1
-    HAT_WIZARD = 0xF6E8
-    HDD = 0xF0A0
-    HEAD_SIDE_COUGH = 0xE061
-    HEAD_SIDE_COUGH_SLASH = 0xE062
-    HEAD_SIDE_MASK = 0xE063
-    HEAD_SIDE_VIRUS = 0xE064
-    HEADING = 0xF1DC
-    HEADPHONES = 0xF025
-    HEADPHONES_ALT = 0xF58F
-    HEADSET = 0xF590
-    HEART = 0xF004
-    HEART_BROKEN = 0xF7A9
-    HEARTBEAT = 0xF21E
-    HELICOPTER = 0xF533
-    HIGHLIGHTER = 0xF591
-    HIKING = 0xF6EC
-    HIPPO = 0xF6ED
-    HISTORY = 0xF1DA
-    HOCKEY_PUCK = 0xF453
-    HOLLY_BERRY = 0xF7AA
-    HOME = 0xF015
-    HORSE = 0xF6F0
-    HORSE_HEAD = 0xF7AB
-    HOSPITAL = 0xF0F8
-    HOSPITAL_ALT = 0xF47D
-    HOSPITAL_SYMBOL = 0xF47E
-    HOSPITAL_USER = 0xF80D
-    HOT_TUB = 0xF593
-    HOTDOG = 0xF80F
-    HOTEL = 0xF594
-    HOURGLASS = 0xF254
-    HOURGLASS_END = 0xF253
-    HOURGLASS_HALF = 0xF252
-    HOURGLASS_START = 0xF251
-    HOUSE_DAMAGE = 0xF6F1
-    HOUSE_USER = 0xE065
-    HRYVNIA = 0xF6F2
-    I_CURSOR = 0xF246
-    ICE_CREAM = 0xF810
-    ICICLES = 0xF7AD
-    ICONS = 0xF86D
-    ID_BADGE = 0xF2C1
-    ID_CARD = 0xF2C2
-    ID_CARD_ALT = 0xF47F
-    IGLOO = 0xF7AE
-    IMAGE = 0xF03E
-    IMAGES = 0xF302
-    INBOX = 0xF01C
-    INDENT = 0xF03C
-    INDUSTRY = 0xF275
-    INFINITY = 0xF534
-    INFO = 0xF129
-    INFO_CIRCLE = 0xF05A
-    ITALIC = 0xF033
-    JEDI = 0xF669
-    JOINT = 0xF595
-    JOURNAL_WHILLS = 0xF66A
-    KAABA = 0xF66B
-    KEY = 0xF084
-    KEYBOARD = 0xF11C
-    KHANDA = 0xF66D
-    KISS = 0xF596
-    KISS_BEAM = 0xF597
-    KISS_WINK_HEART = 0xF598
-    KIWI_BIRD = 0xF535
-    LANDMARK = 0xF66F
-    LANGUAGE = 0xF1AB
-    LAPTOP = 0xF109
-    LAPTOP_CODE = 0xF5FC
-    LAPTOP_HOUSE = 0xE066
-    LAPTOP_MEDICAL = 0xF812
-    LAUGH = 0xF599
-    LAUGH_BEAM = 0xF59A
-    LAUGH_SQUINT = 0xF59B
-    LAUGH_WINK = 0xF59C
-    LAYER_GROUP = 0xF5FD
-    LEAF = 0xF06C
-    LEMON = 0xF094
-    LESS_THAN = 0xF536
-    LESS_THAN_EQUAL = 0xF537
-    LEVEL_DOWN_ALT = 0xF3BE
-    LEVEL_UP_ALT = 0xF3BF
-    LIFE_RING = 0xF1CD
-    LIGHTBULB = 0xF0EB
-    LINK = 0xF0C1
-    LIRA_SIGN = 0xF195
-    LIST = 0xF03A
-    LIST_ALT = 0xF022
-    LIST_OL = 0xF0CB
-    LIST_UL = 0xF0CA
-    LOCATION_ARROW = 0xF124
-    LOCK = 0xF023
-    LOCK_OPEN = 0xF3C1
-    LONG_ARROW_ALT_DOWN = 0xF309
-    LONG_ARROW_ALT_LEFT = 0xF30A
-    LONG_ARROW_ALT_RIGHT = 0xF30B
-    LONG_ARROW_ALT_UP = 0xF30C
-    LOW_VISION = 0xF2A8
-    LUGGAGE_CART = 0xF59D
-    LUNGS = 0xF604
-    LUNGS_VIRUS = 0xE067
-    MAGIC = 0xF0D0
-    MAGNET = 0xF076
-    MAIL_BULK = 0xF674
-    MALE = 0xF183
-    MAP = 0xF279
-    MAP_MARKED = 0xF59F
-    MAP_MARKED_ALT = 0xF5A0
-    MAP_MARKER = 0xF041
-    MAP_MARKER_ALT = 0xF3C5
-    MAP_PIN = 0xF276
-    MAP_SIGNS = 0xF277
-    MARKER = 0xF5A1
-    MARS = 0xF222
-    MARS_DOUBLE = 0xF227
-    MARS_STROKE = 0xF229
-    MARS_STROKE_H = 0xF22B
-    MARS_STROKE_V = 0xF22A
-    MASK = 0xF6FA
-    MEDAL = 0xF5A2
-    MEDKIT = 0xF0FA
-    MEH = 0xF11A
-    MEH_BLANK = 0xF5A4
-    MEH_ROLLING_EYES = 0xF5A5
-    MEMORY = 0xF538
-    MENORAH = 0xF676
-    MERCURY = 0xF223
-    METEOR = 0xF753
-    MICROCHIP = 0xF2DB
-    MICROPHONE = 0xF130
-    MICROPHONE_ALT = 0xF3C9
-    MICROPHONE_ALT_SLASH = 0xF539
-    MICROPHONE_SLASH = 0xF131
-    MICROSCOPE = 0xF610
-    MINUS = 0xF068
-    MINUS_CIRCLE = 0xF056
-    MINUS_SQUARE = 0xF146
-    MITTEN = 0xF7B5
-    MOBILE = 0xF10B
-    MOBILE_ALT = 0xF3CD
-    MONEY_BILL = 0xF0D6
-    MONEY_BILL_ALT = 0xF3D1
-    MONEY_BILL_WAVE = 0xF53A
-    MONEY_BILL_WAVE_ALT = 0xF53B
-    MONEY_CHECK = 0xF53C
-    MONEY_CHECK_ALT = 0xF53D
-    MONUMENT = 0xF5A6
-    MOON = 0xF186
-    MORTAR_PESTLE = 0xF5A7
-    MOSQUE = 0xF678
-    MOTORCYCLE = 0xF21C
-    MOUNTAIN = 0xF6FC
-    MOUSE = 0xF8CC
-    MOUSE_POINTER = 0xF245
-    MUG_HOT = 0xF7B6
-    MUSIC = 0xF001
-    NETWORK_WIRED = 0xF6FF
-    NEUTER = 0xF22C
-    NEWSPAPER = 0xF1EA
-    NOT_EQUAL = 0xF53E
-    NOTES_MEDICAL = 0xF481
-    OBJECT_GROUP = 0xF247
-    OBJECT_UNGROUP = 0xF248
-    OIL_CAN = 0xF613
-    OM = 0xF679
-    OTTER = 0xF700
-    OUTDENT = 0xF03B
-    PAGER = 0xF815
-    PAINT_BRUSH = 0xF1FC
-    PAINT_ROLLER = 0xF5AA
-    PALETTE = 0xF53F
-    PALLET = 0xF482
-    PAPER_PLANE = 0xF1D8
-    PAPERCLIP = 0xF0C6
-    PARACHUTE_BOX = 0xF4CD
-    PARAGRAPH = 0xF1DD
-    PARKING = 0xF540
-    PASSPORT = 0xF5AB
-    PASTAFARIANISM = 0xF67B
-    PASTE = 0xF0EA
-    PAUSE = 0xF04C
-    PAUSE_CIRCLE = 0xF28B
-    PAW = 0xF1B0
-    PEACE = 0xF67C
-    PEN = 0xF304
-    PEN_ALT = 0xF305
-    PEN_FANCY = 0xF5AC
-    PEN_NIB = 0xF5AD
-    PEN_SQUARE = 0xF14B
-    PENCIL_ALT = 0xF303
-    PENCIL_RULER = 0xF5AE
-    PEOPLE_ARROWS = 0xE068
-    PEOPLE_CARRY = 0xF4CE
-    PEPPER_HOT = 0xF816
-    PERCENT = 0xF295
-    PERCENTAGE = 0xF541
-    PERSON_BOOTH = 0xF756
-    PHONE = 0xF095
-    PHONE_ALT = 0xF879
-    PHONE_SLASH = 0xF3DD
-    PHONE_SQUARE = 0xF098
-    PHONE_SQUARE_ALT = 0xF87B
-    PHONE_VOLUME = 0xF2A0
-    PHOTO_VIDEO = 0xF87C
-    PIGGY_BANK = 0xF4D3
-    PILLS = 0xF484
-    PIZZA_SLICE = 0xF818
-    PLACE_OF_WORSHIP = 0xF67F
-    PLANE = 0xF072
-    PLANE_ARRIVAL = 0xF5AF
-    PLANE_DEPARTURE = 0xF5B0
-    PLANE_SLASH = 0xE069
-    PLAY = 0xF04B
-    PLAY_CIRCLE = 0xF144
-    PLUG = 0xF1E6
-    PLUS = 0xF067
-    PLUS_CIRCLE = 0xF055
-    PLUS_SQUARE = 0xF0FE
-    PODCAST = 0xF2CE
-    POLL = 0xF681
-    POLL_H = 0xF682
-    POO = 0xF2FE
-    POO_STORM = 0xF75A
-    POOP = 0xF619
-    PORTRAIT = 0xF3E0
-    POUND_SIGN = 0xF154
-    POWER_OFF = 0xF011
-    PRAY = 0xF683
-    PRAYING_HANDS = 0xF684
-    PRESCRIPTION = 0xF5B1
-    PRESCRIPTION_BOTTLE = 0xF485
-    PRESCRIPTION_BOTTLE_ALT = 0xF486
-    PRINT = 0xF02F
-    PROCEDURES = 0xF487
-    PROJECT_DIAGRAM = 0xF542
-    PUMP_MEDICAL = 0xE06A
-    PUMP_SOAP = 0xE06B
-    PUZZLE_PIECE = 0xF12E
-    QRCODE = 0xF029
-    QUESTION = 0xF128
-    QUESTION_CIRCLE = 0xF059
-    QUIDDITCH = 0xF458
-    QUOTE_LEFT = 0xF10D
-    QUOTE_RIGHT = 0xF10E
-    QURAN = 0xF687
-    RADIATION = 0xF7B9
-    RADIATION_ALT = 0xF7BA
-    RAINBOW = 0xF75B
-    RANDOM = 0xF074
-    RECEIPT = 0xF543
-    RECORD_VINYL = 0xF8D9
-    RECYCLE = 0xF1B8
-    REDO = 0xF01E
-    REDO_ALT = 0xF2F9
-    REGISTERED = 0xF25D
-    REMOVE_FORMAT = 0xF87D
-    REPLY = 0xF3E5
-    REPLY_ALL = 0xF122
-    REPUBLICAN = 0xF75E
-    RESTROOM = 0xF7BD
-    RETWEET = 0xF079
-    RIBBON = 0xF4D6
-    RING = 0xF70B
-    ROAD = 0xF018
-    ROBOT = 0xF544
-    ROCKET = 0xF135
-    ROUTE = 0xF4D7
-    RSS = 0xF09E
-    RSS_SQUARE = 0xF143
-    RUBLE_SIGN = 0xF158
-    RULER = 0xF545
-    RULER_COMBINED = 0xF546
-    RULER_HORIZONTAL = 0xF547
-    RULER_VERTICAL = 0xF548
-    RUNNING = 0xF70C
-    RUPEE_SIGN = 0xF156
-    SAD_CRY = 0xF5B3
-    SAD_TEAR = 0xF5B4
-    SATELLITE = 0xF7BF
-    SATELLITE_DISH = 0xF7C0
-    SAVE = 0xF0C7
-    SCHOOL = 0xF549
-    SCREWDRIVER = 0xF54A
-    SCROLL = 0xF70E
-    SD_CARD = 0xF7C2
-    SEARCH = 0xF002
-    SEARCH_DOLLAR = 0xF688
-    SEARCH_LOCATION = 0xF689
-    SEARCH_MINUS = 0xF010
-    SEARCH_PLUS = 0xF00E
-    SEEDLING = 0xF4D8
-    SERVER = 0xF233
-    SHAPES = 0xF61F
-    SHARE = 0xF064
-    SHARE_ALT = 0xF1E0
-    SHARE_ALT_SQUARE = 0xF1E1
-    SHARE_SQUARE = 0xF14D
-    SHEKEL_SIGN = 0xF20B
-    SHIELD_ALT = 0xF3ED
-    SHIELD_VIRUS = 0xE06C
-    SHIP = 0xF21A
-    SHIPPING_FAST = 0xF48B
-    SHOE_PRINTS = 0xF54B
-    SHOPPING_BAG = 0xF290
-    SHOPPING_BASKET = 0xF291
-    SHOPPING_CART = 0xF07A
-    SHOWER = 0xF2CC
-    SHUTTLE_VAN = 0xF5B6
-    SIGN = 0xF4D9
-    SIGN_IN_ALT = 0xF2F6
-    SIGN_LANGUAGE = 0xF2A7
-    SIGN_OUT_ALT = 0xF2F5
-    SIGNAL = 0xF012
-    SIGNATURE = 0xF5B7
-    SIM_CARD = 0xF7C4
-    SINK = 0xE06D
-    SITEMAP = 0xF0E8
-    SKATING = 0xF7C5
-    SKIING = 0xF7C9
-    SKIING_NORDIC = 0xF7CA
-    SKULL = 0xF54C
-    SKULL_CROSSBONES = 0xF714
-    SLASH = 0xF715
-    SLEIGH = 0xF7CC
-    SLIDERS_H = 0xF1DE
-    SMILE = 0xF118
-    SMILE_BEAM = 0xF5B8
-    SMILE_WINK = 0xF4DA
-    SMOG = 0xF75F
-    SMOKING = 0xF48D
-    SMOKING_BAN = 0xF54D
-    SMS = 0xF7CD
-    SNOWBOARDING = 0xF7CE
-    SNOWFLAKE = 0xF2DC
-    SNOWMAN = 0xF7D0
-    SNOWPLOW = 0xF7D2
-    SOAP = 0xE06E
-    SOCKS = 0xF696
-    SOLAR_PANEL = 0xF5BA
-    SORT = 0xF0DC
-    SORT_ALPHA_DOWN = 0xF15D
-    SORT_ALPHA_DOWN_ALT = 0xF881
-    SORT_ALPHA_UP = 0xF15E
-    SORT_ALPHA_UP_ALT = 0xF882
-    SORT_AMOUNT_DOWN = 0xF160
-    SORT_AMOUNT_DOWN_ALT = 0xF884
-    SORT_AMOUNT_UP = 0xF161
-    SORT_AMOUNT_UP_ALT = 0xF885
-    SORT_DOWN = 0xF0DD
-    SORT_NUMERIC_DOWN = 0xF162
-    SORT_NUMERIC_DOWN_ALT = 0xF886
-    SORT_NUMERIC_UP = 0xF163
-    SORT_NUMERIC_UP_ALT = 0xF887
-    SORT_UP = 0xF0DE
-    SPA = 0xF5BB
-    SPACE_SHUTTLE = 0xF197
-    SPELL_CHECK = 0xF891
-    SPIDER = 0xF717
-    SPINNER = 0xF110
-    SPLOTCH = 0xF5BC
-    SPRAY_CAN = 0xF5BD
-    SQUARE = 0xF0C8
-    SQUARE_FULL = 0xF45C
-    SQUARE_ROOT_ALT = 0xF698
-    STAMP = 0xF5BF
-    STAR = 0xF005
-    STAR_AND_CRESCENT = 0xF699
-    STAR_HALF = 0xF089
-    STAR_HALF_ALT = 0xF5C0
-    STAR_OF_DAVID = 0xF69A
-    STAR_OF_LIFE = 0xF621
-    STEP_BACKWARD = 0xF048
-    STEP_FORWARD = 0xF051
-    STETHOSCOPE = 0xF0F1
-    STICKY_NOTE = 0xF249
-    STOP = 0xF04D
-    STOP_CIRCLE = 0xF28D
-    STOPWATCH = 0xF2F2
-    STOPWATCH_20 = 0xE06F
-    STORE = 0xF54E
-    STORE_ALT = 0xF54F
-    STORE_ALT_SLASH = 0xE070
-    STORE_SLASH = 0xE071
-    STREAM = 0xF550
-    STREET_VIEW = 0xF21D
-    STRIKETHROUGH = 0xF0CC
-    STROOPWAFEL = 0xF551
-    SUBSCRIPT = 0xF12C
-    SUBWAY = 0xF239
-    SUITCASE = 0xF0F2
-    SUITCASE_ROLLING = 0xF5C1
-    SUN = 0xF185
-    SUPERSCRIPT = 0xF12B
-    SURPRISE = 0xF5C2
-    SWATCHBOOK = 0xF5C3
-    SWIMMER = 0xF5C4
-    SWIMMING_POOL = 0xF5C5
-    SYNAGOGUE = 0xF69B
-    SYNC = 0xF021
-    SYNC_ALT = 0xF2F1
-    SYRINGE = 0xF48E
-    TABLE = 0xF0CE
-    TABLE_TENNIS = 0xF45D
-    TABLET = 0xF10A
-    TABLET_ALT = 0xF3FA
-    TABLETS = 0xF490
-    TACHOMETER_ALT = 0xF3FD
-    TAG = 0xF02B
-    TAGS = 0xF02C
-    TAPE = 0xF4DB
-    TASKS = 0xF0AE
-    TAXI = 0xF1BA
-    TEETH = 0xF62E
-    TEETH_OPEN = 0xF62F
-    TEMPERATURE_HIGH = 0xF769
-    TEMPERATURE_LOW = 0xF76B
-    TENGE = 0xF7D7
-    TERMINAL = 0xF120
-    TEXT_HEIGHT = 0xF034
-    TEXT_WIDTH = 0xF035
-    TH = 0xF00A
-    TH_LARGE = 0xF009
-    TH_LIST = 0xF00B
-    THEATER_MASKS = 0xF630
-    THERMOMETER = 0xF491
-    THERMOMETER_EMPTY = 0xF2CB
-    THERMOMETER_FULL = 0xF2C7
-    THERMOMETER_HALF = 0xF2C9
-    THERMOMETER_QUARTER = 0xF2CA
-    THERMOMETER_THREE_QUARTERS = 0xF2C8
-    THUMBS_DOWN = 0xF165
-    THUMBS_UP = 0xF164
-    THUMBTACK = 0xF08D
-    TICKET_ALT = 0xF3FF
-    TIMES = 0xF00D
-    TIMES_CIRCLE = 0xF057
-    TINT = 0xF043
-    TINT_SLASH = 0xF5C7
-    TIRED = 0xF5C8
-    TOGGLE_OFF = 0xF204
-    TOGGLE_ON = 0xF205
-    TOILET = 0xF7D8
-    TOILET_PAPER = 0xF71E
-    TOILET_PAPER_SLASH = 0xE072
-    TOOLBOX = 0xF552
-    TOOLS = 0xF7D9
-    TOOTH = 0xF5C9
-    TORAH = 0xF6A0
-    TORII_GATE = 0xF6A1
-    TRACTOR = 0xF722
-    TRADEMARK = 0xF25C
-    TRAFFIC_LIGHT = 0xF637
-    TRAILER = 0xE041
-    TRAIN = 0xF238
-    TRAM = 0xF7DA
-    TRANSGENDER = 0xF224
-    TRANSGENDER_ALT = 0xF225
-    TRASH = 0xF1F8
-    TRASH_ALT = 0xF2ED
-    TRASH_RESTORE = 0xF829
-    TRASH_RESTORE_ALT = 0xF82A
-    TREE = 0xF1BB
-    TROPHY = 0xF091
-    TRUCK = 0xF0D1
-    TRUCK_LOADING = 0xF4DE
-    TRUCK_MONSTER = 0xF63B
-    TRUCK_MOVING = 0xF4DF
-    TRUCK_PICKUP = 0xF63C
-    TSHIRT = 0xF553
-    TTY = 0xF1E4
-    TV = 0xF26C
-    UMBRELLA = 0xF0E9
-    UMBRELLA_BEACH = 0xF5CA
-    UNDERLINE = 0xF0CD
-    UNDO = 0xF0E2
-    UNDO_ALT = 0xF2EA
-    UNIVERSAL_ACCESS = 0xF29A
-    UNIVERSITY = 0xF19C
-    UNLINK = 0xF127
-    UNLOCK = 0xF09C
-    UNLOCK_ALT = 0xF13E
-    UPLOAD = 0xF093
-    USER = 0xF007
-    USER_ALT = 0xF406
-    USER_ALT_SLASH = 0xF4FA
-    USER_ASTRONAUT = 0xF4FB
-    USER_CHECK = 0xF4FC
-    USER_CIRCLE = 0xF2BD
-    USER_CLOCK = 0xF4FD
-    USER_COG = 0xF4FE
-    USER_EDIT = 0xF4FF
-    USER_FRIENDS = 0xF500
-    USER_GRADUATE = 0xF501
-    USER_INJURED = 0xF728
-    USER_LOCK = 0xF502
-    USER_MD = 0xF0F0
-    USER_MINUS = 0xF503
-    USER_NINJA = 0xF504
-    USER_NURSE = 0xF82F
-    USER_PLUS = 0xF234
-    USER_SECRET = 0xF21B
-    USER_SHIELD = 0xF505
-    USER_SLASH = 0xF506
-    USER_TAG = 0xF507
-    USER_TIE = 0xF508
-    USER_TIMES = 0xF235
-    USERS = 0xF0C0
-    USERS_COG = 0xF509
-    USERS_SLASH = 0xE073
-    UTENSIL_SPOON = 0xF2E5
-    UTENSILS = 0xF2E7
-    VECTOR_SQUARE = 0xF5CB
-    VENUS = 0xF221
-    VENUS_DOUBLE = 0xF226
-    VENUS_MARS = 0xF228
-    VEST = 0xE085
-    VEST_PATCHES = 0xE086
-    VIAL = 0xF492
-    VIALS = 0xF493
-    VIDEO = 0xF03D
-    VIDEO_SLASH = 0xF4E2
-    VIHARA = 0xF6A7
-    VIRUS = 0xE074
-    VIRUS_SLASH = 0xE075
-    VIRUSES = 0xE076
-    VOICEMAIL = 0xF897
-    VOLLEYBALL_BALL = 0xF45F
-    VOLUME_DOWN = 0xF027
-    VOLUME_MUTE = 0xF6A9
-    VOLUME_OFF = 0xF026
-    VOLUME_UP = 0xF028
-    VOTE_YEA = 0xF772
-    VR_CARDBOARD = 0xF729
-    WALKING = 0xF554
-    WALLET = 0xF555
-    WAREHOUSE = 0xF494
-    WATER = 0xF773
-    WAVE_SQUARE = 0xF83E
-    WEIGHT = 0xF496
-    WEIGHT_HANGING = 0xF5CD
-    WHEELCHAIR = 0xF193
-    WIFI = 0xF1EB
-    WIND = 0xF72E
-    WINDOW_CLOSE = 0xF410
-    WINDOW_MAXIMIZE = 0xF2D0
-    WINDOW_MINIMIZE = 0xF2D1
-    WINDOW_RESTORE = 0xF2D2
-    WINE_BOTTLE = 0xF72F
-    WINE_GLASS = 0xF4E3
-    WINE_GLASS_ALT = 0xF5CE
-    WON_SIGN = 0xF159
-    WRENCH = 0xF0AD
-    X_RAY = 0xF497
-    YEN_SIGN = 0xF157
-    YIN_YANG = 0xF6AD
+TYPE_CHECKING = False  # Not imported from typing. See qtvscodestyle/__init__.py.
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator
 
+# Held while a member is created, so each name has one member even if it is first accessed by threads at once.
+_member_lock = allocate_lock()
 
-class FaRegular(Enum):
-    ADDRESS_BOOK = 0xF2B9
-    ADDRESS_CARD = 0xF2BB
-    ANGRY = 0xF556
-    ARROW_ALT_CIRCLE_DOWN = 0xF358
-    ARROW_ALT_CIRCLE_LEFT = 0xF359
-    ARROW_ALT_CIRCLE_RIGHT = 0xF35A
-    ARROW_ALT_CIRCLE_UP = 0xF35B
-    BELL = 0xF0F3
-    BELL_SLASH = 0xF1F6
-    BOOKMARK = 0xF02E
-    BUILDING = 0xF1AD
-    CALENDAR = 0xF133
-    CALENDAR_ALT = 0xF073
-    CALENDAR_CHECK = 0xF274
-    CALENDAR_MINUS = 0xF272
-    CALENDAR_PLUS = 0xF271
-    CALENDAR_TIMES = 0xF273
-    CARET_SQUARE_DOWN = 0xF150
-    CARET_SQUARE_LEFT = 0xF191
-    CARET_SQUARE_RIGHT = 0xF152
-    CARET_SQUARE_UP = 0xF151
-    CHART_BAR = 0xF080
-    CHECK_CIRCLE = 0xF058
-    CHECK_SQUARE = 0xF14A
-    CIRCLE = 0xF111
-    CLIPBOARD = 0xF328
-    CLOCK = 0xF017
-    CLONE = 0xF24D
-    CLOSED_CAPTIONING = 0xF20A
-    COMMENT = 0xF075
-    COMMENT_ALT = 0xF27A
-    COMMENT_DOTS = 0xF4AD
-    COMMENTS = 0xF086
-    COMPASS = 0xF14E
-    COPY = 0xF0C5
-    COPYRIGHT = 0xF1F9
-    CREDIT_CARD = 0xF09D
-    DIZZY = 0xF567
-    DOT_CIRCLE = 0xF192
-    EDIT = 0xF044
-    ENVELOPE = 0xF0E0
-    ENVELOPE_OPEN = 0xF2B6
-    EYE = 0xF06E
-    EYE_SLASH = 0xF070
-    FILE = 0xF15B
-    FILE_ALT = 0xF15C
-    FILE_ARCHIVE = 0xF1C6
-    FILE_AUDIO = 0xF1C7
-    FILE_CODE = 0xF1C9
-    FILE_EXCEL = 0xF1C3
-    FILE_IMAGE = 0xF1C5
-    FILE_PDF = 0xF1C1
-    FILE_POWERPOINT = 0xF1C4
-    FILE_VIDEO = 0xF1C8
-    FILE_WORD = 0xF1C2
-    FLAG = 0xF024
-    FLUSHED = 0xF579
-    FOLDER = 0xF07B
-    FOLDER_OPEN = 0xF07C
-    FROWN = 0xF119
-    FROWN_OPEN = 0xF57A
-    FUTBOL = 0xF1E3
-    GEM = 0xF3A5
-    GRIMACE = 0xF57F
-    GRIN = 0xF580
-    GRIN_ALT = 0xF581
-    GRIN_BEAM = 0xF582
-    GRIN_BEAM_SWEAT = 0xF583
-    GRIN_HEARTS = 0xF584
-    GRIN_SQUINT = 0xF585
-    GRIN_SQUINT_TEARS = 0xF586
-    GRIN_STARS = 0xF587
-    GRIN_TEARS = 0xF588
-    GRIN_TONGUE = 0xF589
-    GRIN_TONGUE_SQUINT = 0xF58A
-    GRIN_TONGUE_WINK = 0xF58B
-    GRIN_WINK = 0xF58C
-    HAND_LIZARD = 0xF258
-    HAND_PAPER = 0xF256
-    HAND_PEACE = 0xF25B
-    HAND_POINT_DOWN = 0xF0A7
-    HAND_POINT_LEFT = 0xF0A5
-    HAND_POINT_RIGHT = 0xF0A4
-    HAND_POINT_UP = 0xF0A6
-    HAND_POINTER = 0xF25A
-    HAND_ROCK = 0xF255
-    HAND_SCISSORS = 0xF257
-    HAND_SPOCK = 0xF259
-    HANDSHAKE = 0xF2B5
-    HDD = 0xF0A0
-    HEART = 0xF004
-    HOSPITAL = 0xF0F8
-    HOURGLASS = 0xF254
-    ID_BADGE = 0xF2C1
-    ID_CARD = 0xF2C2
-    IMAGE = 0xF03E
-    IMAGES = 0xF302
-    KEYBOARD = 0xF11C
-    KISS = 0xF596
-    KISS_BEAM = 0xF597
-    KISS_WINK_HEART = 0xF598
-    LAUGH = 0xF599
-    LAUGH_BEAM = 0xF59A
-    LAUGH_SQUINT = 0xF59B
-    LAUGH_WINK = 0xF59C
-    LEMON = 0xF094
-    LIFE_RING = 0xF1CD
-    LIGHTBULB = 0xF0EB
-    LIST_ALT = 0xF022
-    MAP = 0xF279
-    MEH = 0xF11A
-    MEH_BLANK = 0xF5A4
-    MEH_ROLLING_EYES = 0xF5A5
-    MINUS_SQUARE = 0xF146
-    MONEY_BILL_ALT = 0xF3D1
-    MOON = 0xF186
-    NEWSPAPER = 0xF1EA
-    OBJECT_GROUP = 0xF247
-    OBJECT_UNGROUP = 0xF248
-    PAPER_PLANE = 0xF1D8
-    PAUSE_CIRCLE = 0xF28B
-    PLAY_CIRCLE = 0xF144
-    PLUS_SQUARE = 0xF0FE
-    QUESTION_CIRCLE = 0xF059
-    REGISTERED = 0xF25D
-    SAD_CRY = 0xF5B3
-    SAD_TEAR = 0xF5B4
-    SAVE = 0xF0C7
-    SHARE_SQUARE = 0xF14D
-    SMILE = 0xF118
-    SMILE_BEAM = 0xF5B8
-    SMILE_WINK = 0xF4DA
-    SNOWFLAKE = 0xF2DC
-    SQUARE = 0xF0C8
-    STAR = 0xF005
-    STAR_HALF = 0xF089
-    STICKY_NOTE = 0xF249
-    STOP_CIRCLE = 0xF28D
-    SUN = 0xF185
-    SURPRISE = 0xF5C2
-    THUMBS_DOWN = 0xF165
-    THUMBS_UP = 0xF164
-    TIMES_CIRCLE = 0xF057
-    TIRED = 0xF5C8
-    TRASH_ALT = 0xF2ED
-    USER = 0xF007
-    USER_CIRCLE = 0xF2BD
-    WINDOW_CLOSE = 0xF410
-    WINDOW_MAXIMIZE = 0xF2D0
-    WINDOW_MINIMIZE = 0xF2D1
-    WINDOW_RESTORE = 0xF2D2
 
+class _IconTable(type):
+    """Metaclass of the icon identifiers, which creates the members from ``_TABLE`` on first access."""
 
-class FaBrands(Enum):
-    PX_500 = 0xF26E
-    ACCESSIBLE_ICON = 0xF368
-    ACCUSOFT = 0xF369
-    ACQUISITIONS_INCORPORATED = 0xF6AF
-    ADN = 0xF170
-    ADVERSAL = 0xF36A
-    AFFILIATETHEME = 0xF36B
-    AIRBNB = 0xF834
-    ALGOLIA = 0xF36C
-    ALIPAY = 0xF642
-    AMAZON = 0xF270
-    AMAZON_PAY = 0xF42C
-    AMILIA = 0xF36D
-    ANDROID = 0xF17B
-    ANGELLIST = 0xF209
-    ANGRYCREATIVE = 0xF36E
-    ANGULAR = 0xF420
-    APP_STORE = 0xF36F
-    APP_STORE_IOS = 0xF370
-    APPER = 0xF371
-    APPLE = 0xF179
-    APPLE_PAY = 0xF415
-    ARTSTATION = 0xF77A
-    ASYMMETRIK = 0xF372
-    ATLASSIAN = 0xF77B
-    AUDIBLE = 0xF373
-    AUTOPREFIXER = 0xF41C
-    AVIANEX = 0xF374
-    AVIATO = 0xF421
-    AWS = 0xF375
-    BANDCAMP = 0xF2D5
-    BATTLE_NET = 0xF835
-    BEHANCE = 0xF1B4
-    BEHANCE_SQUARE = 0xF1B5
-    BIMOBJECT = 0xF378
-    BITBUCKET = 0xF171
-    BITCOIN = 0xF379
-    BITY = 0xF37A
-    BLACK_TIE = 0xF27E
-    BLACKBERRY = 0xF37B
-    BLOGGER = 0xF37C
-    BLOGGER_B = 0xF37D
-    BLUETOOTH = 0xF293
-    BLUETOOTH_B = 0xF294
-    BOOTSTRAP = 0xF836
-    BTC = 0xF15A
-    BUFFER = 0xF837
-    BUROMOBELEXPERTE = 0xF37F
-    BUY_N_LARGE = 0xF8A6
-    BUYSELLADS = 0xF20D
-    CANADIAN_MAPLE_LEAF = 0xF785
-    CC_AMAZON_PAY = 0xF42D
-    CC_AMEX = 0xF1F3
-    CC_APPLE_PAY = 0xF416
-    CC_DINERS_CLUB = 0xF24C
-    CC_DISCOVER = 0xF1F2
-    CC_JCB = 0xF24B
-    CC_MASTERCARD = 0xF1F1
-    CC_PAYPAL = 0xF1F4
-    CC_STRIPE = 0xF1F5
-    CC_VISA = 0xF1F0
-    CENTERCODE = 0xF380
-    CENTOS = 0xF789
-    CHROME = 0xF268
-    CHROMECAST = 0xF838
-    CLOUDFLARE = 0xE07D
-    CLOUDSCALE = 0xF383
-    CLOUDSMITH = 0xF384
-    CLOUDVERSIFY = 0xF385
-    CODEPEN = 0xF1CB
-    CODIEPIE = 0xF284
-    CONFLUENCE = 0xF78D
-    CONNECTDEVELOP = 0xF20E
-    CONTAO = 0xF26D
-    COTTON_BUREAU = 0xF89E
-    CPANEL = 0xF388
-    CREATIVE_COMMONS = 0xF25E
-    CREATIVE_COMMONS_BY = 0xF4E7
-    CREATIVE_COMMONS_NC = 0xF4E8
-    CREATIVE_COMMONS_NC_EU = 0xF4E9
-    CREATIVE_COMMONS_NC_JP = 0xF4EA
-    CREATIVE_COMMONS_ND = 0xF4EB
-    CREATIVE_COMMONS_PD = 0xF4EC
-    CREATIVE_COMMONS_PD_ALT = 0xF4ED
-    CREATIVE_COMMONS_REMIX = 0xF4EE
-    CREATIVE_COMMONS_SA = 0xF4EF
-    CREATIVE_COMMONS_SAMPLING = 0xF4F0
-    CREATIVE_COMMONS_SAMPLING_PLUS = 0xF4F1
-    CREATIVE_COMMONS_SHARE = 0xF4F2
-    CREATIVE_COMMONS_ZERO = 0xF4F3
-    CRITICAL_ROLE = 0xF6C9
-    CSS3 = 0xF13C
-    CSS3_ALT = 0xF38B
-    CUTTLEFISH = 0xF38C
-    D_AND_D = 0xF38D
-    D_AND_D_BEYOND = 0xF6CA
-    DAILYMOTION = 0xE052
-    DASHCUBE = 0xF210
-    DEEZER = 0xE077
-    DELICIOUS = 0xF1A5
-    DEPLOYDOG = 0xF38E
-    DESKPRO = 0xF38F
-    DEV = 0xF6CC
-    DEVIANTART = 0xF1BD
-    DHL = 0xF790
-    DIASPORA = 0xF791
-    DIGG = 0xF1A6
-    DIGITAL_OCEAN = 0xF391
-    DISCORD = 0xF392
-    DISCOURSE = 0xF393
-    DOCHUB = 0xF394
-    DOCKER = 0xF395
-    DRAFT2DIGITAL = 0xF396
-    DRIBBBLE = 0xF17D
-    DRIBBBLE_SQUARE = 0xF397
-    DROPBOX = 0xF16B
-    DRUPAL = 0xF1A9
-    DYALOG = 0xF399
-    EARLYBIRDS = 0xF39A
-    EBAY = 0xF4F4
-    EDGE = 0xF282
-    EDGE_LEGACY = 0xE078
-    ELEMENTOR = 0xF430
-    ELLO = 0xF5F1
-    EMBER = 0xF423
-    EMPIRE = 0xF1D1
-    ENVIRA = 0xF299
-    ERLANG = 0xF39D
-    ETHEREUM = 0xF42E
-    ETSY = 0xF2D7
-    EVERNOTE = 0xF839
-    EXPEDITEDSSL = 0xF23E
-    FACEBOOK = 0xF09A
-    FACEBOOK_F = 0xF39E
-    FACEBOOK_MESSENGER = 0xF39F
-    FACEBOOK_SQUARE = 0xF082
-    FANTASY_FLIGHT_GAMES = 0xF6DC
-    FEDEX = 0xF797
-    FEDORA = 0xF798
-    FIGMA = 0xF799
-    FIREFOX = 0xF269
-    FIREFOX_BROWSER = 0xE007
-    FIRST_ORDER = 0xF2B0
-    FIRST_ORDER_ALT = 0xF50A
-    FIRSTDRAFT = 0xF3A1
-    FLICKR = 0xF16E
-    FLIPBOARD = 0xF44D
-    FLY = 0xF417
-    FONT_AWESOME = 0xF2B4
-    FONT_AWESOME_ALT = 0xF35C
-    FONT_AWESOME_FLAG = 0xF425
-    FONTICONS = 0xF280
-    FONTICONS_FI = 0xF3A2
-    FORT_AWESOME = 0xF286
-    FORT_AWESOME_ALT = 0xF3A3
-    FORUMBEE = 0xF211
-    FOURSQUARE = 0xF180
-    FREE_CODE_CAMP = 0xF2C5
-    FREEBSD = 0xF3A4
-    FULCRUM = 0xF50B
-    GALACTIC_REPUBLIC = 0xF50C
-    GALACTIC_SENATE = 0xF50D
-    GET_POCKET = 0xF265
-    GG = 0xF260
-    GG_CIRCLE = 0xF261
-    GIT = 0xF1D3
-    GIT_ALT = 0xF841
-    GIT_SQUARE = 0xF1D2
-    GITHUB = 0xF09B
-    GITHUB_ALT = 0xF113
-    GITHUB_SQUARE = 0xF092
-    GITKRAKEN = 0xF3A6
-    GITLAB = 0xF296
-    GITTER = 0xF426
-    GLIDE = 0xF2A5
-    GLIDE_G = 0xF2A6
-    GOFORE = 0xF3A7
-    GOODREADS = 0xF3A8
-    GOODREADS_G = 0xF3A9
-    GOOGLE = 0xF1A0
-    GOOGLE_DRIVE = 0xF3AA
-    GOOGLE_PAY = 0xE079
-    GOOGLE_PLAY = 0xF3AB
-    GOOGLE_PLUS = 0xF2B3
-    GOOGLE_PLUS_G = 0xF0D5
-    GOOGLE_PLUS_SQUARE = 0xF0D4
-    GOOGLE_WALLET = 0xF1EE
-    GRATIPAY = 0xF184
-    GRAV = 0xF2D6
-    GRIPFIRE = 0xF3AC
-    GRUNT = 0xF3AD
-    GUILDED = 0xE07E
-    GULP = 0xF3AE
-    HACKER_NEWS = 0xF1D4
-    HACKER_NEWS_SQUARE = 0xF3AF
-    HACKERRANK = 0xF5F7
-    HIPS = 0xF452
-    HIRE_A_HELPER = 0xF3B0
-    HIVE = 0xE07F
-    HOOLI = 0xF427
-    HORNBILL = 0xF592
-    HOTJAR = 0xF3B1
-    HOUZZ = 0xF27C
-    HTML5 = 0xF13B
-    HUBSPOT = 0xF3B2
-    IDEAL = 0xE013
-    IMDB = 0xF2D8
-    INNOSOFT = 0xE080
-    INSTAGRAM = 0xF16D
-    INSTAGRAM_SQUARE = 0xE055
-    INSTALOD = 0xE081
-    INTERCOM = 0xF7AF
-    INTERNET_EXPLORER = 0xF26B
-    INVISION = 0xF7B0
-    IOXHOST = 0xF208
-    ITCH_IO = 0xF83A
-    ITUNES = 0xF3B4
-    ITUNES_NOTE = 0xF3B5
-    JAVA = 0xF4E4
-    JEDI_ORDER = 0xF50E
-    JENKINS = 0xF3B6
-    JIRA = 0xF7B1
-    JOGET = 0xF3B7
-    JOOMLA = 0xF1AA
-    JS = 0xF3B8
-    JS_SQUARE = 0xF3B9
-    JSFIDDLE = 0xF1CC
-    KAGGLE = 0xF5FA
-    KEYBASE = 0xF4F5
-    KEYCDN = 0xF3BA
-    KICKSTARTER = 0xF3BB
-    KICKSTARTER_K = 0xF3BC
-    KORVUE = 0xF42F
-    LARAVEL = 0xF3BD
-    LASTFM = 0xF202
-    LASTFM_SQUARE = 0xF203
-    LEANPUB = 0xF212
-    LESS = 0xF41D
-    LINE = 0xF3C0
-    LINKEDIN = 0xF08C
-    LINKEDIN_IN = 0xF0E1
-    LINODE = 0xF2B8
-    LINUX = 0xF17C
-    LYFT = 0xF3C3
-    MAGENTO = 0xF3C4
-    MAILCHIMP = 0xF59E
-    MANDALORIAN = 0xF50F
-    MARKDOWN = 0xF60F
-    MASTODON = 0xF4F6
-    MAXCDN = 0xF136
-    MDB = 0xF8CA
-    MEDAPPS = 0xF3C6
-    MEDIUM = 0xF23A
-    MEDIUM_M = 0xF3C7
-    MEDRT = 0xF3C8
-    MEETUP = 0xF2E0
-    MEGAPORT = 0xF5A3
-    MENDELEY = 0xF7B3
-    MICROBLOG = 0xE01A
-    MICROSOFT = 0xF3CA
-    MIX = 0xF3CB
-    MIXCLOUD = 0xF289
-    MIXER = 0xE056
-    MIZUNI = 0xF3CC
-    MODX = 0xF285
-    MONERO = 0xF3D0
-    NAPSTER = 0xF3D2
-    NEOS = 0xF612
-    NIMBLR = 0xF5A8
-    NODE = 0xF419
-    NODE_JS = 0xF3D3
-    NPM = 0xF3D4
-    NS8 = 0xF3D5
-    NUTRITIONIX = 0xF3D6
-    OCTOPUS_DEPLOY = 0xE082
-    ODNOKLASSNIKI = 0xF263
-    ODNOKLASSNIKI_SQUARE = 0xF264
-    OLD_REPUBLIC = 0xF510
-    OPENCART = 0xF23D
-    OPENID = 0xF19B
-    OPERA = 0xF26A
-    OPTIN_MONSTER = 0xF23C
-    ORCID = 0xF8D2
-    OSI = 0xF41A
-    PAGE4 = 0xF3D7
-    PAGELINES = 0xF18C
-    PALFED = 0xF3D8
-    PATREON = 0xF3D9
-    PAYPAL = 0xF1ED
-    PENNY_ARCADE = 0xF704
-    PERBYTE = 0xE083
-    PERISCOPE = 0xF3DA
-    PHABRICATOR = 0xF3DB
-    PHOENIX_FRAMEWORK = 0xF3DC
-    PHOENIX_SQUADRON = 0xF511
-    PHP = 0xF457
-    PIED_PIPER = 0xF2AE
-    PIED_PIPER_ALT = 0xF1A8
-    PIED_PIPER_HAT = 0xF4E5
-    PIED_PIPER_PP = 0xF1A7
-    PIED_PIPER_SQUARE = 0xE01E
-    PINTEREST = 0xF0D2
-    PINTEREST_P = 0xF231
-    PINTEREST_SQUARE = 0xF0D3
-    PLAYSTATION = 0xF3DF
-    PRODUCT_HUNT = 0xF288
-    PUSHED = 0xF3E1
-    PYTHON = 0xF3E2
-    QQ = 0xF1D6
-    QUINSCAPE = 0xF459
-    QUORA = 0xF2C4
-    R_PROJECT = 0xF4F7
-    RASPBERRY_PI = 0xF7BB
-    RAVELRY = 0xF2D9
-    REACT = 0xF41B
-    REACTEUROPE = 0xF75D
-    README = 0xF4D5
-    REBEL = 0xF1D0
-    RED_RIVER = 0xF3E3
-    REDDIT = 0xF1A1
-    REDDIT_ALIEN = 0xF281
-    REDDIT_SQUARE = 0xF1A2
-    REDHAT = 0xF7BC
-    RENREN = 0xF18B
-    REPLYD = 0xF3E6
-    RESEARCHGATE = 0xF4F8
-    RESOLVING = 0xF3E7
-    REV = 0xF5B2
-    ROCKETCHAT = 0xF3E8
-    ROCKRMS = 0xF3E9
-    RUST = 0xE07A
-    SAFARI = 0xF267
-    SALESFORCE = 0xF83B
-    SASS = 0xF41E
-    SCHLIX = 0xF3EA
-    SCRIBD = 0xF28A
-    SEARCHENGIN = 0xF3EB
-    SELLCAST = 0xF2DA
-    SELLSY = 0xF213
-    SERVICESTACK = 0xF3EC
-    SHIRTSINBULK = 0xF214
-    SHOPIFY = 0xE057
-    SHOPWARE = 0xF5B5
-    SIMPLYBUILT = 0xF215
-    SISTRIX = 0xF3EE
-    SITH = 0xF512
-    SKETCH = 0xF7C6
-    SKYATLAS = 0xF216
-    SKYPE = 0xF17E
-    SLACK = 0xF198
-    SLACK_HASH = 0xF3EF
-    SLIDESHARE = 0xF1E7
-    SNAPCHAT = 0xF2AB
-    SNAPCHAT_GHOST = 0xF2AC
-    SNAPCHAT_SQUARE = 0xF2AD
-    SOUNDCLOUD = 0xF1BE
-    SOURCETREE = 0xF7D3
-    SPEAKAP = 0xF3F3
-    SPEAKER_DECK = 0xF83C
-    SPOTIFY = 0xF1BC
-    SQUARESPACE = 0xF5BE
-    STACK_EXCHANGE = 0xF18D
-    STACK_OVERFLOW = 0xF16C
-    STACKPATH = 0xF842
-    STAYLINKED = 0xF3F5
-    STEAM = 0xF1B6
-    STEAM_SQUARE = 0xF1B7
-    STEAM_SYMBOL = 0xF3F6
-    STICKER_MULE = 0xF3F7
-    STRAVA = 0xF428
-    STRIPE = 0xF429
-    STRIPE_S = 0xF42A
-    STUDIOVINARI = 0xF3F8
-    STUMBLEUPON = 0xF1A4
-    STUMBLEUPON_CIRCLE = 0xF1A3
-    SUPERPOWERS = 0xF2DD
-    SUPPLE = 0xF3F9
-    SUSE = 0xF7D6
-    SWIFT = 0xF8E1
-    SYMFONY = 0xF83D
-    TEAMSPEAK = 0xF4F9
-    TELEGRAM = 0xF2C6
-    TELEGRAM_PLANE = 0xF3FE
-    TENCENT_WEIBO = 0xF1D5
-    THE_RED_YETI = 0xF69D
-    THEMECO = 0xF5C6
-    THEMEISLE = 0xF2B2
-    THINK_PEAKS = 0xF731
-    TIKTOK = 0xE07B
-    TRADE_FEDERATION = 0xF513
-    TRELLO = 0xF181
-    TUMBLR = 0xF173
-    TUMBLR_SQUARE = 0xF174
-    TWITCH = 0xF1E8
-    TWITTER = 0xF099
-    TWITTER_SQUARE = 0xF081
-    TYPO3 = 0xF42B
-    UBER = 0xF402
-    UBUNTU = 0xF7DF
-    UIKIT = 0xF403
-    UMBRACO = 0xF8E8
-    UNCHARTED = 0xE084
-    UNIREGISTRY = 0xF404
-    UNITY = 0xE049
-    UNSPLASH = 0xE07C
-    UNTAPPD = 0xF405
-    UPS = 0xF7E0
-    USB = 0xF287
-    USPS = 0xF7E1
-    USSUNNAH = 0xF407
-    VAADIN = 0xF408
-    VIACOIN = 0xF237
-    VIADEO = 0xF2A9
-    VIADEO_SQUARE = 0xF2AA
-    VIBER = 0xF409
-    VIMEO = 0xF40A
-    VIMEO_SQUARE = 0xF194
-    VIMEO_V = 0xF27D
-    VINE = 0xF1CA
-    VK = 0xF189
-    VNV = 0xF40B
-    VUEJS = 0xF41F
-    WATCHMAN_MONITORING = 0xE087
-    WAZE = 0xF83F
-    WEEBLY = 0xF5CC
-    WEIBO = 0xF18A
-    WEIXIN = 0xF1D7
-    WHATSAPP = 0xF232
-    WHATSAPP_SQUARE = 0xF40C
-    WHMCS = 0xF40D
-    WIKIPEDIA_W = 0xF266
-    WINDOWS = 0xF17A
-    WIX = 0xF5CF
-    WIZARDS_OF_THE_COAST = 0xF730
-    WODU = 0xE088
-    WOLF_PACK_BATTALION = 0xF514
-    WORDPRESS = 0xF19A
-    WORDPRESS_SIMPLE = 0xF411
-    WPBEGINNER = 0xF297
-    WPEXPLORER = 0xF2DE
-    WPFORMS = 0xF298
-    WPRESSR = 0xF3E4
-    XBOX = 0xF412
-    XING = 0xF168
-    XING_SQUARE = 0xF169
-    Y_COMBINATOR = 0xF23B
-    YAHOO = 0xF19E
-    YAMMER = 0xF840
-    YANDEX = 0xF413
-    YANDEX_INTERNATIONAL = 0xF414
-    YARN = 0xF7E3
-    YELP = 0xF1E9
-    YOAST = 0xF2B1
-    YOUTUBE = 0xF167
-    YOUTUBE_SQUARE = 0xF431
-    ZHIHU = 0xF63F
+    _TABLE: str
+    _parse_value: Callable[[str], Any]
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace)
+
+    def _create_member(cls, name: str, value: str):
+        with _member_lock:
+            member = cls.__dict__.get(name)
+            if member is None:
+                member = object.__new__(cls)
+                object.__setattr__(member, "name", name)
+                object.__setattr__(member, "value", cls._parse_value(value))
+                type.__setattr__(cls, name, member)
+        return member
+
+    def _items(cls) -> Iterator[tuple[str, str]]:
+        for line in cls._TABLE.strip().split("\n"):
+            name, value = line.split(" ")
+            yield name, value
+
+    def __getattr__(cls, name: str):
+        # Called only for the members not created yet.
+        start = -1 if name.startswith("_") else cls._TABLE.find(f"\n{name} ")
+        if start == -1:
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+        start += len(name) + 2
+        return cls._create_member(name, cls._TABLE[start : cls._TABLE.index("\n", start)])
+
+    def __setattr__(cls, name: str, value: object) -> None:
+        if not name.startswith("_"):
+            raise AttributeError(f"cannot reassign member {name!r} of {cls.__name__}")
+        super().__setattr__(name, value)
+
+    def __iter__(cls) -> Iterator:
+        for name, value in cls._items():
+            yield cls.__dict__.get(name) or cls._create_member(name, value)
+
+    def __len__(cls) -> int:
+        return cls._TABLE.strip().count("\n") + 1
+
+    def __contains__(cls, member: object) -> bool:
+        return isinstance(member, cls)
+
+    def __getitem__(cls, name: str):
+        try:
+            return getattr(cls, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __call__(cls, value: object):
+        names = cls.__dict__.get("_names")
+        if names is None:
+            # {value: name}, built on first lookup. Like Enum, the first name of a duplicated value is used.
+            names = {}
+            for name, raw_value in cls._items():
+                names.setdefault(cls._parse_value(raw_value), name)
+            cls._names = names
+        try:
+            return getattr(cls, names[value])
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+    @property
+    def __members__(cls) -> dict:
+        return {member.name: member for member in cls}
+
+
+class _IconIdentifier(metaclass=_IconTable):
+    __slots__ = ("name", "value")
+    _TABLE = "\n"
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot set {name!r} of {self}")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}.{self.name}: {self.value!r}>"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}.{self.name}"
+
+    def __reduce__(self):
+        return getattr, (type(self), self.name)
+
+
+def _parse_code_point(value: str) -> int:
+    return int(value, 16)
+
+
+class Vsc(_IconIdentifier):
+    """Codicons of VS Code. The value is the file name of the svg icon."""
+
+    _parse_value = staticmethod(str)
+    _TABLE = """
+ZOOM_OUT zoom-out.svg
+ZOOM_IN zoom-in.svg
+WORKSPACE_UNTRUSTED workspace-untrusted.svg
+WORKSPACE_UNKNOWN workspace-unknown.svg
+WORKSPACE_TRUSTED workspace-trusted.svg
+WORD_WRAP word-wrap.svg
+WINDOW window.svg
+WHOLE_WORD whole-word.svg
+WHITESPACE whitespace.svg
+WATCH watch.svg
+WARNING warning.svg
+WAND wand.svg
+VM vm.svg
+VM_RUNNING vm-running.svg
+VM_OUTLINE vm-outline.svg
+VM_CONNECT vm-connect.svg
+VM_ACTIVE vm-active.svg
+VERSIONS versions.svg
+VERIFIED verified.svg
+VARIABLE_GROUP variable-group.svg
+UNVERIFIED unverified.svg
+UNMUTE unmute.svg
+UNLOCK unlock.svg
+UNGROUP_BY_REF_TYPE ungroup-by-ref-type.svg
+UNFOLD unfold.svg
+TYPE_HIERARCHY type-hierarchy.svg
+TYPE_HIERARCHY_SUPER type-hierarchy-super.svg
+TYPE_HIERARCHY_SUB type-hierarchy-sub.svg
+TWITTER twitter.svg
+TRIANGLE_UP triangle-up.svg
+TRIANGLE_RIGHT triangle-right.svg
+TRIANGLE_LEFT triangle-left.svg
+TRIANGLE_DOWN triangle-down.svg
+TRASH trash.svg
+TOOLS tools.svg
+THUMBSUP thumbsup.svg
+THUMBSDOWN thumbsdown.svg
+THREE_BARS three-bars.svg
+TEXT_SIZE text-size.svg
+TERMINAL terminal.svg
+TERMINAL_UBUNTU terminal-ubuntu.svg
+TERMINAL_TMUX terminal-tmux.svg
+TERMINAL_POWERSHELL terminal-powershell.svg
+TERMINAL_LINUX terminal-linux.svg
+TERMINAL_DEBIAN terminal-debian.svg
+TERMINAL_CMD terminal-cmd.svg
+TERMINAL_BASH terminal-bash.svg
+TELESCOPE telescope.svg
+TASKLIST tasklist.svg
+TAG tag.svg
+TABLE table.svg
+SYNC sync.svg
+SYNC_IGNORED sync-ignored.svg
+SYMBOL_VARIABLE symbol-variable.svg
+SYMBOL_STRUCTURE symbol-structure.svg
+SYMBOL_STRING symbol-string.svg
+SYMBOL_SNIPPET symbol-snippet.svg
+SYMBOL_RULER symbol-ruler.svg
+SYMBOL_PROPERTY symbol-property.svg
+SYMBOL_PARAMETER symbol-parameter.svg
+SYMBOL_OPERATOR symbol-operator.svg
+SYMBOL_NUMERIC symbol-numeric.svg
+SYMBOL_NAMESPACE symbol-namespace.svg
+SYMBOL_MISC symbol-misc.svg
+SYMBOL_METHOD symbol-method.svg
+SYMBOL_KEYWORD symbol-keyword.svg
+SYMBOL_KEY symbol-key.svg
+SYMBOL_INTERFACE symbol-interface.svg
+SYMBOL_FILE symbol-file.svg
+SYMBOL_FIELD symbol-field.svg
+SYMBOL_EVENT symbol-event.svg
+SYMBOL_ENUM symbol-enum.svg
+SYMBOL_ENUM_MEMBER symbol-enum-member.svg
+SYMBOL_CONSTANT symbol-constant.svg
+SYMBOL_COLOR symbol-color.svg
+SYMBOL_CLASS symbol-class.svg
+SYMBOL_BOOLEAN symbol-boolean.svg
+SYMBOL_ARRAY symbol-array.svg
+STOP_CIRCLE stop-circle.svg
+STAR_HALF star-half.svg
+STAR_FULL star-full.svg
+STAR_EMPTY star-empty.svg
+SQUIRREL squirrel.svg
+SPLIT_VERTICAL split-vertical.svg
+SPLIT_HORIZONTAL split-horizontal.svg
+SOURCE_CONTROL source-control.svg
+SORT_PRECEDENCE sort-precedence.svg
+SMILEY smiley.svg
+SIGN_OUT sign-out.svg
+SIGN_IN sign-in.svg
+SHIELD shield.svg
+SETTINGS settings.svg
+SETTINGS_GEAR settings-gear.svg
+SERVER server.svg
+SERVER_PROCESS server-process.svg
+SERVER_ENVIRONMENT server-environment.svg
+SEARCH search.svg
+SEARCH_STOP search-stop.svg
+SCREEN_NORMAL screen-normal.svg
+SCREEN_FULL screen-full.svg
+SAVE save.svg
+SAVE_AS save-as.svg
+SAVE_ALL save-all.svg
+RUN_ERRORS run-errors.svg
+RUN_BELOW run-below.svg
+RUN_ALL run-all.svg
+RUN_ABOVE run-above.svg
+RUBY ruby.svg
+RSS rss.svg
+ROOT_FOLDER root-folder.svg
+ROOT_FOLDER_OPENED root-folder-opened.svg
+ROCKET rocket.svg
+REQUEST_CHANGES request-changes.svg
+REPORT report.svg
+REPO repo.svg
+REPO_PUSH repo-push.svg
+REPO_PULL repo-pull.svg
+REPO_FORKED repo-forked.svg
+REPO_FORCE_PUSH repo-force-push.svg
+REPO_CLONE repo-clone.svg
+REPLY reply.svg
+REPLACE replace.svg
+REPLACE_ALL replace-all.svg
+REMOVE remove.svg
+REMOTE remote.svg
+REMOTE_EXPLORER remote-explorer.svg
+REGEX regex.svg
+REFRESH refresh.svg
+REFERENCES references.svg
+REDO redo.svg
+RECORD record.svg
+RECORD_KEYS record-keys.svg
+REACTIONS reactions.svg
+RADIO_TOWER radio-tower.svg
+QUOTE quote.svg
+QUESTION question.svg
+PULSE pulse.svg
+PROJECT project.svg
+PRIMITIVE_SQUARE primitive-square.svg
+PREVIEW preview.svg
+PRESERVE_CASE preserve-case.svg
+PLUG plug.svg
+PLAY play.svg
+PLAY_CIRCLE play-circle.svg
+PINNED pinned.svg
+PINNED_DIRTY pinned-dirty.svg
+PIN pin.svg
+PIE_CHART pie-chart.svg
+PERSON person.svg
+PERSON_ADD person-add.svg
+PASS pass.svg
+PASS_FILLED pass-filled.svg
+PAINTCAN paintcan.svg
+PACKAGE package.svg
+OUTPUT output.svg
+ORGANIZATION organization.svg
+OPEN_PREVIEW open-preview.svg
+OCTOFACE octoface.svg
+NOTEBOOK notebook.svg
+NOTEBOOK_TEMPLATE notebook-template.svg
+NOTE note.svg
+NO_NEWLINE no-newline.svg
+NEW_FOLDER new-folder.svg
+NEW_FILE new-file.svg
+MUTE mute.svg
+MULTIPLE_WINDOWS multiple-windows.svg
+MOVE move.svg
+MORTAR_BOARD mortar-board.svg
+MIRROR mirror.svg
+MILESTONE milestone.svg
+MERGE merge.svg
+MENU menu.svg
+MENTION mention.svg
+MEGAPHONE megaphone.svg
+MARKDOWN markdown.svg
+MAIL mail.svg
+MAIL_READ mail-read.svg
+MAGNET magnet.svg
+LOCK lock.svg
+LOCATION location.svg
+LOADING loading.svg
+LIVE_SHARE live-share.svg
+LIST_UNORDERED list-unordered.svg
+LIST_TREE list-tree.svg
+LIST_SELECTION list-selection.svg
+LIST_ORDERED list-ordered.svg
+LIST_FLAT list-flat.svg
+LIST_FILTER list-filter.svg
+LINK link.svg
+LINK_EXTERNAL link-external.svg
+LIGHTBULB lightbulb.svg
+LIGHTBULB_AUTOFIX lightbulb-autofix.svg
+LIBRARY library.svg
+LAYERS layers.svg
+LAYERS_DOT layers-dot.svg
+LAYERS_ACTIVE layers-active.svg
+LAW law.svg
+KEY key.svg
+KEBAB_VERTICAL kebab-vertical.svg
+JSON json.svg
+JERSEY jersey.svg
+ITALIC italic.svg
+ISSUES issues.svg
+ISSUE_REOPENED issue-reopened.svg
+ISSUE_DRAFT issue-draft.svg
+INSPECT inspect.svg
+INFO info.svg
+INBOX inbox.svg
+HUBOT hubot.svg
+HORIZONTAL_RULE horizontal-rule.svg
+HOME home.svg
+HISTORY history.svg
+HEART heart.svg
+GROUP_BY_REF_TYPE group-by-ref-type.svg
+GRIPPER gripper.svg
+GRAPH graph.svg
+GRAPH_SCATTER graph-scatter.svg
+GRAPH_LINE graph-line.svg
+GRAPH_LEFT graph-left.svg
+GRABBER grabber.svg
+GO_TO_FILE go-to-file.svg
+GLOBE globe.svg
+GITHUB github.svg
+GITHUB_INVERTED github-inverted.svg
+GITHUB_ALT github-alt.svg
+GITHUB_ACTION github-action.svg
+GIT_PULL_REQUEST git-pull-request.svg
+GIT_PULL_REQUEST_DRAFT git-pull-request-draft.svg
+GIT_PULL_REQUEST_CREATE git-pull-request-create.svg
+GIT_PULL_REQUEST_CLOSED git-pull-request-closed.svg
+GIT_MERGE git-merge.svg
+GIT_COMPARE git-compare.svg
+GIT_COMMIT git-commit.svg
+GIST gist.svg
+GIST_SECRET gist-secret.svg
+GIFT gift.svg
+GEAR gear.svg
+FOLDER folder.svg
+FOLDER_OPENED folder-opened.svg
+FOLDER_LIBRARY folder-library.svg
+FOLDER_ACTIVE folder-active.svg
+FOLD fold.svg
+FOLD_UP fold-up.svg
+FOLD_DOWN fold-down.svg
+FLAME flame.svg
+FILTER filter.svg
+FILTER_FILLED filter-filled.svg
+FILES files.svg
+FILE file.svg
+FILE_ZIP file-zip.svg
+FILE_SYMLINK_FILE file-symlink-file.svg
+FILE_SYMLINK_DIRECTORY file-symlink-directory.svg
+FILE_SUBMODULE file-submodule.svg
+FILE_PDF file-pdf.svg
+FILE_MEDIA file-media.svg
+FILE_CODE file-code.svg
+FILE_BINARY file-binary.svg
+FEEDBACK feedback.svg
+EYE eye.svg
+EYE_CLOSED eye-closed.svg
+EXTENSIONS extensions.svg
+EXPORT export.svg
+EXPAND_ALL expand-all.svg
+EXCLUDE exclude.svg
+ERROR error.svg
+EMPTY_WINDOW empty-window.svg
+ELLIPSIS ellipsis.svg
+EDITOR_LAYOUT editor-layout.svg
+EDIT edit.svg
+DISCARD discard.svg
+DIFF diff.svg
+DIFF_RENAMED diff-renamed.svg
+DIFF_REMOVED diff-removed.svg
+DIFF_MODIFIED diff-modified.svg
+DIFF_IGNORED diff-ignored.svg
+DIFF_ADDED diff-added.svg
+DEVICE_MOBILE device-mobile.svg
+DEVICE_CAMERA device-camera.svg
+DEVICE_CAMERA_VIDEO device-camera-video.svg
+DESKTOP_DOWNLOAD desktop-download.svg
+DEBUG debug.svg
+DEBUG_STOP debug-stop.svg
+DEBUG_STEP_OVER debug-step-over.svg
+DEBUG_STEP_OUT debug-step-out.svg
+DEBUG_STEP_INTO debug-step-into.svg
+DEBUG_STEP_BACK debug-step-back.svg
+DEBUG_START debug-start.svg
+DEBUG_STACKFRAME debug-stackframe.svg
+DEBUG_STACKFRAME_DOT debug-stackframe-dot.svg
+DEBUG_STACKFRAME_ACTIVE debug-stackframe-active.svg
+DEBUG_REVERSE_CONTINUE debug-reverse-continue.svg
+DEBUG_RESTART debug-restart.svg
+DEBUG_RESTART_FRAME debug-restart-frame.svg
+DEBUG_RERUN debug-rerun.svg
+DEBUG_PAUSE debug-pause.svg
+DEBUG_LINE_BY_LINE debug-line-by-line.svg
+DEBUG_DISCONNECT debug-disconnect.svg
+DEBUG_COVERAGE debug-coverage.svg
+DEBUG_CONTINUE debug-continue.svg
+DEBUG_CONTINUE_SMALL debug-continue-small.svg
+DEBUG_CONSOLE debug-console.svg
+DEBUG_BREAKPOINT_UNSUPPORTED debug-breakpoint-unsupported.svg
+DEBUG_BREAKPOINT_LOG debug-breakpoint-log.svg
+DEBUG_BREAKPOINT_LOG_UNVERIFIED debug-breakpoint-log-unverified.svg
+DEBUG_BREAKPOINT_FUNCTION debug-breakpoint-function.svg
+DEBUG_BREAKPOINT_FUNCTION_UNVERIFIED debug-breakpoint-function-unverified.svg
+DEBUG_BREAKPOINT_DATA debug-breakpoint-data.svg
+DEBUG_BREAKPOINT_DATA_UNVERIFIED debug-breakpoint-data-unverified.svg
+DEBUG_BREAKPOINT_CONDITIONAL debug-breakpoint-conditional.svg
+DEBUG_BREAKPOINT_CONDITIONAL_UNVERIFIED debug-breakpoint-conditional-unverified.svg
+DEBUG_ALT debug-alt.svg
+DEBUG_ALT_SMALL debug-alt-small.svg
+DEBUG_ALL debug-all.svg
+DATABASE database.svg
+DASHBOARD dashboard.svg
+DASH dash.svg
+CREDIT_CARD credit-card.svg
+COPY copy.svg
+COMPASS compass.svg
+COMPASS_DOT compass-dot.svg
+COMPASS_ACTIVE compass-active.svg
+COMMENT comment.svg
+COMMENT_DISCUSSION comment-discussion.svg
+COMBINE combine.svg
+COLOR_MODE color-mode.svg
+COLLAPSE_ALL collapse-all.svg
+CODE code.svg
+CLOUD cloud.svg
+CLOUD_UPLOAD cloud-upload.svg
+CLOUD_DOWNLOAD cloud-download.svg
+CLOSE close.svg
+CLOSE_ALL close-all.svg
+CLIPPY clippy.svg
+CLEAR_ALL clear-all.svg
+CIRCUIT_BOARD circuit-board.svg
+CIRCLE_SLASH circle-slash.svg
+CIRCLE_OUTLINE circle-outline.svg
+CIRCLE_LARGE_OUTLINE circle-large-outline.svg
+CIRCLE_LARGE_FILLED circle-large-filled.svg
+CIRCLE_FILLED circle-filled.svg
+CHROME_RESTORE chrome-restore.svg
+CHROME_MINIMIZE chrome-minimize.svg
+CHROME_MAXIMIZE chrome-maximize.svg
+CHROME_CLOSE chrome-close.svg
+CHEVRON_UP chevron-up.svg
+CHEVRON_RIGHT chevron-right.svg
+CHEVRON_LEFT chevron-left.svg
+CHEVRON_DOWN chevron-down.svg
+CHECKLIST checklist.svg
+CHECK check.svg
+CHECK_ALL check-all.svg
+CASE_SENSITIVE case-sensitive.svg
+CALL_OUTGOING call-outgoing.svg
+CALL_INCOMING call-incoming.svg
+CALENDAR calendar.svg
+BUG bug.svg
+BROWSER browser.svg
+BROADCAST broadcast.svg
+BRIEFCASE briefcase.svg
+BRACKET_ERROR bracket-error.svg
+BRACKET_DOT bracket-dot.svg
+BOOKMARK bookmark.svg
+BOOK book.svg
+BOLD bold.svg
+BELL bell.svg
+BELL_DOT bell-dot.svg
+BEAKER beaker.svg
+BEAKER_STOP beaker-stop.svg
+AZURE azure.svg
+ARROW_UP arrow-up.svg
+ARROW_SWAP arrow-swap.svg
+ARROW_SMALL_UP arrow-small-up.svg
+ARROW_SMALL_RIGHT arrow-small-right.svg
+ARROW_SMALL_LEFT arrow-small-left.svg
+ARROW_SMALL_DOWN arrow-small-down.svg
+ARROW_RIGHT arrow-right.svg
+ARROW_LEFT arrow-left.svg
+ARROW_DOWN arrow-down.svg
+ARROW_BOTH arrow-both.svg
+ARCHIVE archive.svg
+ADD add.svg
+ACTIVATE_BREAKPOINTS activate-breakpoints.svg
+ACCOUNT account.svg
+"""
+
+
+class FaSolid(_IconIdentifier):
+    """Solid icons of Font Awesome. The value is the code point in the font."""
+
+    _parse_value = staticmethod(_parse_code_point)
+    _TABLE = """
+AD 0xF641
+ADDRESS_BOOK 0xF2B9
+ADDRESS_CARD 0xF2BB
+ADJUST 0xF042
+AIR_FRESHENER 0xF5D0
+ALIGN_CENTER 0xF037
+ALIGN_JUSTIFY 0xF039
+ALIGN_LEFT 0xF036
+ALIGN_RIGHT 0xF038
+ALLERGIES 0xF461
+AMBULANCE 0xF0F9
+AMERICAN_SIGN_LANGUAGE_INTERPRETING 0xF2A3
+ANCHOR 0xF13D
+ANGLE_DOUBLE_DOWN 0xF103
+ANGLE_DOUBLE_LEFT 0xF100
+ANGLE_DOUBLE_RIGHT 0xF101
+ANGLE_DOUBLE_UP 0xF102
+ANGLE_DOWN 0xF107
+ANGLE_LEFT 0xF104
+ANGLE_RIGHT 0xF105
+ANGLE_UP 0xF106
+ANGRY 0xF556
+ANKH 0xF644
+APPLE_ALT 0xF5D1
+ARCHIVE 0xF187
+ARCHWAY 0xF557
+ARROW_ALT_CIRCLE_DOWN 0xF358
+ARROW_ALT_CIRCLE_LEFT 0xF359
+ARROW_ALT_CIRCLE_RIGHT 0xF35A
+ARROW_ALT_CIRCLE_UP 0xF35B
+ARROW_CIRCLE_DOWN 0xF0AB
+ARROW_CIRCLE_LEFT 0xF0A8
+ARROW_CIRCLE_RIGHT 0xF0A9
+ARROW_CIRCLE_UP 0xF0AA
+ARROW_DOWN 0xF063
+ARROW_LEFT 0xF060
+ARROW_RIGHT 0xF061
+ARROW_UP 0xF062
+ARROWS_ALT 0xF0B2
+ARROWS_ALT_H 0xF337
+ARROWS_ALT_V 0xF338
+ASSISTIVE_LISTENING_SYSTEMS 0xF2A2
+ASTERISK 0xF069
+AT 0xF1FA
+ATLAS 0xF558
+ATOM 0xF5D2
+AUDIO_DESCRIPTION 0xF29E
+AWARD 0xF559
+BABY 0xF77C
+BABY_CARRIAGE 0xF77D
+BACKSPACE 0xF55A
+BACKWARD 0xF04A
+BACON 0xF7E5
+BACTERIA 0xE059
+BACTERIUM 0xE05A
+BAHAI 0xF666
+BALANCE_SCALE 0xF24E
+BALANCE_SCALE_LEFT 0xF515
+BALANCE_SCALE_RIGHT 0xF516
+BAN 0xF05E
+BAND_AID 0xF462
+BARCODE 0xF02A
+BARS 0xF0C9
+BASEBALL_BALL 0xF433
+BASKETBALL_BALL 0xF434
+BATH 0xF2CD
+BATTERY_EMPTY 0xF244
+BATTERY_FULL 0xF240
+BATTERY_HALF 0xF242
+BATTERY_QUARTER 0xF243
+BATTERY_THREE_QUARTERS 0xF241
+BED 0xF236
+BEER 0xF0FC
+BELL 0xF0F3
+BELL_SLASH 0xF1F6
+BEZIER_CURVE 0xF55B
+BIBLE 0xF647
+BICYCLE 0xF206
+BIKING 0xF84A
+BINOCULARS 0xF1E5
+BIOHAZARD 0xF780
+BIRTHDAY_CAKE 0xF1FD
+BLENDER 0xF517
+BLENDER_PHONE 0xF6B6
+BLIND 0xF29D
+BLOG 0xF781
+BOLD 0xF032
+BOLT 0xF0E7
+BOMB 0xF1E2
+BONE 0xF5D7
+BONG 0xF55C
+BOOK 0xF02D
+BOOK_DEAD 0xF6B7
+BOOK_MEDICAL 0xF7E6
+BOOK_OPEN 0xF518
+BOOK_READER 0xF5DA
+BOOKMARK 0xF02E
+BORDER_ALL 0xF84C
+BORDER_NONE 0xF850
+BORDER_STYLE 0xF853
+BOWLING_BALL 0xF436
+BOX 0xF466
+BOX_OPEN 0xF49E
+BOX_TISSUE 0xE05B
+BOXES 0xF468
+BRAILLE 0xF2A1
+BRAIN 0xF5DC
+BREAD_SLICE 0xF7EC
+BRIEFCASE 0xF0B1
+BRIEFCASE_MEDICAL 0xF469
+BROADCAST_TOWER 0xF519
+BROOM 0xF51A
+BRUSH 0xF55D
+BUG 0xF188
+BUILDING 0xF1AD
+BULLHORN 0xF0A1
+BULLSEYE 0xF140
+BURN 0xF46A
+BUS 0xF207
+BUS_ALT 0xF55E
+BUSINESS_TIME 0xF64A
+CALCULATOR 0xF1EC
+CALENDAR 0xF133
+CALENDAR_ALT 0xF073
+CALENDAR_CHECK 0xF274
+CALENDAR_DAY 0xF783
+CALENDAR_MINUS 0xF272
+CALENDAR_PLUS 0xF271
+CALENDAR_TIMES 0xF273
+CALENDAR_WEEK 0xF784
+CAMERA 0xF030
+CAMERA_RETRO 0xF083
+CAMPGROUND 0xF6BB
+CANDY_CANE 0xF786
+CANNABIS 0xF55F
+CAPSULES 0xF46B
+CAR 0xF1B9
+CAR_ALT 0xF5DE
+CAR_BATTERY 0xF5DF
+CAR_CRASH 0xF5E1
+CAR_SIDE 0xF5E4
+CARAVAN 0xF8FF
+CARET_DOWN 0xF0D7
+CARET_LEFT 0xF0D9
+CARET_RIGHT 0xF0DA
+CARET_SQUARE_DOWN 0xF150
+CARET_SQUARE_LEFT 0xF191
+CARET_SQUARE_RIGHT 0xF152
+CARET_SQUARE_UP 0xF151
+CARET_UP 0xF0D8
+CARROT 0xF787
+CART_ARROW_DOWN 0xF218
+CART_PLUS 0xF217
+CASH_REGISTER 0xF788
+CAT 0xF6BE
+CERTIFICATE 0xF0A3
+CHAIR 0xF6C0
+CHALKBOARD 0xF51B
+CHALKBOARD_TEACHER 0xF51C
+CHARGING_STATION 0xF5E7
+CHART_AREA 0xF1FE
+CHART_BAR 0xF080
+CHART_LINE 0xF201
+CHART_PIE 0xF200
+CHECK 0xF00C
+CHECK_CIRCLE 0xF058
+CHECK_DOUBLE 0xF560
+CHECK_SQUARE 0xF14A
+CHEESE 0xF7EF
+CHESS 0xF439
+CHESS_BISHOP 0xF43A
+CHESS_BOARD 0xF43C
+CHESS_KING 0xF43F
+CHESS_KNIGHT 0xF441
+CHESS_PAWN 0xF443
+CHESS_QUEEN 0xF445
+CHESS_ROOK 0xF447
+CHEVRON_CIRCLE_DOWN 0xF13A
+CHEVRON_CIRCLE_LEFT 0xF137
+CHEVRON_CIRCLE_RIGHT 0xF138
+CHEVRON_CIRCLE_UP 0xF139
+CHEVRON_DOWN 0xF078
+CHEVRON_LEFT 0xF053
+CHEVRON_RIGHT 0xF054
+CHEVRON_UP 0xF077
+CHILD 0xF1AE
+CHURCH 0xF51D
+CIRCLE 0xF111
+CIRCLE_NOTCH 0xF1CE
+CITY 0xF64F
+CLINIC_MEDICAL 0xF7F2
+CLIPBOARD 0xF328
+CLIPBOARD_CHECK 0xF46C
+CLIPBOARD_LIST 0xF46D
+CLOCK 0xF017
+CLONE 0xF24D
+CLOSED_CAPTIONING 0xF20A
+CLOUD 0xF0C2
+CLOUD_DOWNLOAD_ALT 0xF381
+CLOUD_MEATBALL 0xF73B
+CLOUD_MOON 0xF6C3
+CLOUD_MOON_RAIN 0xF73C
+CLOUD_RAIN 0xF73D
+CLOUD_SHOWERS_HEAVY 0xF740
+CLOUD_SUN 0xF6C4
+CLOUD_SUN_RAIN 0xF743
+CLOUD_UPLOAD_ALT 0xF382
+COCKTAIL 0xF561
+CODE 0xF121
+CODE_BRANCH 0xF126
+COFFEE 0xF0F4
+COG 0xF013
+COGS 0xF085
+COINS 0xF51E
+COLUMNS 0xF0DB
+COMMENT 0xF075
+COMMENT_ALT 0xF27A
+COMMENT_DOLLAR 0xF651
+COMMENT_DOTS 0xF4AD
+COMMENT_MEDICAL 0xF7F5
+COMMENT_SLASH 0xF4B3
+COMMENTS 0xF086
+COMMENTS_DOLLAR 0xF653
+COMPACT_DISC 0xF51F
+COMPASS 0xF14E
+COMPRESS 0xF066
+COMPRESS_ALT 0xF422
+COMPRESS_ARROWS_ALT 0xF78C
+CONCIERGE_BELL 0xF562
+COOKIE 0xF563
+COOKIE_BITE 0xF564
+COPY 0xF0C5
+COPYRIGHT 0xF1F9
+COUCH 0xF4B8
+CREDIT_CARD 0xF09D
+CROP 0xF125
+CROP_ALT 0xF565
+CROSS 0xF654
+CROSSHAIRS 0xF05B
+CROW 0xF520
+CROWN 0xF521
+CRUTCH 0xF7F7
+CUBE 0xF1B2
+CUBES 0xF1B3
+CUT 0xF0C4
+DATABASE 0xF1C0
+DEAF 0xF2A4
+DEMOCRAT 0xF747
+DESKTOP 0xF108
+DHARMACHAKRA 0xF655
+DIAGNOSES 0xF470
+DICE 0xF522
+DICE_D20 0xF6CF
+DICE_D6 0xF6D1
+DICE_FIVE 0xF523
+DICE_FOUR 0xF524
+DICE_ONE 0xF525
+DICE_SIX 0xF526
+DICE_THREE 0xF527
+DICE_TWO 0xF528
+DIGITAL_TACHOGRAPH 0xF566
+DIRECTIONS 0xF5EB
+DISEASE 0xF7FA
+DIVIDE 0xF529
+DIZZY 0xF567
+DNA 0xF471
+DOG 0xF6D3
+DOLLAR_SIGN 0xF155
+DOLLY 0xF472
+DOLLY_FLATBED 0xF474
+DONATE 0xF4B9
+DOOR_CLOSED 0xF52A
+DOOR_OPEN 0xF52B
+DOT_CIRCLE 0xF192
+DOVE 0xF4BA
+DOWNLOAD 0xF019
+DRAFTING_COMPASS 0xF568
+DRAGON 0xF6D5
+DRAW_POLYGON 0xF5EE
+DRUM 0xF569
+DRUM_STEELPAN 0xF56A
+DRUMSTICK_BITE 0xF6D7
+DUMBBELL 0xF44B
+DUMPSTER 0xF793
+DUMPSTER_FIRE 0xF794
+DUNGEON 0xF6D9
+EDIT 0xF044
+EGG 0xF7FB
+EJECT 0xF052
+ELLIPSIS_H 0xF141
+ELLIPSIS_V 0xF142
+ENVELOPE 0xF0E0
+ENVELOPE_OPEN 0xF2B6
+ENVELOPE_OPEN_TEXT 0xF658
+ENVELOPE_SQUARE 0xF199
+EQUALS 0xF52C
+ERASER 0xF12D
+ETHERNET 0xF796
+EURO_SIGN 0xF153
+EXCHANGE_ALT 0xF362
+EXCLAMATION 0xF12A
+EXCLAMATION_CIRCLE 0xF06A
+EXCLAMATION_TRIANGLE 0xF071
+EXPAND 0xF065
+EXPAND_ALT 0xF424
+EXPAND_ARROWS_ALT 0xF31E
+EXTERNAL_LINK_ALT 0xF35D
+EXTERNAL_LINK_SQUARE_ALT 0xF360
+EYE 0xF06E
+EYE_DROPPER 0xF1FB
+EYE_SLASH 0xF070
+FAN 0xF863
+FAST_BACKWARD 0xF049
+FAST_FORWARD 0xF050
+FAUCET 0xE005
+FAX 0xF1AC
+FEATHER 0xF52D
+FEATHER_ALT 0xF56B
+FEMALE 0xF182
+FIGHTER_JET 0xF0FB
+FILE 0xF15B
+FILE_ALT 0xF15C
+FILE_ARCHIVE 0xF1C6
+FILE_AUDIO 0xF1C7
+FILE_CODE 0xF1C9
+FILE_CONTRACT 0xF56C
+FILE_CSV 0xF6DD
+FILE_DOWNLOAD 0xF56D
+FILE_EXCEL 0xF1C3
+FILE_EXPORT 0xF56E
+FILE_IMAGE 0xF1C5
+FILE_IMPORT 0xF56F
+FILE_INVOICE 0xF570
+FILE_INVOICE_DOLLAR 0xF571
+FILE_MEDICAL 0xF477
+FILE_MEDICAL_ALT 0xF478
+FILE_PDF 0xF1C1
+FILE_POWERPOINT 0xF1C4
+FILE_PRESCRIPTION 0xF572
+FILE_SIGNATURE 0xF573
+FILE_UPLOAD 0xF574
+FILE_VIDEO 0xF1C8
+FILE_WORD 0xF1C2
+FILL 0xF575
+FILL_DRIP 0xF576
+FILM 0xF008
+FILTER 0xF0B0
+FINGERPRINT 0xF577
+FIRE 0xF06D
+FIRE_ALT 0xF7E4
+FIRE_EXTINGUISHER 0xF134
+FIRST_AID 0xF479
+FISH 0xF578
+FIST_RAISED 0xF6DE
+FLAG 0xF024
+FLAG_CHECKERED 0xF11E
+FLAG_USA 0xF74D
+FLASK 0xF0C3
+FLUSHED 0xF579
+FOLDER 0xF07B
+FOLDER_MINUS 0xF65D
+FOLDER_OPEN 0xF07C
+FOLDER_PLUS 0xF65E
+FONT 0xF031
+FOOTBALL_BALL 0xF44E
+FORWARD 0xF04E
+FROG 0xF52E
+FROWN 0xF119
+FROWN_OPEN 0xF57A
+FUNNEL_DOLLAR 0xF662
+FUTBOL 0xF1E3
+GAMEPAD 0xF11B
+GAS_PUMP 0xF52F
+GAVEL 0xF0E3
+GEM 0xF3A5
+GENDERLESS 0xF22D
+GHOST 0xF6E2
+GIFT 0xF06B
+GIFTS 0xF79C
+GLASS_CHEERS 0xF79F
+GLASS_MARTINI 0xF000
+GLASS_MARTINI_ALT 0xF57B
+GLASS_WHISKEY 0xF7A0
+GLASSES 0xF530
+GLOBE 0xF0AC
+GLOBE_AFRICA 0xF57C
+GLOBE_AMERICAS 0xF57D
+GLOBE_ASIA 0xF57E
+GLOBE_EUROPE 0xF7A2
+GOLF_BALL 0xF450
+GOPURAM 0xF664
+GRADUATION_CAP 0xF19D
+GREATER_THAN 0xF531
+GREATER_THAN_EQUAL 0xF532
+GRIMACE 0xF57F
+GRIN 0xF580
+GRIN_ALT 0xF581
+GRIN_BEAM 0xF582
+GRIN_BEAM_SWEAT 0xF583
+GRIN_HEARTS 0xF584
+GRIN_SQUINT 0xF585
+GRIN_SQUINT_TEARS 0xF586
+GRIN_STARS 0xF587
+GRIN_TEARS 0xF588
+GRIN_TONGUE 0xF589
+GRIN_TONGUE_SQUINT 0xF58A
+GRIN_TONGUE_WINK 0xF58B
+GRIN_WINK 0xF58C
+GRIP_HORIZONTAL 0xF58D
+GRIP_LINES 0xF7A4
+GRIP_LINES_VERTICAL 0xF7A5
+GRIP_VERTICAL 0xF58E
+GUITAR 0xF7A6
+H_SQUARE 0xF0FD
+HAMBURGER 0xF805
+HAMMER 0xF6E3
+HAMSA 0xF665
+HAND_HOLDING 0xF4BD
+HAND_HOLDING_HEART 0xF4BE
+HAND_HOLDING_MEDICAL 0xE05C
+HAND_HOLDING_USD 0xF4C0
+HAND_HOLDING_WATER 0xF4C1
+HAND_LIZARD 0xF258
+HAND_MIDDLE_FINGER 0xF806
+HAND_PAPER 0xF256
+HAND_PEACE 0xF25B
+HAND_POINT_DOWN 0xF0A7
+HAND_POINT_LEFT 0xF0A5
+HAND_POINT_RIGHT 0xF0A4
+HAND_POINT_UP 0xF0A6
+HAND_POINTER 0xF25A
+HAND_ROCK 0xF255
+HAND_SCISSORS 0xF257
+HAND_SPARKLES 0xE05D
+HAND_SPOCK 0xF259
+HANDS 0xF4C2
+HANDS_HELPING 0xF4C4
+HANDS_WASH 0xE05E
+HANDSHAKE 0xF2B5
+HANDSHAKE_ALT_SLASH 0xE05F
+HANDSHAKE_SLASH 0xE060
+HANUKIAH 0xF6E6
+HARD_HAT 0xF807
+HASHTAG 0xF292
+HAT_COWBOY 0xF8C0
+HAT_COWBOY_SIDE 0xF8C1
+HAT_WIZARD 0xF6E8
+HDD 0xF0A0
+HEAD_SIDE_COUGH 0xE061
+HEAD_SIDE_COUGH_SLASH 0xE062
+HEAD_SIDE_MASK 0xE063
+HEAD_SIDE_VIRUS 0xE064
+HEADING 0xF1DC
+HEADPHONES 0xF025
+HEADPHONES_ALT 0xF58F
+HEADSET 0xF590
+HEART 0xF004
+HEART_BROKEN 0xF7A9
+HEARTBEAT 0xF21E
+HELICOPTER 0xF533
+HIGHLIGHTER 0xF591
+HIKING 0xF6EC
+HIPPO 0xF6ED
+HISTORY 0xF1DA
+HOCKEY_PUCK 0xF453
+HOLLY_BERRY 0xF7AA
+HOME 0xF015
+HORSE 0xF6F0
+HORSE_HEAD 0xF7AB
+HOSPITAL 0xF0F8
+HOSPITAL_ALT 0xF47D
+HOSPITAL_SYMBOL 0xF47E
+HOSPITAL_USER 0xF80D
+HOT_TUB 0xF593
+HOTDOG 0xF80F
+HOTEL 0xF594
+HOURGLASS 0xF254
+HOURGLASS_END 0xF253
+HOURGLASS_HALF 0xF252
+HOURGLASS_START 0xF251
+HOUSE_DAMAGE 0xF6F1
+HOUSE_USER 0xE065
+HRYVNIA 0xF6F2
+I_CURSOR 0xF246
+ICE_CREAM 0xF810
+ICICLES 0xF7AD
+ICONS 0xF86D
+ID_BADGE 0xF2C1
+ID_CARD 0xF2C2
+ID_CARD_ALT 0xF47F
+IGLOO 0xF7AE
+IMAGE 0xF03E
+IMAGES 0xF302
+INBOX 0xF01C
+INDENT 0xF03C
+INDUSTRY 0xF275
+INFINITY 0xF534
+INFO 0xF129
+INFO_CIRCLE 0xF05A
+ITALIC 0xF033
+JEDI 0xF669
+JOINT 0xF595
+JOURNAL_WHILLS 0xF66A
+KAABA 0xF66B
+KEY 0xF084
+KEYBOARD 0xF11C
+KHANDA 0xF66D
+KISS 0xF596
+KISS_BEAM 0xF597
+KISS_WINK_HEART 0xF598
+KIWI_BIRD 0xF535
+LANDMARK 0xF66F
+LANGUAGE 0xF1AB
+LAPTOP 0xF109
+LAPTOP_CODE 0xF5FC
+LAPTOP_HOUSE 0xE066
+LAPTOP_MEDICAL 0xF812
+LAUGH 0xF599
+LAUGH_BEAM 0xF59A
+LAUGH_SQUINT 0xF59B
+LAUGH_WINK 0xF59C
+LAYER_GROUP 0xF5FD
+LEAF 0xF06C
+LEMON 0xF094
+LESS_THAN 0xF536
+LESS_THAN_EQUAL 0xF537
+LEVEL_DOWN_ALT 0xF3BE
+LEVEL_UP_ALT 0xF3BF
+LIFE_RING 0xF1CD
+LIGHTBULB 0xF0EB
+LINK 0xF0C1
+LIRA_SIGN 0xF195
+LIST 0xF03A
+LIST_ALT 0xF022
+LIST_OL 0xF0CB
+LIST_UL 0xF0CA
+LOCATION_ARROW 0xF124
+LOCK 0xF023
+LOCK_OPEN 0xF3C1
+LONG_ARROW_ALT_DOWN 0xF309
+LONG_ARROW_ALT_LEFT 0xF30A
+LONG_ARROW_ALT_RIGHT 0xF30B
+LONG_ARROW_ALT_UP 0xF30C
+LOW_VISION 0xF2A8
+LUGGAGE_CART 0xF59D
+LUNGS 0xF604
+LUNGS_VIRUS 0xE067
+MAGIC 0xF0D0
+MAGNET 0xF076
+MAIL_BULK 0xF674
+MALE 0xF183
+MAP 0xF279
+MAP_MARKED 0xF59F
+MAP_MARKED_ALT 0xF5A0
+MAP_MARKER 0xF041
+MAP_MARKER_ALT 0xF3C5
+MAP_PIN 0xF276
+MAP_SIGNS 0xF277
+MARKER 0xF5A1
+MARS 0xF222
+MARS_DOUBLE 0xF227
+MARS_STROKE 0xF229
+MARS_STROKE_H 0xF22B
+MARS_STROKE_V 0xF22A
+MASK 0xF6FA
+MEDAL 0xF5A2
+MEDKIT 0xF0FA
+MEH 0xF11A
+MEH_BLANK 0xF5A4
+MEH_ROLLING_EYES 0xF5A5
+MEMORY 0xF538
+MENORAH 0xF676
+MERCURY 0xF223
+METEOR 0xF753
+MICROCHIP 0xF2DB
+MICROPHONE 0xF130
+MICROPHONE_ALT 0xF3C9
+MICROPHONE_ALT_SLASH 0xF539
+MICROPHONE_SLASH 0xF131
+MICROSCOPE 0xF610
+MINUS 0xF068
+MINUS_CIRCLE 0xF056
+MINUS_SQUARE 0xF146
+MITTEN 0xF7B5
+MOBILE 0xF10B
+MOBILE_ALT 0xF3CD
+MONEY_BILL 0xF0D6
+MONEY_BILL_ALT 0xF3D1
+MONEY_BILL_WAVE 0xF53A
+MONEY_BILL_WAVE_ALT 0xF53B
+MONEY_CHECK 0xF53C
+MONEY_CHECK_ALT 0xF53D
+MONUMENT 0xF5A6
+MOON 0xF186
+MORTAR_PESTLE 0xF5A7
+MOSQUE 0xF678
+MOTORCYCLE 0xF21C
+MOUNTAIN 0xF6FC
+MOUSE 0xF8CC
+MOUSE_POINTER 0xF245
+MUG_HOT 0xF7B6
+MUSIC 0xF001
+NETWORK_WIRED 0xF6FF
+NEUTER 0xF22C
+NEWSPAPER 0xF1EA
+NOT_EQUAL 0xF53E
+NOTES_MEDICAL 0xF481
+OBJECT_GROUP 0xF247
+OBJECT_UNGROUP 0xF248
+OIL_CAN 0xF613
+OM 0xF679
+OTTER 0xF700
+OUTDENT 0xF03B
+PAGER 0xF815
+PAINT_BRUSH 0xF1FC
+PAINT_ROLLER 0xF5AA
+PALETTE 0xF53F
+PALLET 0xF482
+PAPER_PLANE 0xF1D8
+PAPERCLIP 0xF0C6
+PARACHUTE_BOX 0xF4CD
+PARAGRAPH 0xF1DD
+PARKING 0xF540
+PASSPORT 0xF5AB
+PASTAFARIANISM 0xF67B
+PASTE 0xF0EA
+PAUSE 0xF04C
+PAUSE_CIRCLE 0xF28B
+PAW 0xF1B0
+PEACE 0xF67C
+PEN 0xF304
+PEN_ALT 0xF305
+PEN_FANCY 0xF5AC
+PEN_NIB 0xF5AD
+PEN_SQUARE 0xF14B
+PENCIL_ALT 0xF303
+PENCIL_RULER 0xF5AE
+PEOPLE_ARROWS 0xE068
+PEOPLE_CARRY 0xF4CE
+PEPPER_HOT 0xF816
+PERCENT 0xF295
+PERCENTAGE 0xF541
+PERSON_BOOTH 0xF756
+PHONE 0xF095
+PHONE_ALT 0xF879
+PHONE_SLASH 0xF3DD
+PHONE_SQUARE 0xF098
+PHONE_SQUARE_ALT 0xF87B
+PHONE_VOLUME 0xF2A0
+PHOTO_VIDEO 0xF87C
+PIGGY_BANK 0xF4D3
+PILLS 0xF484
+PIZZA_SLICE 0xF818
+PLACE_OF_WORSHIP 0xF67F
+PLANE 0xF072
+PLANE_ARRIVAL 0xF5AF
+PLANE_DEPARTURE 0xF5B0
+PLANE_SLASH 0xE069
+PLAY 0xF04B
+PLAY_CIRCLE 0xF144
+PLUG 0xF1E6
+PLUS 0xF067
+PLUS_CIRCLE 0xF055
+PLUS_SQUARE 0xF0FE
+PODCAST 0xF2CE
+POLL 0xF681
+POLL_H 0xF682
+POO 0xF2FE
+POO_STORM 0xF75A
+POOP 0xF619
+PORTRAIT 0xF3E0
+POUND_SIGN 0xF154
+POWER_OFF 0xF011
+PRAY 0xF683
+PRAYING_HANDS 0xF684
+PRESCRIPTION 0xF5B1
+PRESCRIPTION_BOTTLE 0xF485
+PRESCRIPTION_BOTTLE_ALT 0xF486
+PRINT 0xF02F
+PROCEDURES 0xF487
+PROJECT_DIAGRAM 0xF542
+PUMP_MEDICAL 0xE06A
+PUMP_SOAP 0xE06B
+PUZZLE_PIECE 0xF12E
+QRCODE 0xF029
+QUESTION 0xF128
+QUESTION_CIRCLE 0xF059
+QUIDDITCH 0xF458
+QUOTE_LEFT 0xF10D
+QUOTE_RIGHT 0xF10E
+QURAN 0xF687
+RADIATION 0xF7B9
+RADIATION_ALT 0xF7BA
+RAINBOW 0xF75B
+RANDOM 0xF074
+RECEIPT 0xF543
+RECORD_VINYL 0xF8D9
+RECYCLE 0xF1B8
+REDO 0xF01E
+REDO_ALT 0xF2F9
+REGISTERED 0xF25D
+REMOVE_FORMAT 0xF87D
+REPLY 0xF3E5
+REPLY_ALL 0xF122
+REPUBLICAN 0xF75E
+RESTROOM 0xF7BD
+RETWEET 0xF079
+RIBBON 0xF4D6
+RING 0xF70B
+ROAD 0xF018
+ROBOT 0xF544
+ROCKET 0xF135
+ROUTE 0xF4D7
+RSS 0xF09E
+RSS_SQUARE 0xF143
+RUBLE_SIGN 0xF158
+RULER 0xF545
+RULER_COMBINED 0xF546
+RULER_HORIZONTAL 0xF547
+RULER_VERTICAL 0xF548
+RUNNING 0xF70C
+RUPEE_SIGN 0xF156
+SAD_CRY 0xF5B3
+SAD_TEAR 0xF5B4
+SATELLITE 0xF7BF
+SATELLITE_DISH 0xF7C0
+SAVE 0xF0C7
+SCHOOL 0xF549
+SCREWDRIVER 0xF54A
+SCROLL 0xF70E
+SD_CARD 0xF7C2
+SEARCH 0xF002
+SEARCH_DOLLAR 0xF688
+SEARCH_LOCATION 0xF689
+SEARCH_MINUS 0xF010
+SEARCH_PLUS 0xF00E
+SEEDLING 0xF4D8
+SERVER 0xF233
+SHAPES 0xF61F
+SHARE 0xF064
+SHARE_ALT 0xF1E0
+SHARE_ALT_SQUARE 0xF1E1
+SHARE_SQUARE 0xF14D
+SHEKEL_SIGN 0xF20B
+SHIELD_ALT 0xF3ED
+SHIELD_VIRUS 0xE06C
+SHIP 0xF21A
+SHIPPING_FAST 0xF48B
+SHOE_PRINTS 0xF54B
+SHOPPING_BAG 0xF290
+SHOPPING_BASKET 0xF291
+SHOPPING_CART 0xF07A
+SHOWER 0xF2CC
+SHUTTLE_VAN 0xF5B6
+SIGN 0xF4D9
+SIGN_IN_ALT 0xF2F6
+SIGN_LANGUAGE 0xF2A7
+SIGN_OUT_ALT 0xF2F5
+SIGNAL 0xF012
+SIGNATURE 0xF5B7
+SIM_CARD 0xF7C4
+SINK 0xE06D
+SITEMAP 0xF0E8
+SKATING 0xF7C5
+SKIING 0xF7C9
+SKIING_NORDIC 0xF7CA
+SKULL 0xF54C
+SKULL_CROSSBONES 0xF714
+SLASH 0xF715
+SLEIGH 0xF7CC
+SLIDERS_H 0xF1DE
+SMILE 0xF118
+SMILE_BEAM 0xF5B8
+SMILE_WINK 0xF4DA
+SMOG 0xF75F
+SMOKING 0xF48D
+SMOKING_BAN 0xF54D
+SMS 0xF7CD
+SNOWBOARDING 0xF7CE
+SNOWFLAKE 0xF2DC
+SNOWMAN 0xF7D0
+SNOWPLOW 0xF7D2
+SOAP 0xE06E
+SOCKS 0xF696
+SOLAR_PANEL 0xF5BA
+SORT 0xF0DC
+SORT_ALPHA_DOWN 0xF15D
+SORT_ALPHA_DOWN_ALT 0xF881
+SORT_ALPHA_UP 0xF15E
+SORT_ALPHA_UP_ALT 0xF882
+SORT_AMOUNT_DOWN 0xF160
+SORT_AMOUNT_DOWN_ALT 0xF884
+SORT_AMOUNT_UP 0xF161
+SORT_AMOUNT_UP_ALT 0xF885
+SORT_DOWN 0xF0DD
+SORT_NUMERIC_DOWN 0xF162
+SORT_NUMERIC_DOWN_ALT 0xF886
+SORT_NUMERIC_UP 0xF163
+SORT_NUMERIC_UP_ALT 0xF887
+SORT_UP 0xF0DE
+SPA 0xF5BB
+SPACE_SHUTTLE 0xF197
+SPELL_CHECK 0xF891
+SPIDER 0xF717
+SPINNER 0xF110
+SPLOTCH 0xF5BC
+SPRAY_CAN 0xF5BD
+SQUARE 0xF0C8
+SQUARE_FULL 0xF45C
+SQUARE_ROOT_ALT 0xF698
+STAMP 0xF5BF
+STAR 0xF005
+STAR_AND_CRESCENT 0xF699
+STAR_HALF 0xF089
+STAR_HALF_ALT 0xF5C0
+STAR_OF_DAVID 0xF69A
+STAR_OF_LIFE 0xF621
+STEP_BACKWARD 0xF048
+STEP_FORWARD 0xF051
+STETHOSCOPE 0xF0F1
+STICKY_NOTE 0xF249
+STOP 0xF04D
+STOP_CIRCLE 0xF28D
+STOPWATCH 0xF2F2
+STOPWATCH_20 0xE06F
+STORE 0xF54E
+STORE_ALT 0xF54F
+STORE_ALT_SLASH 0xE070
+STORE_SLASH 0xE071
+STREAM 0xF550
+STREET_VIEW 0xF21D
+STRIKETHROUGH 0xF0CC
+STROOPWAFEL 0xF551
+SUBSCRIPT 0xF12C
+SUBWAY 0xF239
+SUITCASE 0xF0F2
+SUITCASE_ROLLING 0xF5C1
+SUN 0xF185
+SUPERSCRIPT 0xF12B
+SURPRISE 0xF5C2
+SWATCHBOOK 0xF5C3
+SWIMMER 0xF5C4
+SWIMMING_POOL 0xF5C5
+SYNAGOGUE 0xF69B
+SYNC 0xF021
+SYNC_ALT 0xF2F1
+SYRINGE 0xF48E
+TABLE 0xF0CE
+TABLE_TENNIS 0xF45D
+TABLET 0xF10A
+TABLET_ALT 0xF3FA
+TABLETS 0xF490
+TACHOMETER_ALT 0xF3FD
+TAG 0xF02B
+TAGS 0xF02C
+TAPE 0xF4DB
+TASKS 0xF0AE
+TAXI 0xF1BA
+TEETH 0xF62E
+TEETH_OPEN 0xF62F
+TEMPERATURE_HIGH 0xF769
+TEMPERATURE_LOW 0xF76B
+TENGE 0xF7D7
+TERMINAL 0xF120
+TEXT_HEIGHT 0xF034
+TEXT_WIDTH 0xF035
+TH 0xF00A
+TH_LARGE 0xF009
+TH_LIST 0xF00B
+THEATER_MASKS 0xF630
+THERMOMETER 0xF491
+THERMOMETER_EMPTY 0xF2CB
+THERMOMETER_FULL 0xF2C7
+THERMOMETER_HALF 0xF2C9
+THERMOMETER_QUARTER 0xF2CA
+THERMOMETER_THREE_QUARTERS 0xF2C8
+THUMBS_DOWN 0xF165
+THUMBS_UP 0xF164
+THUMBTACK 0xF08D
+TICKET_ALT 0xF3FF
+TIMES 0xF00D
+TIMES_CIRCLE 0xF057
+TINT 0xF043
+TINT_SLASH 0xF5C7
+TIRED 0xF5C8
+TOGGLE_OFF 0xF204
+TOGGLE_ON 0xF205
+TOILET 0xF7D8
+TOILET_PAPER 0xF71E
+TOILET_PAPER_SLASH 0xE072
+TOOLBOX 0xF552
+TOOLS 0xF7D9
+TOOTH 0xF5C9
+TORAH 0xF6A0
+TORII_GATE 0xF6A1
+TRACTOR 0xF722
+TRADEMARK 0xF25C
+TRAFFIC_LIGHT 0xF637
+TRAILER 0xE041
+TRAIN 0xF238
+TRAM 0xF7DA
+TRANSGENDER 0xF224
+TRANSGENDER_ALT 0xF225
+TRASH 0xF1F8
+TRASH_ALT 0xF2ED
+TRASH_RESTORE 0xF829
+TRASH_RESTORE_ALT 0xF82A
+TREE 0xF1BB
+TROPHY 0xF091
+TRUCK 0xF0D1
+TRUCK_LOADING 0xF4DE
+TRUCK_MONSTER 0xF63B
+TRUCK_MOVING 0xF4DF
+TRUCK_PICKUP 0xF63C
+TSHIRT 0xF553
+TTY 0xF1E4
+TV 0xF26C
+UMBRELLA 0xF0E9
+UMBRELLA_BEACH 0xF5CA
+UNDERLINE 0xF0CD
+UNDO 0xF0E2
+UNDO_ALT 0xF2EA
+UNIVERSAL_ACCESS 0xF29A
+UNIVERSITY 0xF19C
+UNLINK 0xF127
+UNLOCK 0xF09C
+UNLOCK_ALT 0xF13E
+UPLOAD 0xF093
+USER 0xF007
+USER_ALT 0xF406
+USER_ALT_SLASH 0xF4FA
+USER_ASTRONAUT 0xF4FB
+USER_CHECK 0xF4FC
+USER_CIRCLE 0xF2BD
+USER_CLOCK 0xF4FD
+USER_COG 0xF4FE
+USER_EDIT 0xF4FF
+USER_FRIENDS 0xF500
+USER_GRADUATE 0xF501
+USER_INJURED 0xF728
+USER_LOCK 0xF502
+USER_MD 0xF0F0
+USER_MINUS 0xF503
+USER_NINJA 0xF504
+USER_NURSE 0xF82F
+USER_PLUS 0xF234
+USER_SECRET 0xF21B
+USER_SHIELD 0xF505
+USER_SLASH 0xF506
+USER_TAG 0xF507
+USER_TIE 0xF508
+USER_TIMES 0xF235
+USERS 0xF0C0
+USERS_COG 0xF509
+USERS_SLASH 0xE073
+UTENSIL_SPOON 0xF2E5
+UTENSILS 0xF2E7
+VECTOR_SQUARE 0xF5CB
+VENUS 0xF221
+VENUS_DOUBLE 0xF226
+VENUS_MARS 0xF228
+VEST 0xE085
+VEST_PATCHES 0xE086
+VIAL 0xF492
+VIALS 0xF493
+VIDEO 0xF03D
+VIDEO_SLASH 0xF4E2
+VIHARA 0xF6A7
+VIRUS 0xE074
+VIRUS_SLASH 0xE075
+VIRUSES 0xE076
+VOICEMAIL 0xF897
+VOLLEYBALL_BALL 0xF45F
+VOLUME_DOWN 0xF027
+VOLUME_MUTE 0xF6A9
+VOLUME_OFF 0xF026
+VOLUME_UP 0xF028
+VOTE_YEA 0xF772
+VR_CARDBOARD 0xF729
+WALKING 0xF554
+WALLET 0xF555
+WAREHOUSE 0xF494
+WATER 0xF773
+WAVE_SQUARE 0xF83E
+WEIGHT 0xF496
+WEIGHT_HANGING 0xF5CD
+WHEELCHAIR 0xF193
+WIFI 0xF1EB
+WIND 0xF72E
+WINDOW_CLOSE 0xF410
+WINDOW_MAXIMIZE 0xF2D0
+WINDOW_MINIMIZE 0xF2D1
+WINDOW_RESTORE 0xF2D2
+WINE_BOTTLE 0xF72F
+WINE_GLASS 0xF4E3
+WINE_GLASS_ALT 0xF5CE
+WON_SIGN 0xF159
+WRENCH 0xF0AD
+X_RAY 0xF497
+YEN_SIGN 0xF157
+YIN_YANG 0xF6AD
+"""
+
+
+class FaRegular(_IconIdentifier):
+    """Regular icons of Font Awesome. The value is the code point in the font."""
+
+    _parse_value = staticmethod(_parse_code_point)
+    _TABLE = """
+ADDRESS_BOOK 0xF2B9
+ADDRESS_CARD 0xF2BB
+ANGRY 0xF556
+ARROW_ALT_CIRCLE_DOWN 0xF358
+ARROW_ALT_CIRCLE_LEFT 0xF359
+ARROW_ALT_CIRCLE_RIGHT 0xF35A
+ARROW_ALT_CIRCLE_UP 0xF35B
+BELL 0xF0F3
+BELL_SLASH 0xF1F6
+BOOKMARK 0xF02E
+BUILDING 0xF1AD
+CALENDAR 0xF133
+CALENDAR_ALT 0xF073
+CALENDAR_CHECK 0xF274
+CALENDAR_MINUS 0xF272
+CALENDAR_PLUS 0xF271
+CALENDAR_TIMES 0xF273
+CARET_SQUARE_DOWN 0xF150
+CARET_SQUARE_LEFT 0xF191
+CARET_SQUARE_RIGHT 0xF152
+CARET_SQUARE_UP 0xF151
+CHART_BAR 0xF080
+CHECK_CIRCLE 0xF058
+CHECK_SQUARE 0xF14A
+CIRCLE 0xF111
+CLIPBOARD 0xF328
+CLOCK 0xF017
+CLONE 0xF24D
+CLOSED_CAPTIONING 0xF20A
+COMMENT 0xF075
+COMMENT_ALT 0xF27A
+COMMENT_DOTS 0xF4AD
+COMMENTS 0xF086
+COMPASS 0xF14E
+COPY 0xF0C5
+COPYRIGHT 0xF1F9
+CREDIT_CARD 0xF09D
+DIZZY 0xF567
+DOT_CIRCLE 0xF192
+EDIT 0xF044
+ENVELOPE 0xF0E0
+ENVELOPE_OPEN 0xF2B6
+EYE 0xF06E
+EYE_SLASH 0xF070
+FILE 0xF15B
+FILE_ALT 0xF15C
+FILE_ARCHIVE 0xF1C6
+FILE_AUDIO 0xF1C7
+FILE_CODE 0xF1C9
+FILE_EXCEL 0xF1C3
+FILE_IMAGE 0xF1C5
+FILE_PDF 0xF1C1
+FILE_POWERPOINT 0xF1C4
+FILE_VIDEO 0xF1C8
+FILE_WORD 0xF1C2
+FLAG 0xF024
+FLUSHED 0xF579
+FOLDER 0xF07B
+FOLDER_OPEN 0xF07C
+FROWN 0xF119
+FROWN_OPEN 0xF57A
+FUTBOL 0xF1E3
+GEM 0xF3A5
+GRIMACE 0xF57F
+GRIN 0xF580
+GRIN_ALT 0xF581
+GRIN_BEAM 0xF582
+GRIN_BEAM_SWEAT 0xF583
+GRIN_HEARTS 0xF584
+GRIN_SQUINT 0xF585
+GRIN_SQUINT_TEARS 0xF586
+GRIN_STARS 0xF587
+GRIN_TEARS 0xF588
+GRIN_TONGUE 0xF589
+GRIN_TONGUE_SQUINT 0xF58A
+GRIN_TONGUE_WINK 0xF58B
+GRIN_WINK 0xF58C
+HAND_LIZARD 0xF258
+HAND_PAPER 0xF256
+HAND_PEACE 0xF25B
+HAND_POINT_DOWN 0xF0A7
+HAND_POINT_LEFT 0xF0A5
+HAND_POINT_RIGHT 0xF0A4
+HAND_POINT_UP 0xF0A6
+HAND_POINTER 0xF25A
+HAND_ROCK 0xF255
+HAND_SCISSORS 0xF257
+HAND_SPOCK 0xF259
+HANDSHAKE 0xF2B5
+HDD 0xF0A0
+HEART 0xF004
+HOSPITAL 0xF0F8
+HOURGLASS 0xF254
+ID_BADGE 0xF2C1
+ID_CARD 0xF2C2
+IMAGE 0xF03E
+IMAGES 0xF302
+KEYBOARD 0xF11C
+KISS 0xF596
+KISS_BEAM 0xF597
+KISS_WINK_HEART 0xF598
+LAUGH 0xF599
+LAUGH_BEAM 0xF59A
+LAUGH_SQUINT 0xF59B
+LAUGH_WINK 0xF59C
+LEMON 0xF094
+LIFE_RING 0xF1CD
+LIGHTBULB 0xF0EB
+LIST_ALT 0xF022
+MAP 0xF279
+MEH 0xF11A
+MEH_BLANK 0xF5A4
+MEH_ROLLING_EYES 0xF5A5
+MINUS_SQUARE 0xF146
+MONEY_BILL_ALT 0xF3D1
+MOON 0xF186
+NEWSPAPER 0xF1EA
+OBJECT_GROUP 0xF247
+OBJECT_UNGROUP 0xF248
+PAPER_PLANE 0xF1D8
+PAUSE_CIRCLE 0xF28B
+PLAY_CIRCLE 0xF144
+PLUS_SQUARE 0xF0FE
+QUESTION_CIRCLE 0xF059
+REGISTERED 0xF25D
+SAD_CRY 0xF5B3
+SAD_TEAR 0xF5B4
+SAVE 0xF0C7
+SHARE_SQUARE 0xF14D
+SMILE 0xF118
+SMILE_BEAM 0xF5B8
+SMILE_WINK 0xF4DA
+SNOWFLAKE 0xF2DC
+SQUARE 0xF0C8
+STAR 0xF005
+STAR_HALF 0xF089
+STICKY_NOTE 0xF249
+STOP_CIRCLE 0xF28D
+SUN 0xF185
+SURPRISE 0xF5C2
+THUMBS_DOWN 0xF165
+THUMBS_UP 0xF164
+TIMES_CIRCLE 0xF057
+TIRED 0xF5C8
+TRASH_ALT 0xF2ED
+USER 0xF007
+USER_CIRCLE 0xF2BD
+WINDOW_CLOSE 0xF410
+WINDOW_MAXIMIZE 0xF2D0
+WINDOW_MINIMIZE 0xF2D1
+WINDOW_RESTORE 0xF2D2
+"""
+
+
+class FaBrands(_IconIdentifier):
+    """Brand icons of Font Awesome. The value is the code point in the font."""
+
+    _parse_value = staticmethod(_parse_code_point)
+    _TABLE = """
+PX_500 0xF26E
+ACCESSIBLE_ICON 0xF368
+ACCUSOFT 0xF369
+ACQUISITIONS_INCORPORATED 0xF6AF
+ADN 0xF170
+ADVERSAL 0xF36A
+AFFILIATETHEME 0xF36B
+AIRBNB 0xF834
+ALGOLIA 0xF36C
+ALIPAY 0xF642
+AMAZON 0xF270
+AMAZON_PAY 0xF42C
+AMILIA 0xF36D
+ANDROID 0xF17B
+ANGELLIST 0xF209
+ANGRYCREATIVE 0xF36E
+ANGULAR 0xF420
+APP_STORE 0xF36F
+APP_STORE_IOS 0xF370
+APPER 0xF371
+APPLE 0xF179
+APPLE_PAY 0xF415
+ARTSTATION 0xF77A
+ASYMMETRIK 0xF372
+ATLASSIAN 0xF77B
+AUDIBLE 0xF373
+AUTOPREFIXER 0xF41C
+AVIANEX 0xF374
+AVIATO 0xF421
+AWS 0xF375
+BANDCAMP 0xF2D5
+BATTLE_NET 0xF835
+BEHANCE 0xF1B4
+BEHANCE_SQUARE 0xF1B5
+BIMOBJECT 0xF378
+BITBUCKET 0xF171
+BITCOIN 0xF379
+BITY 0xF37A
+BLACK_TIE 0xF27E
+BLACKBERRY 0xF37B
+BLOGGER 0xF37C
+BLOGGER_B 0xF37D
+BLUETOOTH 0xF293
+BLUETOOTH_B 0xF294
+BOOTSTRAP 0xF836
+BTC 0xF15A
+BUFFER 0xF837
+BUROMOBELEXPERTE 0xF37F
+BUY_N_LARGE 0xF8A6
+BUYSELLADS 0xF20D
+CANADIAN_MAPLE_LEAF 0xF785
+CC_AMAZON_PAY 0xF42D
+CC_AMEX 0xF1F3
+CC_APPLE_PAY 0xF416
+CC_DINERS_CLUB 0xF24C
+CC_DISCOVER 0xF1F2
+CC_JCB 0xF24B
+CC_MASTERCARD 0xF1F1
+CC_PAYPAL 0xF1F4
+CC_STRIPE 0xF1F5
+CC_VISA 0xF1F0
+CENTERCODE 0xF380
+CENTOS 0xF789
+CHROME 0xF268
+CHROMECAST 0xF838
+CLOUDFLARE 0xE07D
+CLOUDSCALE 0xF383
+CLOUDSMITH 0xF384
+CLOUDVERSIFY 0xF385
+CODEPEN 0xF1CB
+CODIEPIE 0xF284
+CONFLUENCE 0xF78D
+CONNECTDEVELOP 0xF20E
+CONTAO 0xF26D
+COTTON_BUREAU 0xF89E
+CPANEL 0xF388
+CREATIVE_COMMONS 0xF25E
+CREATIVE_COMMONS_BY 0xF4E7
+CREATIVE_COMMONS_NC 0xF4E8
+CREATIVE_COMMONS_NC_EU 0xF4E9
+CREATIVE_COMMONS_NC_JP 0xF4EA
+CREATIVE_COMMONS_ND 0xF4EB
+CREATIVE_COMMONS_PD 0xF4EC
+CREATIVE_COMMONS_PD_ALT 0xF4ED
+CREATIVE_COMMONS_REMIX 0xF4EE
+CREATIVE_COMMONS_SA 0xF4EF
+CREATIVE_COMMONS_SAMPLING 0xF4F0
+CREATIVE_COMMONS_SAMPLING_PLUS 0xF4F1
+CREATIVE_COMMONS_SHARE 0xF4F2
+CREATIVE_COMMONS_ZERO 0xF4F3
+CRITICAL_ROLE 0xF6C9
+CSS3 0xF13C
+CSS3_ALT 0xF38B
+CUTTLEFISH 0xF38C
+D_AND_D 0xF38D
+D_AND_D_BEYOND 0xF6CA
+DAILYMOTION 0xE052
+DASHCUBE 0xF210
+DEEZER 0xE077
+DELICIOUS 0xF1A5
+DEPLOYDOG 0xF38E
+DESKPRO 0xF38F
+DEV 0xF6CC
+DEVIANTART 0xF1BD
+DHL 0xF790
+DIASPORA 0xF791
+DIGG 0xF1A6
+DIGITAL_OCEAN 0xF391
+DISCORD 0xF392
+DISCOURSE 0xF393
+DOCHUB 0xF394
+DOCKER 0xF395
+DRAFT2DIGITAL 0xF396
+DRIBBBLE 0xF17D
+DRIBBBLE_SQUARE 0xF397
+DROPBOX 0xF16B
+DRUPAL 0xF1A9
+DYALOG 0xF399
+EARLYBIRDS 0xF39A
+EBAY 0xF4F4
+EDGE 0xF282
+EDGE_LEGACY 0xE078
+ELEMENTOR 0xF430
+ELLO 0xF5F1
+EMBER 0xF423
+EMPIRE 0xF1D1
+ENVIRA 0xF299
+ERLANG 0xF39D
+ETHEREUM 0xF42E
+ETSY 0xF2D7
+EVERNOTE 0xF839
+EXPEDITEDSSL 0xF23E
+FACEBOOK 0xF09A
+FACEBOOK_F 0xF39E
+FACEBOOK_MESSENGER 0xF39F
+FACEBOOK_SQUARE 0xF082
+FANTASY_FLIGHT_GAMES 0xF6DC
+FEDEX 0xF797
+FEDORA 0xF798
+FIGMA 0xF799
+FIREFOX 0xF269
+FIREFOX_BROWSER 0xE007
+FIRST_ORDER 0xF2B0
+FIRST_ORDER_ALT 0xF50A
+FIRSTDRAFT 0xF3A1
+FLICKR 0xF16E
+FLIPBOARD 0xF44D
+FLY 0xF417
+FONT_AWESOME 0xF2B4
+FONT_AWESOME_ALT 0xF35C
+FONT_AWESOME_FLAG 0xF425
+FONTICONS 0xF280
+FONTICONS_FI 0xF3A2
+FORT_AWESOME 0xF286
+FORT_AWESOME_ALT 0xF3A3
+FORUMBEE 0xF211
+FOURSQUARE 0xF180
+FREE_CODE_CAMP 0xF2C5
+FREEBSD 0xF3A4
+FULCRUM 0xF50B
+GALACTIC_REPUBLIC 0xF50C
+GALACTIC_SENATE 0xF50D
+GET_POCKET 0xF265
+GG 0xF260
+GG_CIRCLE 0xF261
+GIT 0xF1D3
+GIT_ALT 0xF841
+GIT_SQUARE 0xF1D2
+GITHUB 0xF09B
+GITHUB_ALT 0xF113
+GITHUB_SQUARE 0xF092
+GITKRAKEN 0xF3A6
+GITLAB 0xF296
+GITTER 0xF426
+GLIDE 0xF2A5
+GLIDE_G 0xF2A6
+GOFORE 0xF3A7
+GOODREADS 0xF3A8
+GOODREADS_G 0xF3A9
+GOOGLE 0xF1A0
+GOOGLE_DRIVE 0xF3AA
+GOOGLE_PAY 0xE079
+GOOGLE_PLAY 0xF3AB
+GOOGLE_PLUS 0xF2B3
+GOOGLE_PLUS_G 0xF0D5
+GOOGLE_PLUS_SQUARE 0xF0D4
+GOOGLE_WALLET 0xF1EE
+GRATIPAY 0xF184
+GRAV 0xF2D6
+GRIPFIRE 0xF3AC
+GRUNT 0xF3AD
+GUILDED 0xE07E
+GULP 0xF3AE
+HACKER_NEWS 0xF1D4
+HACKER_NEWS_SQUARE 0xF3AF
+HACKERRANK 0xF5F7
+HIPS 0xF452
+HIRE_A_HELPER 0xF3B0
+HIVE 0xE07F
+HOOLI 0xF427
+HORNBILL 0xF592
+HOTJAR 0xF3B1
+HOUZZ 0xF27C
+HTML5 0xF13B
+HUBSPOT 0xF3B2
+IDEAL 0xE013
+IMDB 0xF2D8
+INNOSOFT 0xE080
+INSTAGRAM 0xF16D
+INSTAGRAM_SQUARE 0xE055
+INSTALOD 0xE081
+INTERCOM 0xF7AF
+INTERNET_EXPLORER 0xF26B
+INVISION 0xF7B0
+IOXHOST 0xF208
+ITCH_IO 0xF83A
+ITUNES 0xF3B4
+ITUNES_NOTE 0xF3B5
+JAVA 0xF4E4
+JEDI_ORDER 0xF50E
+JENKINS 0xF3B6
+JIRA 0xF7B1
+JOGET 0xF3B7
+JOOMLA 0xF1AA
+JS 0xF3B8
+JS_SQUARE 0xF3B9
+JSFIDDLE 0xF1CC
+KAGGLE 0xF5FA
+KEYBASE 0xF4F5
+KEYCDN 0xF3BA
+KICKSTARTER 0xF3BB
+KICKSTARTER_K 0xF3BC
+KORVUE 0xF42F
+LARAVEL 0xF3BD
+LASTFM 0xF202
+LASTFM_SQUARE 0xF203
+LEANPUB 0xF212
+LESS 0xF41D
+LINE 0xF3C0
+LINKEDIN 0xF08C
+LINKEDIN_IN 0xF0E1
+LINODE 0xF2B8
+LINUX 0xF17C
+LYFT 0xF3C3
+MAGENTO 0xF3C4
+MAILCHIMP 0xF59E
+MANDALORIAN 0xF50F
+MARKDOWN 0xF60F
+MASTODON 0xF4F6
+MAXCDN 0xF136
+MDB 0xF8CA
+MEDAPPS 0xF3C6
+MEDIUM 0xF23A
+MEDIUM_M 0xF3C7
+MEDRT 0xF3C8
+MEETUP 0xF2E0
+MEGAPORT 0xF5A3
+MENDELEY 0xF7B3
+MICROBLOG 0xE01A
+MICROSOFT 0xF3CA
+MIX 0xF3CB
+MIXCLOUD 0xF289
+MIXER 0xE056
+MIZUNI 0xF3CC
+MODX 0xF285
+MONERO 0xF3D0
+NAPSTER 0xF3D2
+NEOS 0xF612
+NIMBLR 0xF5A8
+NODE 0xF419
+NODE_JS 0xF3D3
+NPM 0xF3D4
+NS8 0xF3D5
+NUTRITIONIX 0xF3D6
+OCTOPUS_DEPLOY 0xE082
+ODNOKLASSNIKI 0xF263
+ODNOKLASSNIKI_SQUARE 0xF264
+OLD_REPUBLIC 0xF510
+OPENCART 0xF23D
+OPENID 0xF19B
+OPERA 0xF26A
+OPTIN_MONSTER 0xF23C
+ORCID 0xF8D2
+OSI 0xF41A
+PAGE4 0xF3D7
+PAGELINES 0xF18C
+PALFED 0xF3D8
+PATREON 0xF3D9
+PAYPAL 0xF1ED
+PENNY_ARCADE 0xF704
+PERBYTE 0xE083
+PERISCOPE 0xF3DA
+PHABRICATOR 0xF3DB
+PHOENIX_FRAMEWORK 0xF3DC
+PHOENIX_SQUADRON 0xF511
+PHP 0xF457
+PIED_PIPER 0xF2AE
+PIED_PIPER_ALT 0xF1A8
+PIED_PIPER_HAT 0xF4E5
+PIED_PIPER_PP 0xF1A7
+PIED_PIPER_SQUARE 0xE01E
+PINTEREST 0xF0D2
+PINTEREST_P 0xF231
+PINTEREST_SQUARE 0xF0D3
+PLAYSTATION 0xF3DF
+PRODUCT_HUNT 0xF288
+PUSHED 0xF3E1
+PYTHON 0xF3E2
+QQ 0xF1D6
+QUINSCAPE 0xF459
+QUORA 0xF2C4
+R_PROJECT 0xF4F7
+RASPBERRY_PI 0xF7BB
+RAVELRY 0xF2D9
+REACT 0xF41B
+REACTEUROPE 0xF75D
+README 0xF4D5
+REBEL 0xF1D0
+RED_RIVER 0xF3E3
+REDDIT 0xF1A1
+REDDIT_ALIEN 0xF281
+REDDIT_SQUARE 0xF1A2
+REDHAT 0xF7BC
+RENREN 0xF18B
+REPLYD 0xF3E6
+RESEARCHGATE 0xF4F8
+RESOLVING 0xF3E7
+REV 0xF5B2
+ROCKETCHAT 0xF3E8
+ROCKRMS 0xF3E9
+RUST 0xE07A
+SAFARI 0xF267
+SALESFORCE 0xF83B
+SASS 0xF41E
+SCHLIX 0xF3EA
+SCRIBD 0xF28A
+SEARCHENGIN 0xF3EB
+SELLCAST 0xF2DA
+SELLSY 0xF213
+SERVICESTACK 0xF3EC
+SHIRTSINBULK 0xF214
+SHOPIFY 0xE057
+SHOPWARE 0xF5B5
+SIMPLYBUILT 0xF215
+SISTRIX 0xF3EE
+SITH 0xF512
+SKETCH 0xF7C6
+SKYATLAS 0xF216
+SKYPE 0xF17E
+SLACK 0xF198
+SLACK_HASH 0xF3EF
+SLIDESHARE 0xF1E7
+SNAPCHAT 0xF2AB
+SNAPCHAT_GHOST 0xF2AC
+SNAPCHAT_SQUARE 0xF2AD
+SOUNDCLOUD 0xF1BE
+SOURCETREE 0xF7D3
+SPEAKAP 0xF3F3
+SPEAKER_DECK 0xF83C
+SPOTIFY 0xF1BC
+SQUARESPACE 0xF5BE
+STACK_EXCHANGE 0xF18D
+STACK_OVERFLOW 0xF16C
+STACKPATH 0xF842
+STAYLINKED 0xF3F5
+STEAM 0xF1B6
+STEAM_SQUARE 0xF1B7
+STEAM_SYMBOL 0xF3F6
+STICKER_MULE 0xF3F7
+STRAVA 0xF428
+STRIPE 0xF429
+STRIPE_S 0xF42A
+STUDIOVINARI 0xF3F8
+STUMBLEUPON 0xF1A4
+STUMBLEUPON_CIRCLE 0xF1A3
+SUPERPOWERS 0xF2DD
+SUPPLE 0xF3F9
+SUSE 0xF7D6
+SWIFT 0xF8E1
+SYMFONY 0xF83D
+TEAMSPEAK 0xF4F9
+TELEGRAM 0xF2C6
+TELEGRAM_PLANE 0xF3FE
+TENCENT_WEIBO 0xF1D5
+THE_RED_YETI 0xF69D
+THEMECO 0xF5C6
+THEMEISLE 0xF2B2
+THINK_PEAKS 0xF731
+TIKTOK 0xE07B
+TRADE_FEDERATION 0xF513
+TRELLO 0xF181
+TUMBLR 0xF173
+TUMBLR_SQUARE 0xF174
+TWITCH 0xF1E8
+TWITTER 0xF099
+TWITTER_SQUARE 0xF081
+TYPO3 0xF42B
+UBER 0xF402
+UBUNTU 0xF7DF
+UIKIT 0xF403
+UMBRACO 0xF8E8
+UNCHARTED 0xE084
+UNIREGISTRY 0xF404
+UNITY 0xE049
+UNSPLASH 0xE07C
+UNTAPPD 0xF405
+UPS 0xF7E0
+USB 0xF287
+USPS 0xF7E1
+USSUNNAH 0xF407
+VAADIN 0xF408
+VIACOIN 0xF237
+VIADEO 0xF2A9
+VIADEO_SQUARE 0xF2AA
+VIBER 0xF409
+VIMEO 0xF40A
+VIMEO_SQUARE 0xF194
+VIMEO_V 0xF27D
+VINE 0xF1CA
+VK 0xF189
+VNV 0xF40B
+VUEJS 0xF41F
+WATCHMAN_MONITORING 0xE087
+WAZE 0xF83F
+WEEBLY 0xF5CC
+WEIBO 0xF18A
+WEIXIN 0xF1D7
+WHATSAPP 0xF232
+WHATSAPP_SQUARE 0xF40C
+WHMCS 0xF40D
+WIKIPEDIA_W 0xF266
+WINDOWS 0xF17A
+WIX 0xF5CF
+WIZARDS_OF_THE_COAST 0xF730
+WODU 0xE088
+WOLF_PACK_BATTALION 0xF514
+WORDPRESS 0xF19A
+WORDPRESS_SIMPLE 0xF411
+WPBEGINNER 0xF297
+WPEXPLORER 0xF2DE
+WPFORMS 0xF298
+WPRESSR 0xF3E4
+XBOX 0xF412
+XING 0xF168
+XING_SQUARE 0xF169
+Y_COMBINATOR 0xF23B
+YAHOO 0xF19E
+YAMMER 0xF840
+YANDEX 0xF413
+YANDEX_INTERNATIONAL 0xF414
+YARN 0xF7E3
+YELP 0xF1E9
+YOAST 0xF2B1
+YOUTUBE 0xF167
+YOUTUBE_SQUARE 0xF431
+ZHIHU 0xF63F
+"""
@@ -0,0 +1,134 @@
+"""Palette mode: theme the application with a QPalette and a small stylesheet instead of the full stylesheet."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import Optional, Union
+
+from qtvscodestyle.base import Theme, _apply_colors, _resolve_colors
+from qtvscodestyle.qtpy.QtGui import QColor, QPalette
+from qtvscodestyle.qtpy.QtWidgets import QApplication, QToolTip
+from qtvscodestyle.util import create_logger
+from qtvscodestyle.vscode.color import Color
+
+_logger = create_logger(__name__)
+
+# Classes of the widgets styled by palette.qss. QTipLabel is the widget of QToolTip.
+_STYLED_CLASSES = ("QTipLabel", "QAbstractItemView", "QMenu")
+
+_Group = QPalette.ColorGroup
+_Role = QPalette.ColorRole
+
+# {role: color ids}. The first color that is not None is used.
+_ROLES = {
+    "Window": ("editor.background",),
+    "WindowText": ("foreground",),
+    "Base": ("input.background", "editor.background"),
+    "AlternateBase": ("list.hoverBackground", "editorWidget.background"),
+    "Text": ("input.foreground", "foreground"),
+    "PlaceholderText": ("input.placeholderForeground",),
+    "Button": ("button.secondaryBackground", "button.background", "editorWidget.background"),
+    "ButtonText": ("button.secondaryForeground", "button.foreground", "foreground"),
+    "BrightText": ("errorForeground",),
+    "Highlight": ("list.activeSelectionBackground", "selection.background", "focusBorder"),
+    "HighlightedText": ("list.activeSelectionForeground", "foreground"),
+    "ToolTipBase": ("editorHoverWidget.background", "editorWidget.background"),
+    "ToolTipText": ("editorHoverWidget.foreground", "foreground"),
+    "Link": ("textLink.foreground",),
+    "LinkVisited": ("textLink.activeForeground", "textLink.foreground"),
+    "Mid": ("editorGroup.border", "contrastBorder"),
+    "Shadow": ("widget.shadow",),
+    "Accent": ("focusBorder",),
+}
+_INACTIVE_ROLES = {
+    "Highlight": ("list.inactiveSelectionBackground", "list.activeSelectionBackground"),
+    "HighlightedText": ("list.inactiveSelectionForeground", "foreground"),
+}
+_DISABLED_ROLES = {
+    "WindowText": ("foreground.disabled",),
+    "Text": ("foreground.disabled",),
+    "ButtonText": ("foreground.disabled",),
+    "Button": ("button.secondaryBackground.disabled", "button.background.disabled"),
+    "HighlightedText": ("foreground.disabled",),
+}
+
+
+def _to_q_color(color: Color) -> QColor:
+    r, g, b, a = color.rgba  # type: ignore
+    return QColor(int(r), int(g), int(b), round(a * 255))
+
+
+def _set_roles(
+    palette: QPalette,
+    group: QPalette.ColorGroup,
+    roles: dict[str, tuple[str, ...]],
+    colors: dict[str, Optional[Color]],
+) -> None:
+    for role_name, ids in roles.items():
+        role = getattr(_Role, role_name, None)  # PlaceholderText requires Qt5.12, Accent requires Qt6.6.
+        color = next((colors[id] for id in ids if colors.get(id) is not None), None)
+        if role is not None and color is not None:
+            palette.setColor(group, role, _to_q_color(color))
+
+
+def build_palette(colors: dict[str, Optional[Color]]) -> QPalette:
+    """Convert the resolved colors of a theme to a QPalette."""
+    palette = QPalette()
+    for group in (_Group.Active, _Group.Inactive, _Group.Disabled):
+        _set_roles(palette, group, _ROLES, colors)
+    _set_roles(palette, _Group.Inactive, _INACTIVE_ROLES, colors)
+    _set_roles(palette, _Group.Disabled, _DISABLED_ROLES, colors)
+    # The 3D bevel roles are derived from the button color as QPalette(button) does.
+    button = palette.color(_Group.Active, _Role.Button)
+    for group in (_Group.Active, _Group.Inactive, _Group.Disabled):
+        palette.setColor(group, _Role.Light, button.lighter(150))
+        palette.setColor(group, _Role.Midlight, button.lighter(125))
+        palette.setColor(group, _Role.Dark, button.darker(150))
+    return palette
+
+
+def load_palette(theme: Union[Theme, str, Path, dict] = Theme.DARK_VS, custom_colors: dict[str, str] = {}) -> QPalette:
+    """Load the palette of the theme. The colors of the icons are changed as load_stylesheet does.
+
+    Set it with ``apply_palette``. Widgets are painted by the application style instead of the stylesheet, so a style
+    that follows the palette, e.g. Fusion, is recommended.
+    """
+    colors = _resolve_colors(theme, custom_colors)
+    _apply_colors(colors)
+    return build_palette(colors)
+
+
+@lru_cache()
+def load_palette_stylesheet() -> str:
+    """Return the stylesheet of the palette mode, which covers what the palette cannot and refers to its roles.
+
+    Qt resolves the palette roles in a stylesheet when it polishes the widgets. Use ``apply_palette`` to change the
+    palette, which repolishes only the widgets styled by this stylesheet.
+    """
+    return resources.read_text("qtvscodestyle.stylesheet", "palette.qss")
+
+
+def apply_palette(palette: QPalette) -> None:
+    """Set the palette and the stylesheet of the palette mode to the application.
+
+    The stylesheet is the same for all themes, so it is set only once. After that, only the widgets that the
+    stylesheet styles are repolished instead of all widgets.
+    """
+    app = QApplication.instance()
+    if app is None:
+        _logger.warning("No QApplication instance found. The palette is not applied.")
+        return
+    stylesheet = load_palette_stylesheet()
+    app.setPalette(palette)
+    QToolTip.setPalette(palette)
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
+        return
+    style = app.style()
+    for widget in app.allWidgets():
+        if any(widget.inherits(class_name) for class_name in _STYLED_CLASSES):
+            style.unpolish(widget)
+            style.polish(widget)
+            widget.update()
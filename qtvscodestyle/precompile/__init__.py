@@ -0,0 +1,72 @@
+"""Stylesheets of the bundled themes built ahead of time by ``python -m qtvscodestyle.precompile``."""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import Optional
+
+from qtvscodestyle.cache import CacheEntry, decode_colors
+from qtvscodestyle.stylesheet.build import output_svg_codes
+from qtvscodestyle.stylesheet.resource import RESOURCE_PREFIX, register_svg_codes
+from qtvscodestyle.stylesheet.template import env_signature, template_digest
+from qtvscodestyle.util import create_logger
+
+_logger = create_logger(__name__)
+
+INDEX_FILE_NAME = "index.json"
+# The svg paths in the bundle are relative to this placeholder, which is replaced by the resources dir at runtime.
+RESOURCES_PLACEHOLDER = "$qtvscodestyle_resources"
+
+
+def entry_file_name(theme_name: str, env_signature: str) -> str:
+    """Return the name of the file that holds the stylesheet of the theme and the signature of $env_patch{...}."""
+    return f"{theme_name.lower()}_{env_signature}.json"
+
+
+@lru_cache()
+def _load_index() -> Optional[dict]:
+    from qtvscodestyle import __version__
+
+    try:
+        index = json.loads(resources.read_text(__name__, INDEX_FILE_NAME))
+    except FileNotFoundError:
+        return None
+    if index["version"] != __version__ or index["template"] != template_digest():
+        _logger.warning(
+            "The precompiled stylesheets are outdated and are not used."
+            "\n\tRun `python -m qtvscodestyle.precompile` again to update them."
+        )
+        return None
+    return index
+
+
+def load_precompiled(
+    theme_name: str, qt_version: str, resources_dir: Path, in_memory: bool = False
+) -> Optional[CacheEntry]:
+    """Return the precompiled stylesheet and colors of the theme, and output the svg files it refers to.
+
+    If ``in_memory`` is True, the svg files are registered as an in-memory Qt resource instead.
+    Return None if the theme is not precompiled for the Qt version.
+    """
+    index = _load_index()
+    if index is None:
+        return None
+    file_name = entry_file_name(theme_name, env_signature(index["env_conditions"], qt_version))
+    try:
+        entry = json.loads(resources.read_text(__name__, file_name))
+    except FileNotFoundError:
+        return None
+    if in_memory and register_svg_codes(entry["svg_codes"]):
+        stylesheet = entry["stylesheet"].replace(RESOURCES_PLACEHOLDER, f":/{RESOURCE_PREFIX}")
+        return stylesheet, decode_colors(entry["colors"])
+    # The files are checked every time, because ResourceManager of any process may have evicted them.
+    try:
+        output_svg_codes(entry["svg_codes"], resources_dir)
+    except OSError as e:
+        _logger.warning(f"Failed to output the precompiled svg files to '{resources_dir}'. {e}")
+        return None
+    stylesheet = entry["stylesheet"].replace(RESOURCES_PLACEHOLDER, resources_dir.as_posix())
+    return stylesheet, decode_colors(entry["colors"])
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from qtvscodestyle import __version__
+from qtvscodestyle.base import Theme, _load_theme_property, _merge_theme_colors
+from qtvscodestyle.cache import encode_colors
+from qtvscodestyle.precompile import INDEX_FILE_NAME, RESOURCES_PLACEHOLDER, entry_file_name
+from qtvscodestyle.stylesheet.build import StylesheetRenderer
+from qtvscodestyle.stylesheet.template import load_template
+from qtvscodestyle.util import write_text_atomic
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="This program precompiles the stylesheets of all themes into the qtvscodestyle.precompile package "
+        "so that load_stylesheet can skip building."
+    )
+    args = parser.parse_args()
+    return args
+
+
+def _build_bundle() -> dict[str, dict]:
+    """Return the contents of the bundle files. {file name: contents}"""
+    template = load_template()
+    bundle = {}
+    for theme in Theme:
+        theme_property = _load_theme_property(theme)
+        colors = _merge_theme_colors(theme_property)
+        # Qt versions with the same results of $env_patch{...} share the stylesheet.
+        for qt_version in template.env_versions():
+            file_name = entry_file_name(theme.name, template.env_signature(qt_version))
+            if file_name in bundle:
+                continue
+            renderer = StylesheetRenderer(
+                theme_property["type"], Path(RESOURCES_PLACEHOLDER), qt_version=qt_version, collect_svg=True
+            )
+            stylesheet = renderer.render(colors)
+            bundle[file_name] = {
+                "stylesheet": stylesheet,
+                "colors": encode_colors(colors),
+                "svg_codes": renderer.svg_codes,
+            }
+    # The index is written last. Stylesheets are used only when the index matches the package.
+    bundle[INDEX_FILE_NAME] = {
+        "version": __version__,
+        "template": template.digest,
+        "env_conditions": template.env_conditions(),
+    }
+    return bundle
+
+
+if __name__ == "__main__":
+    _parse_args()
+    # load_precompiled reads the bundle from the package, so it is always written there.
+    output_dir_path = Path(__file__).parent
+
+    bundle = _build_bundle()
+    for file_name, contents in bundle.items():
+        write_text_atomic(output_dir_path / file_name, json.dumps(contents, separators=(",", ":")))
+    print(f"Precompiled {len(bundle) - 1} stylesheets to '{output_dir_path}'.")
@@ -0,0 +1,100 @@
+"""A QProxyStyle that themes item views, scroll bars and tab bars with palettes of the theme colors."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, Union
+
+from qtvscodestyle.base import Theme, _resolve_colors
+from qtvscodestyle.palette import _to_q_color, build_palette
+from qtvscodestyle.qtpy.QtGui import QPalette
+from qtvscodestyle.qtpy.QtWidgets import QAbstractItemView, QApplication, QProxyStyle, QScrollBar, QStyle, QTabBar
+from qtvscodestyle.vscode.color import Color
+
+_Group = QPalette.ColorGroup
+_Role = QPalette.ColorRole
+
+# {widget class: {(group, role): color ids}}. The first color that is defined is used. A group of None is all groups.
+_WIDGET_ROLES = {
+    QAbstractItemView: {
+        (None, "Text"): ("foreground",),
+        (None, "AlternateBase"): ("sideBar.background",),
+        (_Group.Active, "Highlight"): ("list.activeSelectionBackground",),
+        (_Group.Inactive, "Highlight"): ("list.inactiveSelectionBackground", "list.activeSelectionBackground"),
+        (_Group.Active, "HighlightedText"): ("list.activeSelectionForeground", "foreground"),
+        (_Group.Inactive, "HighlightedText"): ("list.inactiveSelectionForeground", "foreground"),
+        (_Group.Disabled, "Text"): ("foreground.disabled",),
+        (_Group.Disabled, "HighlightedText"): ("foreground.disabled",),
+    },
+    QScrollBar: {
+        (None, "Window"): ("editor.background",),
+        (None, "Button"): ("scrollbarSlider.background",),
+    },
+    QTabBar: {
+        (None, "Window"): ("tab.activeBackground", "editor.background"),
+        (None, "Button"): ("tab.inactiveBackground", "editor.background"),
+        (None, "WindowText"): ("tab.activeForeground", "foreground"),
+        (None, "Dark"): ("tab.border", "editorGroup.border"),
+        (_Group.Disabled, "WindowText"): ("foreground.disabled",),
+    },
+}
+
+
+class VSCodeProxyStyle(QProxyStyle):
+    """Theme item views, scroll bars and tab bars with the colors of a theme and paint them with the base style.
+
+    The stylesheet matches its rules on every paint of these widgets. This style sets the theme colors to the palettes
+    of the widgets when it polishes them, and the base style, Fusion by default, paints them natively. Use it instead
+    of the stylesheet. The other widgets follow the palette, so set ``standardPalette()``, the palette of the theme, to
+    the application.
+
+    Painting is not overridden in Python, which would cross the bindings for every primitive of every widget. So the
+    VS Code icons of the branches and close buttons and the hover colors are not painted.
+    """
+
+    def __init__(
+        self,
+        theme: Union[Theme, str, Path, dict] = Theme.DARK_VS,
+        custom_colors: dict[str, str] = {},
+        base_style: Union[str, QStyle, None] = "Fusion",
+    ) -> None:
+        super().__init__(base_style)
+        self._colors: dict[str, Optional[Color]] = {}
+        self.set_theme(theme, custom_colors)
+
+    def set_theme(self, theme: Union[Theme, str, Path, dict], custom_colors: dict[str, str] = {}) -> None:
+        """Change the colors and the palettes of the styled widgets.
+
+        Set ``standardPalette()`` to the application to change the palette of the other widgets as well.
+        """
+        self._colors = _resolve_colors(theme, custom_colors)
+        app = QApplication.instance()
+        if app is None:
+            return
+        for widget in app.allWidgets():
+            self._set_widget_palette(widget)
+
+    def _set_widget_palette(self, widget) -> None:
+        roles = next((roles for cls, roles in _WIDGET_ROLES.items() if isinstance(widget, cls)), None)
+        if roles is None:
+            return
+        palette = widget.palette()
+        for (group, role_name), ids in roles.items():
+            color = next((self._colors[id] for id in ids if self._colors.get(id) is not None), None)
+            if color is None:
+                continue
+            for color_group in (_Group.Active, _Group.Inactive, _Group.Disabled) if group is None else (group,):
+                palette.setColor(color_group, getattr(_Role, role_name), _to_q_color(color))
+        widget.setPalette(palette)
+
+    def standardPalette(self) -> QPalette:
+        return build_palette(self._colors)
+
+    def polish(self, widget_or_app):
+        super().polish(widget_or_app)
+        self._set_widget_palette(widget_or_app)
+
+    def unpolish(self, widget_or_app):
+        super().unpolish(widget_or_app)
+        if isinstance(widget_or_app, tuple(_WIDGET_ROLES)):
+            widget_or_app.setPalette(QPalette())
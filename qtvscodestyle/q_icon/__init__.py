@@ -21,6 +21,7 @@ from typing import Type, Union
 from qtvscodestyle.base import global_current_colors
 from qtvscodestyle.const import FaBrands, FaRegular, FaSolid, Vsc
 from qtvscodestyle.qtpy.QtGui import QFont, QFontDatabase, QIcon
+from qtvscodestyle.util import load_svg_code
 from qtvscodestyle.vscode.color import Color
 
 from .iconic_font import CharIconEngine
@@ -74,7 +75,7 @@ def _iconic_icon_engine(icon_id: FontIdentifier, color: Color) -> CharIconEngine
 
 
 def _vs_icon_engine(icon_id: Vsc, color: Color) -> SVGBufferIconEngine:
-    xml = resources.read_text("qtvscodestyle.vscode.icons", icon_id.value)
+    xml = load_svg_code(icon_id.value)
     return SVGBufferIconEngine(xml, color)
 
 
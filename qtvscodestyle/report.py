@@ -0,0 +1,137 @@
+"""Per-stage timing of stylesheet loads, published to the hook set by ``set_build_report_hook``."""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+from qtvscodestyle.util import create_logger
+
+if TYPE_CHECKING:
+    from qtvscodestyle.stylesheet.prune import PruneStats
+
+_logger = create_logger(__name__)
+
+_hook: Optional[Callable[[BuildReport], None]] = None
+# The report of the load running in each thread. Stages are timed only while a report is active.
+_local = threading.local()
+
+
+@dataclass
+class StageTime:
+    wall: float = 0.0  # Seconds.
+    cpu: float = 0.0  # Seconds of CPU time of the thread.
+
+
+@dataclass
+class BuildReport:
+    """Timing and statistics of a stylesheet load.
+
+    ``cache`` is "memory", "precompiled" or "disk" if the stylesheet was found in the cache, or None if it was built.
+    ``stages`` are in order of execution: "cache", "precompiled", "parse_theme", "resolve_colors", "template", "svg",
+    "render", "minify", "cache_write" and "prune". Only the stages that ran are included.
+    ``svg_written`` is the number of svg files written to the disk or registered in memory, and ``svg_reused`` is the
+    number of svg files that already existed.
+    ``prune`` is the PruneStats if the stylesheet was pruned, and ``stylesheet_bytes`` is the size after pruning.
+    """
+
+    theme: str
+    cache: Optional[str] = None
+    stages: dict[str, StageTime] = field(default_factory=dict)
+    stylesheet_bytes: int = 0
+    svg_written: int = 0
+    svg_reused: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    prune: Optional[PruneStats] = None
+    _finished: bool = field(default=False, repr=False, compare=False)
+
+    @property
+    def cache_hit(self) -> bool:
+        return self.cache is not None
+
+    def finish(self, stylesheet: str) -> None:
+        self.stylesheet_bytes = len(stylesheet.encode("utf-8"))
+        self._finished = True
+
+    def as_dict(self) -> dict:
+        """Return the json serializable dict of the report."""
+        report = asdict(self)
+        del report["_finished"]
+        report["cache_hit"] = self.cache_hit
+        return report
+
+    def __str__(self) -> str:
+        source = "built" if self.cache is None else f"{self.cache} cache"
+        stages = ", ".join(f"{name} {stage.wall * 1000:.2f}" for name, stage in self.stages.items())
+        pruned = ""
+        if self.prune is not None:
+            pruned = f", pruned {self.prune.rules_dropped} of {self.prune.rules_total} rules"
+        return (
+            f"'{self.theme}' ({source}): {self.wall * 1000:.2f} ms, cpu {self.cpu * 1000:.2f} ms, "
+            f"{self.stylesheet_bytes} bytes, {self.svg_written} svg written, {self.svg_reused} svg reused{pruned}"
+            + (f" [{stages} ms]" if stages else "")
+        )
+
+
+def set_build_report_hook(hook: Optional[Callable[[BuildReport], None]]) -> None:
+    """Call ``hook`` with the BuildReport of each stylesheet load. None removes the hook.
+
+    The hook is called in the thread that loaded the stylesheet, which is a worker thread for load_stylesheet_async.
+    Without the hook, nothing is measured.
+    """
+    global _hook
+    _hook = hook
+
+
+def current_report() -> Optional[BuildReport]:
+    return getattr(_local, "report", None)
+
+
+@contextmanager
+def build_report(theme: str) -> Iterator[Optional[BuildReport]]:
+    """Collect the report of the load in the block, and publish it if it is finished. Yield None without the hook."""
+    hook = _hook
+    if hook is None or current_report() is not None:
+        yield None
+        return
+    report = BuildReport(theme)
+    _local.report = report
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield report
+    finally:
+        _local.report = None
+    report.wall, report.cpu = time.perf_counter() - wall, time.thread_time() - cpu
+    if not report._finished:  # Cancelled.
+        return
+    try:
+        hook(report)
+    except Exception as e:
+        _logger.warning(f"The build report hook raised an exception. {e!r}")
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Add the time of the block to the stage of the current report. A stage run more than once is accumulated."""
+    report = current_report()
+    if report is None:
+        yield
+        return
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        stage_time = report.stages.setdefault(name, StageTime())
+        stage_time.wall += time.perf_counter() - wall
+        stage_time.cpu += time.thread_time() - cpu
+
+
+def count_svg_files(total: int, written: int) -> None:
+    report = current_report()
+    if report is not None:
+        report.svg_written += written
+        report.svg_reused += total - written
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import atexit
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Hashable, Optional
+
+from qtvscodestyle.util import create_logger, write_text_atomic
+
+_logger = create_logger(__name__)
+
+# Each process records the svg files used by its stylesheets in "<dir>/.in_use/<pid>".
+_RECORDS_DIR_NAME = ".in_use"
+# Dirs created by the former versions, which made a temporary dir for each stylesheet.
+_LEGACY_DIR_PREFIX = "temp"
+# Legacy dirs and temporary files of unfinished writes are removed after this time. They have no owner pid.
+_STALE_SECONDS = 24 * 60 * 60
+# Files written recently may be about to be recorded by another process, so they are not evicted.
+_EVICTION_GRACE_SECONDS = 60
+
+
+def _is_process_alive(pid: int) -> bool:
+    if sys.platform == "win32":
+        import ctypes
+
+        # os.kill() terminates the process on Windows, so the exit code is checked instead.
+        kernel32 = ctypes.windll.kernel32  # type: ignore
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return kernel32.GetLastError() == 5  # ERROR_ACCESS_DENIED: the process exists.
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ResourceManager:
+    """Manage the lifecycle of the svg files in the resources dir shared by all processes.
+
+    The svg files referred by the current stylesheet of each owner are reference-counted, and recorded per process
+    so that other processes do not remove them. ``collect()`` removes the records of dead processes, stale files and
+    dirs left by crashed processes, and the least recently used files that are not in use while the total size of
+    svg files exceeds ``max_size``.
+    """
+
+    def __init__(self, dir_path: Path, max_size: Optional[int] = 4 * 1024 * 1024) -> None:
+        self.max_size = max_size
+        self._dir_path = dir_path
+        self._owners: dict[Hashable, frozenset[str]] = {}
+        self._stylesheets: dict[Hashable, str] = {}
+        self._ref_counts: Counter[str] = Counter()
+        self._seen: set[str] = set()
+        self._size: Optional[int] = None  # The total size estimated from the last collection.
+        self._lock = threading.Lock()
+
+    def _file_names(self, stylesheet: str) -> frozenset[str]:
+        prefix = f"url({self._dir_path.as_posix()}/"
+        return frozenset(re.findall(re.escape(prefix) + r"([^/)]+)\)", stylesheet))
+
+    def _record_path(self) -> Path:
+        return self._dir_path / _RECORDS_DIR_NAME / str(os.getpid())
+
+    def _save_record(self) -> None:
+        record_path = self._record_path()
+        if not record_path.exists():
+            record_path.parent.mkdir(parents=True, exist_ok=True)
+            atexit.register(self._remove_record)
+        write_text_atomic(record_path, "\n".join(sorted(self._ref_counts)))
+
+    def _remove_record(self) -> None:
+        try:
+            self._record_path().unlink()
+        except OSError:
+            pass
+
+    def _touch(self, file_names: frozenset[str]) -> bool:
+        """Update the modification time, which is the last use time for the LRU eviction, of the files not used yet
+        in the process. Return True if there are such files."""
+        new_file_names = file_names - self._seen
+        for file_name in new_file_names:
+            path = self._dir_path / file_name
+            try:
+                if self._size is not None:
+                    self._size += path.stat().st_size
+                os.utime(path)
+            except OSError:  # A removed file, or a file of another user in a shared dir.
+                pass
+        self._seen |= new_file_names
+        return bool(new_file_names)
+
+    def use(self, owner: Hashable, stylesheet: str) -> None:
+        """Mark the svg files referred by the stylesheet as in use by the owner, instead of its previous stylesheet."""
+        # The cached stylesheet is the same object, so the same stylesheet is not parsed again.
+        if self._stylesheets.get(owner) is stylesheet:
+            return
+        file_names = self._file_names(stylesheet)
+        with self._lock:
+            self._stylesheets[owner] = stylesheet
+            previous = self._owners.get(owner, frozenset())
+            if file_names == previous:
+                return
+            self._ref_counts.update(file_names)
+            self._ref_counts.subtract(previous)
+            self._ref_counts += Counter()  # Remove the files whose count is zero.
+            if file_names:
+                self._owners[owner] = file_names
+            else:
+                self._owners.pop(owner, None)
+                self._stylesheets.pop(owner, None)
+            try:
+                self._save_record()
+                has_new_files = self._touch(file_names)
+            except OSError as e:
+                _logger.warning(f"Failed to record the svg files in use to '{self._dir_path}'. {e}")
+                return
+            # Collect at the first use in the process, and when new files make the size exceed the limit.
+            if self._size is None or (has_new_files and self.max_size is not None and self._size > self.max_size):
+                self._collect()
+
+    def collect(self) -> None:
+        """Remove stale records, files and dirs, and evict files over the size limit."""
+        with self._lock:
+            self._collect()
+
+    def _collect(self) -> None:
+        try:
+            in_use = self._collect_records()
+            files = self._collect_stale_entries()
+        except OSError as e:
+            _logger.warning(f"Failed to clean up '{self._dir_path}'. {e}")
+            return
+        total_size = sum(size for _, size, _ in files)
+        if self.max_size is not None and total_size > self.max_size:
+            total_size = self._evict(files, in_use, total_size)
+        self._size = total_size
+
+    def _collect_records(self) -> set[str]:
+        """Remove the records of dead processes, and return the files in use by all live processes."""
+        in_use = set(self._ref_counts)
+        records_dir = self._dir_path / _RECORDS_DIR_NAME
+        if not records_dir.exists():
+            return in_use
+        for record in records_dir.iterdir():
+            if not record.name.isdigit() or int(record.name) == os.getpid():
+                continue
+            try:
+                if _is_process_alive(int(record.name)):
+                    in_use.update(record.read_text(encoding="utf-8").split())
+                else:
+                    record.unlink()
+            except OSError:  # Removed by another process, or a record of another user in a shared dir.
+                pass
+        return in_use
+
+    def _collect_stale_entries(self) -> list[tuple[float, int, str]]:
+        """Remove legacy dirs and unfinished writes, and return (mtime, size, name) of the svg files."""
+        files, now = [], time.time()
+        if not self._dir_path.exists():
+            return files
+        with os.scandir(self._dir_path) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                    is_stale = now - stat.st_mtime > _STALE_SECONDS
+                    if entry.is_dir():
+                        if entry.name.startswith(_LEGACY_DIR_PREFIX) and is_stale:
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                    elif entry.name.endswith(".tmp"):
+                        if is_stale:
+                            os.remove(entry.path)
+                    elif entry.name.endswith(".svg"):
+                        files.append((stat.st_mtime, stat.st_size, entry.name))
+                except OSError:  # Removed by another process, or a file of another user in a shared dir.
+                    pass
+        return files
+
+    def _evict(self, files: list[tuple[float, int, str]], in_use: set[str], total_size: int) -> int:
+        evicted, now = 0, time.time()
+        for mtime, size, file_name in sorted(files):
+            if total_size <= self.max_size:  # type: ignore
+                break
+            if file_name in in_use or now - mtime < _EVICTION_GRACE_SECONDS:
+                continue
+            try:
+                os.remove(self._dir_path / file_name)
+            except FileNotFoundError:
+                pass
+            except OSError:  # A file of another user in a shared dir.
+                continue
+            total_size -= size
+            evicted += 1
+            self._seen.discard(file_name)
+        _logger.info(f"Removed {evicted} least recently used svg files from '{self._dir_path}'.")
+        return total_size
@@ -1,141 +1,197 @@
 from __future__ import annotations
 
-import json
-import operator
-import re
-from dataclasses import dataclass
-from distutils.version import StrictVersion
-from importlib import resources
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
-from qtvscodestyle.util import create_logger, multireplace, to_svg_color_format
+from qtvscodestyle.report import count_svg_files, stage
+from qtvscodestyle.stylesheet.minify import minify_stylesheet
+from qtvscodestyle.stylesheet.resource import RESOURCE_PREFIX, register_svg_codes
+from qtvscodestyle.stylesheet.template import _Url, _Variable, load_template
+from qtvscodestyle.util import create_logger, hash_key, load_svg_code, to_svg_color_format, write_text_atomic
 from qtvscodestyle.vscode.color import Color
 
 _logger = create_logger(__name__)
 
+_WRITE_WORKERS = 8
+_SLOW_WRITE_SECONDS = 0.002
 
-# A class that handle the properties of the $url{...} variable in the stylesheet template.
-@dataclass(unsafe_hash=True, frozen=True)
-class _Url:
-    icon: str
-    id: str
-    rotate: str
-    path: Path
 
-
-def _parse_env_patch(stylesheet: str) -> dict[str, str]:
+def _get_qt_version() -> str:
     from qtvscodestyle.qtpy import __version__ as qt_version
 
     if qt_version is None:
         _logger.warning("Failed to detect Qt version. -> Load stylesheet as the latest version.")
         qt_version = "10.0.0"  # Fairly future version for always setting latest version.
+    return qt_version
 
-    # greater_equal and less_equal must be evaluated before greater and less.
-    operators = {
-        "==": operator.eq,  # equal
-        "!=": operator.ne,  # unequal
-        ">=": operator.ge,  # greater_equal
-        "<=": operator.le,  # less_equal
-        ">": operator.gt,  # greater
-        "<": operator.lt,  # less
-    }
-    replacements = {}
-
-    for match in re.finditer(r"\$env_patch\{[\s\S]*?\}", stylesheet):
-        match_text = match.group()
-        json_text = match_text.replace("$env_patch", "")
-        property: dict[str, str] = json.loads(json_text)
-
-        for qualifier in operators.keys():
-            if qualifier in property["version"]:
-                version = property["version"].replace(qualifier, "")
-                break
-        else:
-            raise SyntaxError(f"invalid character in qualifier. Available qualifiers {list(operators.keys())}")
-
-        is_true = operators[qualifier](StrictVersion(qt_version), StrictVersion(version))
-        replacements[match_text] = property["value"] if is_true else ""
-    return replacements
 
-
-def _parse_theme_type_patch(stylesheet: str, theme_type: str) -> dict[str, str]:
-    replacements = {}
-    for match in re.finditer(r"\$type_patch\{[\s\S]*?\};", stylesheet):
-        match_text = match.group().rstrip(";")
-        json_text = match_text.replace("$type_patch", "")
-
-        property: dict[str, str] = json.loads(json_text)
-        theme_types = property["types"].replace(" ", "").split("|")
-        value = property["value"]
-        qss_text = "\n".join(value if type(value) is list else [value])
-        replacements[match_text] = qss_text if theme_type in theme_types else ""
-    return replacements
-
-
-def _parse_url(stylesheet: str, dir_path: Path, is_designer: bool = False) -> tuple[dict[str, str], set[_Url]]:
-    urls = set()
+def _parse_url(file_names: dict[_Url, str], dir_path: Path, resource_prefix: Optional[str] = None) -> dict[_Url, str]:
     replacements = {}
-    for match in re.finditer(r"\$url\{.+\}", stylesheet):
-        match_text = match.group()
-        json_text = match_text.replace("$url", "")
-
-        icon, id, rotate = json.loads(json_text).values()
-        file_name = f"{icon.replace('.svg', '')}_{id}_{rotate}.svg"
-        urls.add(_Url(icon, id, rotate, dir_path / file_name))
-
+    for url, file_name in file_names.items():
         # In windows, the path is a backslash. Replase backslash to slash.
         full_path = (dir_path / file_name).as_posix()
-        value = f":/vscode/{file_name}" if is_designer else str(full_path)
-        replacements[match_text] = f"url({value})"
-    return replacements, urls
-
-
-def _output_converted_svg_file(colors: dict[str, Optional[Color]], urls: set[_Url]) -> None:
-    svg_codes: dict[str, str] = {}  # {file name: svg code}
-    for content in resources.contents("qtvscodestyle.vscode.icons"):
-        if ".svg" not in content:  # Only svg file
-            continue
-        svg_code = resources.read_text("qtvscodestyle.vscode.icons", content)
-        svg_codes[content] = svg_code
-
-    for content in resources.contents("qtvscodestyle.stylesheet.icons"):
-        if ".svg" not in content:  # Only svg file
-            continue
-        svg_code = resources.read_text("qtvscodestyle.stylesheet.icons", content)
-        svg_codes[content] = svg_code
+        value = str(full_path) if resource_prefix is None else f":/{resource_prefix}/{file_name}"
+        replacements[url] = f"url({value})"
+    return replacements
 
-    for url in urls:
-        color = colors["$" + url.id]
-        # Change color and rotate. See https://stackoverflow.com/a/15139069/13452582
-        new_contents = f'{to_svg_color_format(color)} transform="rotate({url.rotate}, 8, 8)"'
-        svg_code_converted = svg_codes[url.icon].replace('fill="currentColor"', new_contents)
 
-        with url.path.open("w") as f:
-            f.write(svg_code_converted)
+def _normalize_rotation(rotate: str) -> float:
+    return float(rotate) % 360
+
+
+@lru_cache(maxsize=1024)
+def _convert_svg(icon: str, svg_color: str, rotation: float) -> tuple[str, str]:
+    """Return the content-addressed file name and the code of the svg converted by the color and rotation.
+
+    Svg files with the same icon, resolved color and rotation are the same file, whatever color id they come from.
+    """
+    # Change color and rotate. See https://stackoverflow.com/a/15139069/13452582
+    new_contents = svg_color if rotation == 0 else f'{svg_color} transform="rotate({rotation:g}, 8, 8)"'
+    svg_code = load_svg_code(icon).replace('fill="currentColor"', new_contents)
+    return f"{icon.replace('.svg', '')}_{hash_key(svg_code)[:16]}.svg", svg_code
+
+
+def _write_svg_file(path: Path, svg_code: str) -> None:
+    try:
+        write_text_atomic(path, svg_code)
+    except OSError:
+        # Another process wrote the same content first, e.g. a file of another user that cannot be replaced.
+        if not path.exists():
+            raise
+
+
+def _write_svg_files(svg_codes: dict[str, str], dir_path: Path, workers: int) -> None:
+    items = iter(svg_codes.items())
+    for file_name, svg_code in items:
+        start = time.perf_counter()
+        _write_svg_file(dir_path / file_name, svg_code)
+        # Parallel writes pay off only when each write waits for the disk, e.g. in network home directories.
+        # On a local disk, the threads cost more than the writes.
+        if workers > 1 and time.perf_counter() - start > _SLOW_WRITE_SECONDS:
+            break
+    rest = list(items)
+    if not rest:
+        return
+    # concurrent.futures is imported only for slow writes, because it takes longer to import than the writes.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(min(workers, len(rest))) as executor:
+        # Consume the results to raise the errors of the writes.
+        for _ in executor.map(lambda item: _write_svg_file(dir_path / item[0], item[1]), rest):
+            pass
+
+
+def output_svg_codes(svg_codes: dict[str, str], dir_path: Path, workers: int = _WRITE_WORKERS) -> int:
+    """Write the svg files that are not in the dir, and return the number of written files.
+
+    File names are content-addressed, so an existing file already has the content and is skipped.
+    The dir is listed once instead of checking each file. The missing files are written atomically, and in parallel
+    with up to ``workers`` threads if the writes turn out to be slow.
+    """
+    dir_path.mkdir(parents=True, exist_ok=True)
+    existing_files = set(os.listdir(dir_path))
+    missing = {name: code for name, code in svg_codes.items() if name not in existing_files}
+    _write_svg_files(missing, dir_path, workers)
+    count_svg_files(len(svg_codes), len(missing))
+    return len(missing)
+
+
+def _to_variables(colors: dict[str, Optional[Color]]) -> dict[str, Optional[Color]]:
+    # Convert id for stylesheet variable
+    return {f"${id}".replace(".", "_"): color for id, color in colors.items()}
+
+
+class StylesheetRenderer:
+    """Render the stylesheet and re-render only the parts that depend on changed colors.
+
+    The rendered chunks are kept, and each $variable and $url{...} slot knows its positions in them.
+    If ``collect_svg`` is True, svg files are not written and are collected in ``svg_codes`` instead.
+    If ``in_memory`` is True, svg files are registered as an in-memory Qt resource instead of being written.
+    """
+
+    def __init__(
+        self,
+        theme_type: str,
+        output_svg_path: Path,
+        is_designer: bool = False,
+        qt_version: Optional[str] = None,
+        collect_svg: bool = False,
+        in_memory: bool = False,
+    ) -> None:
+        self._template = load_template()
+        self._theme_type = theme_type
+        self._qt_version = _get_qt_version() if qt_version is None else qt_version
+        self._output_svg_path = output_svg_path
+        self._is_designer = is_designer
+        self._collect_svg = collect_svg
+        self._in_memory = in_memory
+        self._colors: dict[str, Optional[Color]] = {}
+        self._parts: list[str] = []
+        self.svg_codes: dict[str, str] = {}  # {file name: svg code}
+
+    def _output_urls(self, urls: Iterable[_Url]) -> dict[_Url, str]:
+        file_names, files = {}, {}
+        for url in urls:
+            svg_color = to_svg_color_format(self._colors["$" + url.id])
+            file_name, svg_code = _convert_svg(url.icon, svg_color, _normalize_rotation(url.rotate))
+            file_names[url] = file_name
+            files[file_name] = svg_code
+        if self._in_memory:
+            if register_svg_codes(files):
+                return _parse_url(file_names, self._output_svg_path, RESOURCE_PREFIX)
+            self._in_memory = False
+        if self._collect_svg:
+            self.svg_codes.update(files)
+        else:
+            output_svg_codes(files, self._output_svg_path)
+        return _parse_url(file_names, self._output_svg_path, "vscode" if self._is_designer else None)
+
+    def render(self, colors: dict[str, Optional[Color]]) -> str:
+        """Render the whole stylesheet with all colors."""
+        self._colors = _to_variables(colors)
+        # Resolve $url{...} used in the template patched with $type_patch{...} and $env_patch{...}.
+        with stage("template"):
+            urls = self._template.urls(self._theme_type, self._qt_version)
+        with stage("svg"):
+            url_replacements = self._output_urls(urls)
+
+        with stage("render"):
+            colors_str = {id: ("" if color is None else str(color)) for id, color in self._colors.items()}
+            self._parts = self._template.render_parts(colors_str, url_replacements, self._theme_type, self._qt_version)
+            return "".join(self._parts)
+
+    def update(self, colors: dict[str, Optional[Color]]) -> str:
+        """Re-render the slots and svg files that refer to ``colors``, which contains only the changed colors."""
+        colors = _to_variables(colors)
+        self._colors.update(colors)
+        slots = self._template.slots(self._theme_type, self._qt_version)
+
+        urls = [url for url in self._template.urls(self._theme_type, self._qt_version) if "$" + url.id in colors]
+        for url, replacement in self._output_urls(urls).items():
+            for index in slots[url]:
+                self._parts[index] = replacement
+        for id, color in colors.items():
+            for index in slots.get(_Variable(id), ()):
+                self._parts[index] = "" if color is None else str(color)
+        return "".join(self._parts)
 
 
 def build_stylesheet(
-    colors: dict[str, Optional[Color]], theme_type: str, output_svg_path: Path, is_designer: bool
+    colors: dict[str, Optional[Color]],
+    theme_type: str,
+    output_svg_path: Path,
+    is_designer: bool,
+    qt_version: Optional[str] = None,
+    minify: bool = False,
+    in_memory: bool = False,
 ) -> str:
-    stylesheet_template = resources.read_text("qtvscodestyle.stylesheet", "template.qss")
-    # Convert id for stylesheet variable
-    colors = {f"${id}".replace(".", "_"): color for id, color in colors.items()}
-
-    # Parse $type_patch{...} and $env_patch{...} in template stylesheet.
-    type_patch_replacements = _parse_theme_type_patch(stylesheet_template, theme_type)
-    env_patch_replacements = _parse_env_patch(stylesheet_template)
-
-    # Replace value before parsing $url{...}.
-    patch_replacements = {**type_patch_replacements, **env_patch_replacements}
-    stylesheet_template = multireplace(stylesheet_template, patch_replacements)
-
-    # Parse $url{...} in template stylesheet.
-    url_replacements, urls = _parse_url(stylesheet_template, output_svg_path, is_designer)
-    _output_converted_svg_file(colors, urls)
-
-    # Create stylesheet
-    colors_str = {id: ("" if color is None else str(color)) for id, color in colors.items()}
-    replacements = {**colors_str, **url_replacements}
-    stylesheet = multireplace(stylesheet_template, replacements)
-    return stylesheet
+    with stage("template"):
+        renderer = StylesheetRenderer(theme_type, output_svg_path, is_designer, qt_version, in_memory=in_memory)
+    stylesheet = renderer.render(colors)
+    if not minify:
+        return stylesheet
+    with stage("minify"):
+        return minify_stylesheet(stylesheet)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import re
+
+# Quoted strings and url(...) are kept as it is. Paths can contain spaces.
+_PROTECTED_PATTERN = re.compile(r""""(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|url\([^)]*\)""")
+_COMMENT_PATTERN = re.compile(r"/\*[\s\S]*?\*/")
+_RGBA_PATTERN = re.compile(r"rgba\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)")
+_DECIMAL_PATTERN = re.compile(r"(?<![\w#.-])(\d+)\.(\d*?)0+(?![\w.])")
+_ZERO_LENGTH_PATTERN = re.compile(r"(?<![\w#.-])0px\b")
+
+
+def _strip_decimal(match: re.Match) -> str:
+    integer, fraction = match.groups()
+    return f"{integer}.{fraction}" if fraction else integer
+
+
+def _minify_color(match: re.Match) -> str:
+    # Qt rounds the rgb components to integers. An alpha value less than or equal to 1 is a ratio.
+    r, g, b = (int(float(component) + 0.5) for component in match.groups()[:3])
+    alpha = match.group(4)
+    if float(alpha) == 1:
+        return f"#{r:02x}{g:02x}{b:02x}"
+    return f"rgba({r},{g},{b},{_DECIMAL_PATTERN.sub(_strip_decimal, alpha)})"
+
+
+def _minify_text(text: str) -> str:
+    # Declarations of colors that are not defined have no value. Qt's error recovery for them depends on
+    # the surrounding whitespace, so they are removed.
+    text = re.sub(r"[\w-]+\s*:\s*(?=[;}])", "", text)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r" ?([{};,>]) ?", r"\1", text)
+    # A space before ":" is a descendant combinator in selectors, so only the space after ":" is removed.
+    text = text.replace(": ", ":")
+    text = _RGBA_PATTERN.sub(_minify_color, text)
+    text = _DECIMAL_PATTERN.sub(_strip_decimal, text)
+    text = _ZERO_LENGTH_PATTERN.sub("0", text)
+    # Remove empty declarations, which are left by patches that are not applied.
+    text = re.sub(r";{2,}", ";", text)
+    return text.replace("{;", "{").replace(";}", "}")
+
+
+def minify_stylesheet(stylesheet: str) -> str:
+    """Remove comments and redundant whitespace, and shorten numbers and colors."""
+    stylesheet = _COMMENT_PATTERN.sub("", stylesheet)
+    texts, position = [], 0
+    for match in _PROTECTED_PATTERN.finditer(stylesheet):
+        texts.append(_minify_text(stylesheet[position : match.start()]))
+        texts.append(match.group())
+        position = match.end()
+    texts.append(_minify_text(stylesheet[position:]))
+    # Empty declarations can be split by protected text. e.g. "{ ;url(...)"
+    return re.sub(r";{2,}", ";", "".join(texts)).replace("{;", "{").replace(";}", "}").strip()
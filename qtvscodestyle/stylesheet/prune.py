@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from qtvscodestyle.util import create_logger
+
+_logger = create_logger(__name__)
+
+# The tooltip widget is an internal class(QTipLabel), but it is matched by the QToolTip selector.
+_ALWAYS_PRESENT_CLASSES = {"QToolTip"}
+
+
+@dataclass(frozen=True)
+class PruneStats:
+    rules_total: int
+    rules_dropped: int
+    bytes_dropped: int
+
+
+def _split_segments(stylesheet: str) -> list[tuple[Optional[str], str]]:
+    """Split the stylesheet into rules and the text between them.
+
+    Returns the list of (selector, text). The selector of text that is not a rule (comments and spaces) is None.
+    """
+    segments: list[tuple[Optional[str], str]] = []
+    position, length = 0, len(stylesheet)
+    while position < length:
+        if stylesheet.startswith("/*", position):
+            end = stylesheet.find("*/", position + 2)
+            end = length if end == -1 else end + 2
+            segments.append((None, stylesheet[position:end]))
+        elif stylesheet[position].isspace():
+            end = position
+            while end < length and stylesheet[end].isspace():
+                end += 1
+            segments.append((None, stylesheet[position:end]))
+        else:
+            block_start = stylesheet.find("{", position)
+            if block_start == -1:
+                segments.append((None, stylesheet[position:]))
+                break
+            # Skip comments in the block, which may contain braces.
+            end = block_start + 1
+            while end < length and stylesheet[end] != "}":
+                if stylesheet.startswith("/*", end):
+                    comment_end = stylesheet.find("*/", end + 2)
+                    end = length if comment_end == -1 else comment_end + 2
+                else:
+                    end += 1
+            end = min(end + 1, length)
+            selector = re.sub(r"/\*[\s\S]*?\*/", "", stylesheet[position:block_start])
+            segments.append((selector, stylesheet[position:end]))
+        position = end
+    return segments
+
+
+def _can_match(selector: str, class_names: set[str]) -> bool:
+    # Attribute values can contain spaces and ">", so they are removed before splitting into compound selectors.
+    selector = re.sub(r"\[[^\]]*\]", "", selector)
+    for compound in re.split(r"\s*>\s*|\s+", selector.strip()):
+        # ".QWidget" matches only the class itself, "QWidget" also matches subclasses. Both need the class.
+        match = re.match(r"\.?([A-Za-z_][\w-]*)", compound)
+        if match is not None and match.group(1) not in class_names:
+            return False
+    return True
+
+
+def prune_stylesheet(stylesheet: str, class_names: Iterable[str]) -> tuple[str, PruneStats]:
+    """Remove the rules whose selectors cannot match any of the classes.
+
+    Type selectors match subclasses, so ``class_names`` has to contain the base classes of the widgets as well.
+    Comments and the text between rules are kept.
+    """
+    class_names = set(class_names) | _ALWAYS_PRESENT_CLASSES
+    texts = []
+    rules_total = rules_dropped = bytes_dropped = 0
+    for selector, text in _split_segments(stylesheet):
+        if selector is not None:
+            rules_total += 1
+            # Commas can only appear in the selector list because attribute values are not used with commas.
+            if not any(_can_match(s, class_names) for s in selector.split(",")):
+                rules_dropped += 1
+                bytes_dropped += len(text.encode("utf-8"))
+                continue
+        texts.append(text)
+    return "".join(texts), PruneStats(rules_total, rules_dropped, bytes_dropped)
+
+
+def _add_super_classes(meta_object, class_names: set[str]) -> None:
+    while meta_object is not None:
+        class_names.add(meta_object.className())
+        meta_object = meta_object.superClass()
+
+
+def expand_class_names(class_names: Iterable[str]) -> set[str]:
+    """Add the base classes of the Qt widget classes. Names unknown to QtWidgets are kept as it is."""
+    from qtvscodestyle.qtpy.qt_compat import QtImportError
+
+    expanded = set(class_names)
+    try:
+        from qtvscodestyle.qtpy import QtWidgets
+    except QtImportError:
+        return expanded
+    for class_name in list(expanded):
+        widget_class = getattr(QtWidgets, class_name, None)
+        if widget_class is not None and hasattr(widget_class, "staticMetaObject"):
+            _add_super_classes(widget_class.staticMetaObject, expanded)
+    return expanded
+
+
+def get_application_class_names() -> Optional[set[str]]:
+    """Return the classes of all widgets in the QApplication and their base classes.
+
+    Return None if the QApplication is not available.
+    """
+    from qtvscodestyle.qtpy.qt_compat import QtImportError
+
+    try:
+        from qtvscodestyle.qtpy.QtWidgets import QApplication
+    except QtImportError:
+        _logger.warning("Failed to import QApplication. The stylesheet is not pruned.")
+        return None
+    app = QApplication.instance()
+    if app is None:
+        _logger.warning(
+            "No QApplication instance found. The stylesheet is not pruned."
+            "\n\tYou have to call load_stylesheet function after instantiation of QApplication to prune it."
+        )
+        return None
+
+    class_names: set[str] = set()
+    for widget in app.allWidgets():
+        _add_super_classes(widget.metaObject(), class_names)
+    return class_names
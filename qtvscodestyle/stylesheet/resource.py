@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import struct
+import threading
+
+from qtvscodestyle.report import count_svg_files
+from qtvscodestyle.util import create_logger
+
+_logger = create_logger(__name__)
+
+# Svg files registered in memory are referred by ":/qtvscodestyle/<file name>".
+RESOURCE_PREFIX = "qtvscodestyle"
+
+# See rcc.cpp and qresource.cpp in Qt. Format version 1 is readable by Qt5 and Qt6.
+_FORMAT_VERSION = 1
+_HEADER_SIZE = 20
+_DIRECTORY_FLAG = 0x02
+_LANGUAGE_C = 1
+_ANY_TERRITORY = 0
+
+# Qt does not copy the registered data. It must be alive while the stylesheet is used.
+_registered_data: list[bytes] = []
+_registered_file_names: set[str] = set()
+_lock = threading.Lock()
+
+
+def _qt_hash(name: str) -> int:
+    # Same as qt_hash() of Qt. Children of a directory are looked up by binary search on this hash.
+    h = 0
+    for (unit,) in struct.iter_unpack(">H", name.encode("utf-16-be")):
+        h = (h << 4) + unit
+        h ^= (h & 0xF0000000) >> 23
+        h &= 0x0FFFFFFF
+    return h
+
+
+def build_resource_data(files: dict[str, bytes], prefix: str = RESOURCE_PREFIX) -> bytes:
+    """Return the binary Qt resource that contains the files under ":/<prefix>/"."""
+    names, data = bytearray(), bytearray()
+
+    def add_name(name: str) -> int:
+        offset = len(names)
+        encoded = name.encode("utf-16-be")
+        names.extend(struct.pack(">HI", len(encoded) // 2, _qt_hash(name)) + encoded)
+        return offset
+
+    # The tree is the list of nodes: the root, the prefix directory and the files sorted by hash.
+    file_names = sorted(files, key=_qt_hash)
+    tree = struct.pack(">IHII", 0, _DIRECTORY_FLAG, 1, 1)
+    tree += struct.pack(">IHII", add_name(prefix), _DIRECTORY_FLAG, len(file_names), 2)
+    for file_name in file_names:
+        tree += struct.pack(">IHHHI", add_name(file_name), 0, _ANY_TERRITORY, _LANGUAGE_C, len(data))
+        data.extend(struct.pack(">I", len(files[file_name])) + files[file_name])
+
+    data_offset = _HEADER_SIZE
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = b"qres" + struct.pack(">IIII", _FORMAT_VERSION, tree_offset, data_offset, names_offset)
+    return header + bytes(data) + bytes(names) + tree
+
+
+def register_svg_codes(svg_codes: dict[str, str]) -> bool:
+    """Register the svg files as an in-memory Qt resource. Files already registered are skipped.
+
+    Return False if the Qt resource system is not available.
+    """
+    from qtvscodestyle.qtpy.qt_compat import QtImportError
+
+    try:
+        from qtvscodestyle.qtpy.QtCore import QResource
+    except QtImportError:
+        _logger.warning("Failed to import QResource. The svg files are written to the disk instead.")
+        return False
+
+    with _lock:
+        files = {name: code.encode("utf-8") for name, code in svg_codes.items() if name not in _registered_file_names}
+        if not files:
+            count_svg_files(len(svg_codes), 0)
+            return True
+        data = build_resource_data(files)
+        if not QResource.registerResourceData(data):
+            _logger.warning("Failed to register the svg files as a Qt resource.")
+            return False
+        _registered_data.append(data)
+        _registered_file_names.update(files)
+    count_svg_files(len(svg_codes), len(files))
+    return True
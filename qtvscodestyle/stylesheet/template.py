@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import resources
+from typing import Union
+
+from qtvscodestyle.util import parse_version
+
+# greater_equal and less_equal must be evaluated before greater and less.
+_OPERATORS = {
+    "==": operator.eq,  # equal
+    "!=": operator.ne,  # unequal
+    ">=": operator.ge,  # greater_equal
+    "<=": operator.le,  # less_equal
+    ">": operator.gt,  # greater
+    "<": operator.lt,  # less
+}
+
+# The semicolon following $type_patch{...} is not part of the patch and is left in the stylesheet.
+_TOKEN_PATTERN = re.compile(
+    r"(?P<type_patch>\$type_patch\{[\s\S]*?\}(?=;))"
+    r"|(?P<env_patch>\$env_patch\{[\s\S]*?\})"
+    r"|(?P<url>\$url\{.+\})"
+    r"|(?P<variable>\$[A-Za-z_]\w*)"
+)
+
+
+# A class that handle the properties of the $url{...} variable in the stylesheet template.
+@dataclass(unsafe_hash=True, frozen=True)
+class _Url:
+    icon: str
+    id: str
+    rotate: str
+
+
+# A class that handle the $variable in the stylesheet template. The name includes "$".
+@dataclass(unsafe_hash=True, frozen=True)
+class _Variable:
+    name: str
+
+
+@dataclass(frozen=True)
+class _TypePatch:
+    types: frozenset[str]
+    body: tuple[_Node, ...]
+
+    def is_enabled(self, theme_type: str) -> bool:
+        return theme_type in self.types
+
+
+@dataclass(frozen=True, eq=False)
+class _EnvPatch:
+    qualifier: str
+    version: tuple[int, int, int]
+    body: tuple[_Node, ...]
+
+    def is_enabled(self, qt_version: tuple[int, int, int]) -> bool:
+        return _OPERATORS[self.qualifier](qt_version, self.version)
+
+
+_Node = Union[str, _Variable, _Url, _TypePatch, _EnvPatch]
+
+
+def _compile_type_patch(text: str) -> _TypePatch:
+    property: dict = json.loads(text.replace("$type_patch", "", 1))
+    theme_types = property["types"].replace(" ", "").split("|")
+    value = property["value"]
+    qss_text = "\n".join(value if type(value) is list else [value])
+    return _TypePatch(frozenset(theme_types), _compile_nodes(qss_text))
+
+
+def _compile_env_patch(text: str) -> _EnvPatch:
+    property: dict[str, str] = json.loads(text.replace("$env_patch", "", 1))
+    for qualifier in _OPERATORS.keys():
+        if qualifier in property["version"]:
+            version = property["version"].replace(qualifier, "")
+            break
+    else:
+        raise SyntaxError(f"invalid character in qualifier. Available qualifiers {list(_OPERATORS.keys())}")
+    return _EnvPatch(qualifier, parse_version(version), _compile_nodes(property["value"]))
+
+
+def _compile_url(text: str) -> _Url:
+    icon, id, rotate = json.loads(text.replace("$url", "", 1)).values()
+    return _Url(icon, id, rotate)
+
+
+def _compile_nodes(text: str) -> tuple[_Node, ...]:
+    nodes: list[_Node] = []
+    position = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        if match.start() > position:
+            nodes.append(text[position : match.start()])
+        kind, token = match.lastgroup, match.group()
+        if kind == "type_patch":
+            nodes.append(_compile_type_patch(token))
+        elif kind == "env_patch":
+            nodes.append(_compile_env_patch(token))
+        elif kind == "url":
+            nodes.append(_compile_url(token))
+        else:
+            nodes.append(_Variable(token))
+        position = match.end()
+    if position < len(text):
+        nodes.append(text[position:])
+    return tuple(nodes)
+
+
+def _find_env_patches(nodes: tuple[_Node, ...]) -> list[_EnvPatch]:
+    env_patches = []
+    for node in nodes:
+        if type(node) is _EnvPatch:
+            env_patches.append(node)
+        if type(node) is _EnvPatch or type(node) is _TypePatch:
+            env_patches += _find_env_patches(node.body)
+    return env_patches
+
+
+# The template patched for a theme type and Qt version.
+@dataclass(frozen=True)
+class _Specialization:
+    nodes: tuple[Union[str, _Variable, _Url], ...]
+    urls: frozenset[_Url]
+    slots: dict[Union[_Variable, _Url], tuple[int, ...]]  # {slot: indices in nodes}
+
+
+def _select(
+    nodes: tuple[_Node, ...], theme_type: str, qt_version: tuple[int, int, int]
+) -> list[Union[str, _Variable, _Url]]:
+    selected = []
+    for node in nodes:
+        if type(node) is _TypePatch:
+            if node.is_enabled(theme_type):
+                selected += _select(node.body, theme_type, qt_version)
+        elif type(node) is _EnvPatch:
+            if node.is_enabled(qt_version):
+                selected += _select(node.body, theme_type, qt_version)
+        else:
+            selected.append(node)
+    return selected
+
+
+def env_signature(conditions: list[tuple[str, str]], qt_version: str) -> str:
+    """Return the results of the $env_patch{...} conditions, (qualifier, version), for the Qt version, e.g. "01".
+
+    Qt versions with the same signature produce the same stylesheet.
+    """
+    version = parse_version(qt_version)
+    return "".join(str(int(_OPERATORS[qualifier](version, parse_version(v)))) for qualifier, v in conditions)
+
+
+class CompiledTemplate:
+    """Stylesheet template parsed into literal chunks and typed placeholder slots.
+
+    Slots are $variable, $url{...}, $type_patch{...} and $env_patch{...}.
+    The body of a patch is compiled as well, so rendering never has to scan text.
+    Patches depend only on the theme type and Qt version, so they are resolved once per combination.
+    """
+
+    def __init__(self, text: str) -> None:
+        self._nodes = _compile_nodes(text)
+        self._env_patches = _find_env_patches(self._nodes)
+        self._specializations: dict[tuple[str, str], _Specialization] = {}
+        self.digest = _digest(text)
+
+    def _specialize(self, theme_type: str, qt_version: str) -> _Specialization:
+        specialization = self._specializations.get((theme_type, qt_version))
+        if specialization is None:
+            # Adjacent literal chunks are merged so that rendering joins as few strings as possible.
+            nodes: list[Union[str, _Variable, _Url]] = []
+            for node in _select(self._nodes, theme_type, parse_version(qt_version)):
+                if type(node) is str and nodes and type(nodes[-1]) is str:
+                    nodes[-1] += node
+                else:
+                    nodes.append(node)
+            slots: dict[Union[_Variable, _Url], list[int]] = {}
+            for index, node in enumerate(nodes):
+                if type(node) is not str:
+                    slots.setdefault(node, []).append(index)
+            specialization = _Specialization(
+                tuple(nodes),
+                frozenset(node for node in nodes if type(node) is _Url),
+                {slot: tuple(indices) for slot, indices in slots.items()},
+            )
+            self._specializations[(theme_type, qt_version)] = specialization
+        return specialization
+
+    def env_conditions(self) -> list[tuple[str, str]]:
+        """Return the (qualifier, version) of all $env_patch{...} in order of appearance."""
+        return [(patch.qualifier, ".".join(map(str, patch.version))) for patch in self._env_patches]
+
+    def env_signature(self, qt_version: str) -> str:
+        return env_signature(self.env_conditions(), qt_version)
+
+    def env_versions(self) -> list[str]:
+        """Return the Qt versions that cover every signature of $env_patch{...}."""
+        versions = {"5.0", "10.0"}
+        for patch in self._env_patches:
+            major, minor, micro = patch.version
+            versions.add(f"{major}.{minor}.{micro}")
+            if micro > 0:
+                versions.add(f"{major}.{minor}.{micro - 1}")
+            elif minor > 0:
+                versions.add(f"{major}.{minor - 1}.99")
+            elif major > 0:
+                versions.add(f"{major - 1}.99.99")
+        return sorted(versions, key=parse_version)
+
+    def urls(self, theme_type: str, qt_version: str) -> frozenset[_Url]:
+        """Return the $url{...} used by the stylesheet for the theme type and Qt version."""
+        return self._specialize(theme_type, qt_version).urls
+
+    def slots(self, theme_type: str, qt_version: str) -> dict[Union[_Variable, _Url], tuple[int, ...]]:
+        """Return the indices of each $variable and $url{...} slot in the parts returned by render_parts()."""
+        return self._specialize(theme_type, qt_version).slots
+
+    def render_parts(
+        self, variables: dict[str, str], urls: dict[_Url, str], theme_type: str, qt_version: str
+    ) -> list[str]:
+        """Return the chunks of the stylesheet. Joining them gives the stylesheet.
+
+        Variables not included in ``variables`` are left as it is.
+        """
+        parts = []
+        for node in self._specialize(theme_type, qt_version).nodes:
+            if type(node) is str:
+                parts.append(node)
+            elif type(node) is _Variable:
+                parts.append(variables.get(node.name, node.name))
+            else:
+                parts.append(urls[node])
+        return parts
+
+    def render(self, variables: dict[str, str], urls: dict[_Url, str], theme_type: str, qt_version: str) -> str:
+        """Join the template with the values of variables and urls."""
+        return "".join(self.render_parts(variables, urls, theme_type, qt_version))
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@lru_cache()
+def _read_template() -> str:
+    return resources.read_text("qtvscodestyle.stylesheet", "template.qss")
+
+
+@lru_cache()
+def template_digest() -> str:
+    """Return the digest of template.qss without compiling it."""
+    return _digest(_read_template())
+
+
+@lru_cache()
+def load_template() -> CompiledTemplate:
+    """Compile template.qss. The compiled template is cached for the process."""
+    return CompiledTemplate(_read_template())
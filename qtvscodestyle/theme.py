@@ -0,0 +1,22 @@
+from enum import Enum
+
+
+# In VSCode's default theme file, theme type is not set. Extension themes is no need.
+# So the default theme type is defined here.
+class Theme(Enum):
+    LIGHT_VS = {"name": "Light (Visual Studio)", "file_name": "light_vs.json", "type": "light"}
+    QUIET_LIGHT = {"name": "Quiet Light", "file_name": "quietlight-color-theme.json", "type": "light"}
+    SOLARIZED_LIGHT = {"name": "Solarized Light", "file_name": "solarized-light-color-theme.json", "type": "light"}
+    ABYSS = {"name": "Abyss", "file_name": "abyss_color_theme.json", "type": "dark"}
+    DARK_VS = {"name": "Dark (Visual Studio)", "file_name": "dark_vs.json", "type": "dark"}
+    KIMBIE_DARK = {"name": "Kimbie Dark", "file_name": "kimbie-dark-color-theme.json", "type": "dark"}
+    MONOKAI = {"name": "Monokai", "file_name": "monokai-color-theme.json", "type": "dark"}
+    MONOKAI_DIMMED = {"name": "Monokai Dimmed", "file_name": "dimmed-monokai-color-theme.json", "type": "dark"}
+    RED = {"name": "Red", "file_name": "Red-color-theme.json", "type": "dark"}
+    SOLARIZED_DARK = {"name": "Solarized Dark", "file_name": "solarized_dark_color_theme.json", "type": "dark"}
+    TOMORROW_NIGHT_BLUE = {
+        "name": "Tomorrow Night Blue",
+        "file_name": "tomorrow-night-blue-color-theme.json",
+        "type": "dark",
+    }
+    DARK_HIGH_CONTRAST = {"name": "Dark High Contrast", "file_name": "hc_black.json", "type": "hc"}
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+from qtvscodestyle.base import Theme, load_stylesheet
+from qtvscodestyle.palette import apply_palette, load_palette, load_palette_stylesheet
+from qtvscodestyle.qtpy.QtCore import QObject, QTimer, Signal, Slot
+from qtvscodestyle.qtpy.QtGui import QPalette
+from qtvscodestyle.qtpy.QtWidgets import QApplication
+from qtvscodestyle.util import create_logger
+
+_logger = create_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ThemeApplyStats:
+    theme: Union[Theme, str, Path, dict]
+    load_time: float  # Seconds to load the stylesheet.
+    apply_time: float  # Seconds to set the stylesheet and repolish the widgets.
+    skipped: bool  # True if the stylesheet was identical to the current one and was not set.
+
+
+class ThemeManager(QObject):
+    """Own the theme of the application and apply its changes with as few repolishes as possible.
+
+    Changes made by ``set_theme`` and ``set_custom_colors`` are applied together when the event loop runs, so
+    changing the theme and colors at once repolishes the widgets only once. Call ``apply`` to apply them immediately.
+    While the stylesheet is set, updates of the visible top-level widgets are suspended, so each of them is painted
+    once after all widgets are repolished. If the stylesheet is identical to the current one, it is not set again.
+
+    If ``palette`` is True, the theme is applied in the palette mode with ``load_palette`` and ``apply_palette``
+    instead of the full stylesheet.
+
+    ``applied`` is emitted with the ThemeApplyStats after each change is applied.
+    The other arguments are passed to ``load_stylesheet``.
+    """
+
+    applied = Signal(object)
+
+    def __init__(
+        self,
+        theme: Union[Theme, str, Path, dict] = Theme.DARK_VS,
+        custom_colors: dict[str, str] = {},
+        minify: bool = False,
+        in_memory: bool = False,
+        palette: bool = False,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._theme = theme
+        self._custom_colors = dict(custom_colors)
+        self._minify = minify
+        self._in_memory = in_memory
+        self._use_palette = palette
+        self._stylesheet: Optional[str] = None
+        self._palette: Optional[QPalette] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.apply)
+
+    @property
+    def theme(self) -> Union[Theme, str, Path, dict]:
+        return self._theme
+
+    @property
+    def custom_colors(self) -> dict[str, str]:
+        return dict(self._custom_colors)
+
+    @property
+    def stylesheet(self) -> Optional[str]:
+        """The stylesheet last applied, or None if no theme has been applied yet."""
+        return self._stylesheet
+
+    def set_theme(self, theme: Union[Theme, str, Path, dict], custom_colors: Optional[dict[str, str]] = None) -> None:
+        """Change the theme, and the custom colors unless they are None."""
+        self._theme = theme
+        if custom_colors is not None:
+            self._custom_colors = dict(custom_colors)
+        self._timer.start()
+
+    def set_custom_colors(self, custom_colors: dict[str, str]) -> None:
+        self._custom_colors = dict(custom_colors)
+        self._timer.start()
+
+    @Slot()
+    def apply(self) -> None:
+        """Apply the current theme now."""
+        self._timer.stop()
+        app = QApplication.instance()
+        if app is None:
+            _logger.warning("No QApplication instance found. The theme is not applied.")
+            return
+        start = time.perf_counter()
+        if self._use_palette:
+            palette, stylesheet = load_palette(self._theme, self._custom_colors), load_palette_stylesheet()
+        else:
+            palette = None
+            stylesheet = load_stylesheet(
+                self._theme, self._custom_colors, minify=self._minify, in_memory=self._in_memory
+            )
+        loaded = time.perf_counter()
+        skipped = stylesheet == self._stylesheet and stylesheet == app.styleSheet() and palette == self._palette
+        if not skipped:
+            self._set_stylesheet(app, stylesheet, palette)
+        self._stylesheet, self._palette = stylesheet, palette
+        stats = ThemeApplyStats(self._theme, loaded - start, time.perf_counter() - loaded, skipped)
+        self.applied.emit(stats)
+
+    @staticmethod
+    def _set_stylesheet(app: QApplication, stylesheet: str, palette: Optional[QPalette]) -> None:
+        suspended = [widget for widget in app.topLevelWidgets() if widget.isVisible() and widget.updatesEnabled()]
+        for widget in suspended:
+            widget.setUpdatesEnabled(False)
+        try:
+            if palette is None:
+                app.setStyleSheet(stylesheet)
+            else:
+                apply_palette(palette)
+        finally:
+            # Enabling updates repaints the whole window once.
+            for widget in suspended:
+                widget.setUpdatesEnabled(True)
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import re
-from typing import Optional
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import Iterator, Optional, Union
 
 from qtvscodestyle.vscode.color import Color
 
@@ -15,6 +24,124 @@ def multireplace(target: str, replacements: dict[str, str]) -> str:
     return pattern.sub(lambda match: replacements[match.group()], target)
 
 
+@lru_cache()
+def parse_version(version: str) -> tuple[int, int, int]:
+    """Return (major, minor, micro) of the version to compare versions. Missing numbers are 0."""
+    match = re.match(r"(\d+)(?:\.(\d+))?(?:\.(\d+))?", version.strip())
+    if match is None:
+        raise ValueError(f"invalid version number '{version}'")
+    major, minor, micro = (int(number or 0) for number in match.groups())
+    return major, minor, micro
+
+
+def hash_key(*parts: Union[str, bytes]) -> str:
+    """Return the hex digest of the parts. Each part is length-prefixed so that boundaries cannot collide."""
+    sha = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if type(part) is str else part
+        sha.update(len(data).to_bytes(8, "little"))
+        sha.update(data)
+    return sha.hexdigest()[:32]
+
+
+# Write to a temporary file and rename it so that readers never see a partially written file.
+def write_text_atomic(path: Path, text: str) -> None:
+    # mkstemp() creates a new file with a random name and O_EXCL, so a file or symlink planted by another user in a
+    # shared dir is never written through.
+    fd, temp_name = tempfile.mkstemp(prefix=f"{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(temp_name, 0o644)  # mkstemp() creates the file readable only by the owner.
+        os.replace(temp_name, path)
+    except OSError:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _lock_fd(path: Path) -> int:
+    try:
+        return os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+    except PermissionError:  # Created by another user. flock() does not need write access.
+        return os.open(path, os.O_RDONLY)
+
+
+def _is_same_file(fd: int, path: Path) -> bool:
+    try:
+        return os.path.samestat(os.fstat(fd), os.stat(path))
+    except FileNotFoundError:
+        return False
+
+
+@contextmanager
+def file_lock(path: Path, remove: bool = False) -> Iterator[None]:
+    """Hold an exclusive lock on the file across processes. The file is created if it does not exist.
+
+    The lock is released by the OS when the process dies, so a crashed process never leaves it held.
+    If ``remove`` is True, the file is removed when the lock is released. Processes waiting for the lock of the
+    removed file lock the new file instead. Windows cannot remove an open file, so the file is kept there.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if sys.platform == "win32":
+        import msvcrt
+
+        fd = _lock_fd(path)
+        try:
+            # LK_LOCK gives up after 10 seconds, so a non-blocking lock is retried instead.
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)  # type: ignore
+                    break
+                except OSError:
+                    time.sleep(0.05)
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)  # type: ignore
+        finally:
+            os.close(fd)
+        return
+
+    import fcntl
+
+    while True:
+        fd = _lock_fd(path)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        # The holder before may have removed the file while this process was waiting.
+        if _is_same_file(fd, path):
+            break
+        os.close(fd)
+    try:
+        yield
+    finally:
+        if remove:
+            try:
+                path.unlink()  # Before the release, so that the next holder sees it removed.
+            except OSError:  # A file of another user in a shared dir.
+                pass
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+# Stylesheet's own icons are searched before vscode icons.
+_SVG_PACKAGES = ("qtvscodestyle.stylesheet.icons", "qtvscodestyle.vscode.icons")
+
+
+# Process-wide index of svg sources. Only the icons actually used are read, once per process.
+@lru_cache(maxsize=None)
+def load_svg_code(icon: str) -> str:
+    for package in _SVG_PACKAGES:
+        try:
+            return resources.read_text(package, icon)
+        except FileNotFoundError:
+            continue
+    raise FileNotFoundError(f"Svg file '{icon}' is not found in {list(_SVG_PACKAGES)}.")
+
+
 # QSvg does not support rgba(...). Therefore, we need to set the alpha value to `fill-opacity` instead.
 def to_svg_color_format(color: Optional[Color]) -> str:
     if color is None:
@@ -19,7 +19,10 @@ from __future__ import annotations
 import colorsys
 import math
 from functools import lru_cache
-from typing import Union
+
+TYPE_CHECKING = False  # Not imported from typing. See qtvscodestyle/__init__.py.
+if TYPE_CHECKING:
+    from typing import Union
 
 
 class RGBA:
@@ -16,7 +16,7 @@
 from __future__ import annotations
 
 from enum import Enum, auto
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 from qtvscodestyle.vscode.color import RGBA, Color
 
@@ -39,6 +39,8 @@ class _ColorTransformType(Enum):
 
 class ColorRegistry:
     _default_colors: dict[str, dict[str, _ColorValue]] = {"dark": {}, "light": {}, "hc": {}}
+    # {theme: ids in topological order}, compiled from the default colors on first use.
+    _default_orders: dict[str, list[str]] = {}
 
     def __init__(self) -> None:
         self._colors = {
@@ -46,26 +48,61 @@ class ColorRegistry:
             "light": ColorRegistry._default_colors["light"].copy(),
             "hc": ColorRegistry._default_colors["hc"].copy(),
         }
+        # register_color replaces colors only with color codes, which only remove dependencies. So the orders of the
+        # default colors stay valid and are shared.
+        self._orders = ColorRegistry._default_orders
 
     @classmethod
     def _register_default_color(cls, id: str, defaults: Union[dict[str, _ColorValue], None]) -> _ColorIdentifier:
         cls._default_colors["dark"][id] = None if defaults is None else defaults["dark"]
         cls._default_colors["light"][id] = None if defaults is None else defaults["light"]
         cls._default_colors["hc"][id] = None if defaults is None else defaults["hc"]
+        cls._default_orders.clear()
         return _ColorIdentifier(id)
 
     def register_color(self, id: str, color: str, theme: str) -> None:
         if self._colors[theme].get(id):
             self._colors[theme][id] = color
 
-    def get_colors(self, theme: str) -> dict[str, Optional[Color]]:
-        colors_resolved = {}
+    def get_colors(self, theme: str, ids: Optional[Iterable[str]] = None) -> dict[str, Optional[Color]]:
+        """Resolve the colors. If ``ids`` is given, only the registered ids of them are resolved.
+
+        The colors are resolved in topological order, so each of them is computed once.
+        """
+        colors = self._colors[theme]
+        if theme not in self._orders:
+            self._orders[theme] = _sort_topologically(colors, theme)
+        order = self._orders[theme]
+        if ids is not None:
+            ids = [id for id in ids if id in colors]
+            required = _get_required_ids(colors, ids)
+            order = [id for id in order if id in required]
+
+        resolved: dict[str, Optional[Color]] = {}
+        for id in order:
+            resolved[id] = self._resolve_color_value(colors[id], theme, resolved)
+        return {id: resolved[id] for id in (colors if ids is None else ids)}
+
+    def get_dependents(self, ids: Iterable[str], theme: str) -> set[str]:
+        """Return the ids and all ids that refer to them, directly or through color transforms."""
+        dependents: dict[str, set[str]] = {}
         for id, color_value in self._colors[theme].items():
-            color_value_resolved = self._resolve_color_value(color_value, theme)
-            colors_resolved[id] = color_value_resolved
-        return colors_resolved
-
-    def _resolve_color_value(self, color_value: _ColorValue, theme: str) -> Union[Color, None]:
+            for dependency in _get_dependencies(color_value):
+                dependents.setdefault(dependency, set()).add(id)
+
+        result = set()
+        stack = list(ids)
+        while stack:
+            id = stack.pop()
+            if id in result:
+                continue
+            result.add(id)
+            stack += dependents.get(id, ())
+        return result
+
+    def _resolve_color_value(
+        self, color_value: _ColorValue, theme: str, resolved: dict[str, Optional[Color]]
+    ) -> Union[Color, None]:
         if color_value is None:
             return None
         elif type(color_value) is str:
@@ -75,41 +112,44 @@ class ColorRegistry:
         elif type(color_value) is Color:
             return color_value
         elif type(color_value) is _ColorIdentifier:
-            return self._resolve_color_value(self._colors[theme][color_value], theme)
+            return resolved[color_value]
         elif type(color_value) is dict:
-            return self._execute_transform(color_value, theme)
+            return self._execute_transform(color_value, theme, resolved)
 
     def _is_defines(self, color_id: _ColorIdentifier, theme: str) -> bool:
         return ColorRegistry._default_colors[theme][color_id] != self._colors[theme][color_id]
 
-    def _execute_transform(self, transform: dict, theme: str) -> Union[Color, None]:  # noqa: C901
+    def _execute_transform(  # noqa: C901
+        self, transform: dict, theme: str, resolved: dict[str, Optional[Color]]
+    ) -> Union[Color, None]:
         if transform["op"] is _ColorTransformType.Darken:
-            color_value = self._resolve_color_value(transform["value"], theme)
+            color_value = self._resolve_color_value(transform["value"], theme, resolved)
             if type(color_value) is Color:
                 return color_value.darken(transform["factor"])
         elif transform["op"] is _ColorTransformType.Lighten:
-            color_value = self._resolve_color_value(transform["value"], theme)
+            color_value = self._resolve_color_value(transform["value"], theme, resolved)
             if type(color_value) is Color:
                 return color_value.lighten(transform["factor"])
         elif transform["op"] is _ColorTransformType.Transparent:
-            color_value = self._resolve_color_value(transform["value"], theme)
+            color_value = self._resolve_color_value(transform["value"], theme, resolved)
             if type(color_value) is Color:
                 return color_value.transparent(transform["factor"])
         elif transform["op"] is _ColorTransformType.OneOf:
             for candidate in transform["values"]:
-                color = self._resolve_color_value(candidate, theme)
+                color = self._resolve_color_value(candidate, theme, resolved)
                 if color:
                     return color
         elif transform["op"] is _ColorTransformType.IfDefinedThenElse:
             return self._resolve_color_value(
                 transform["then"] if self._is_defines(transform["if_"], theme) else transform["else_"],
                 theme,
+                resolved,
             )
         elif transform["op"] is _ColorTransformType.LessProminent:
-            from_ = self._resolve_color_value(transform["value"], theme)
+            from_ = self._resolve_color_value(transform["value"], theme, resolved)
             if not from_:
                 return None
-            background_color = self._resolve_color_value(transform["background"], theme)
+            background_color = self._resolve_color_value(transform["background"], theme, resolved)
             if not background_color:
                 return from_.transparent(transform["factor"] * transform["transparency"])
             if from_.is_darker_than(background_color):
@@ -120,6 +160,58 @@ class ColorRegistry:
         return None
 
 
+def _get_dependencies(color_value: _ColorValue) -> set[_ColorIdentifier]:
+    if type(color_value) is _ColorIdentifier:
+        return {color_value}
+    if type(color_value) is not dict:
+        return set()
+    dependencies = set()
+    # "if_" of if_defined_then_else is also a dependency because the result depends on whether it is defined.
+    for key in ("value", "background", "if_", "then", "else_"):
+        if key in color_value:
+            dependencies |= _get_dependencies(color_value[key])
+    for candidate in color_value.get("values", []):
+        dependencies |= _get_dependencies(candidate)
+    return dependencies
+
+
+def _sort_topologically(colors: dict[str, _ColorValue], theme: str) -> list[str]:
+    """Return the ids, each of them after its dependencies. Raise ValueError if the colors refer to each other."""
+    order: list[str] = []
+    visited: set[str] = set()
+    path: list[str] = []
+
+    def visit(id: str) -> None:
+        if id in visited:
+            return
+        if id in path:
+            cycle = " -> ".join(path[path.index(id) :] + [id])
+            raise ValueError(f"Circular reference in the colors of {theme!r} theme: {cycle}")
+        path.append(id)
+        for dependency in sorted(_get_dependencies(colors[id])):
+            visit(dependency)
+        path.pop()
+        visited.add(id)
+        order.append(id)
+
+    for id in colors:
+        visit(id)
+    return order
+
+
+def _get_required_ids(colors: dict[str, _ColorValue], ids: Iterable[str]) -> set[str]:
+    """Return the ids and all ids that they refer to."""
+    required = set()
+    stack = list(ids)
+    while stack:
+        id = stack.pop()
+        if id in required:
+            continue
+        required.add(id)
+        stack += _get_dependencies(colors[id])
+    return required
+
+
 register_color = ColorRegistry._register_default_color
 
 